@@ -0,0 +1,480 @@
+"""
+🎬 CINÉMA - API HTTP DE RÉSERVATION
+
+Serveur HTTP/1.1 + JSON, basé sur asyncio et la seule bibliothèque standard,
+qui expose `CinemaService` aux bornes et aux interfaces web.
+
+Usage :
+    python api_cinema.py [--hote 127.0.0.1] [--port 8080] [--base cinema.db | --journal donnees/]
+
+Routes :
+    GET    /seances?date=AAAA-MM-JJ&film=Titre   Liste des séances (filtres optionnels)
+    GET    /seances/<id>                          Détail d'une séance
+    GET    /seances/<id>/plan                     Plan des sièges
+    GET    /tarifs                                Tarifs disponibles
+    POST   /reservations                          Créer une réservation
+    POST   /reservations/lot                      Créer un lot de réservations (tout ou rien)
+    GET    /reservations/<id>                     Consulter un ticket
+    DELETE /reservations/<id>                     Annuler une réservation
+    POST   /blocages                              Mettre des sièges de côté
+    POST   /blocages/<id>/confirmation            Transformer un blocage en réservation
+    DELETE /blocages/<id>                         Libérer un blocage
+    GET    /statistiques                          Statistiques du cinéma
+    GET    /statistiques/revenus?axe=film&debut=AAAA-MM-JJ&fin=AAAA-MM-JJ
+                                                  Revenus par séance, film, salle, tarif, heure ou jour
+
+Corps de `POST /reservations` :
+    {"seance": "S01", "client": "Alice", "tarif": "Plein tarif",
+     "nb_places": 2, "places": [12, 13]}
+    (`places` est optionnel ; `nb_places` vaut par défaut le nombre de sièges.)
+
+Corps de `POST /reservations/lot` : {"reservations": [<même format>, ...]}.
+Réponse 201 avec un ticket par ligne, 400 si des lignes sont mal formées
+(séance inconnue comprise) ou 409 si des sièges sont refusés ; dans ces deux
+cas, `lignes` donne l'erreur de chaque ligne fautive avec son numéro, et
+aucune réservation n'est créée.
+
+Corps de `POST /blocages` : {"seance": "S01", "nb_places": 2, "places": [12, 13],
+"duree": 300} (`places` et `duree` sont optionnels). Le blocage expire au bout
+de `duree` secondes ; sa confirmation, avec {"client": ..., "tarif": ...},
+répond 410 s'il a expiré entre-temps.
+
+Une seule boucle d'événements gère toutes les connexions, maintenues ouvertes
+(keep-alive) entre deux requêtes : une connexion inactive ne coûte qu'un
+lecteur en attente, ce qui permet d'en servir plusieurs milliers sur un seul
+cœur. Les appels au service, bloquants, sont exécutés dans un pool de threads
+(`run_in_executor`) ; le service étant sûr en cas d'appels concurrents, la
+boucle n'est jamais bloquée par une réservation ou par une écriture disque.
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from models.blocage import Blocage, DUREE_BLOCAGE
+from models.exceptions import BlocageExpireException, CinemaException, SallePleineException
+from models.reservation import DemandeReservation, Reservation
+from models.seance import Seance
+from services.cinema_service import CinemaService
+from services.stockage import StockageJournal, StockageSQLite
+
+logger = logging.getLogger(__name__)
+
+TAILLE_MAX_ENTETES = 16 * 1024
+TAILLE_MAX_CORPS = 64 * 1024
+DELAI_INACTIVITE = 30.0  # secondes avant de fermer une connexion keep-alive inactive
+DUREE_BLOCAGE_MAX = 3 * DUREE_BLOCAGE  # un client ne peut pas bloquer des sièges indéfiniment
+
+
+class ErreurHTTP(Exception):
+    """Erreur renvoyée au client sous la forme {"erreur": message}."""
+
+    def __init__(self, statut: HTTPStatus, message: str):
+        super().__init__(message)
+        self.statut = statut
+        self.message = message
+
+
+def seance_en_dict(seance: Seance) -> Dict:
+    return {
+        'id': seance.id,
+        'film': seance.film.titre,
+        'duree': seance.film.duree,
+        'salle': seance.salle.nom,
+        'numero_salle': seance.salle.numero,
+        'type_salle': seance.salle.type_salle.value,
+        'horaire': seance.horaire.isoformat(),
+        'fin': seance.fin.isoformat(),
+        'capacite': seance.salle.capacite,
+        'places_disponibles': seance.places_disponibles,
+    }
+
+
+def reservation_en_dict(reservation: Reservation) -> Dict:
+    return {
+        'id': reservation.id,
+        'seance': reservation.seance.id,
+        'film': reservation.seance.film.titre,
+        'horaire': reservation.seance.horaire.isoformat(),
+        'client': reservation.client_nom,
+        'nb_places': reservation.nb_places,
+        'places': sorted(reservation.numeros_places),
+        'tarif': reservation.tarif.label,
+        'prix_total': reservation.prix_total,
+        'date_creation': reservation.date_creation.isoformat(),
+    }
+
+
+def blocage_en_dict(blocage: Blocage) -> Dict:
+    return {
+        'id': blocage.id,
+        'seance': blocage.seance.id,
+        'places': sorted(blocage.numeros_places),
+        'expire_dans': round(blocage.secondes_restantes, 1),
+    }
+
+
+class APICinema:
+    """
+    Traduit les requêtes HTTP en appels à `CinemaService`.
+
+    Chaque méthode `route_*` est exécutée dans le pool de threads et
+    retourne un couple (statut, corps JSON).
+
+    Args:
+        service (CinemaService): Le service partagé par toutes les connexions.
+        nb_threads (int): La taille du pool qui exécute les appels au service.
+    """
+
+    def __init__(self, service: CinemaService, nb_threads: int = 8):
+        self.service = service
+        self._executeur = ThreadPoolExecutor(max_workers=nb_threads, thread_name_prefix='api-cinema')
+
+    # --- Routage ---
+
+    def _router(self, methode: str, chemin: str):
+        parties = [unquote(p) for p in chemin.strip('/').split('/') if p]
+        match methode, parties:
+            case 'GET', ['seances']:
+                return self.route_seances, ()
+            case 'GET', ['seances', seance_id]:
+                return self.route_seance, (seance_id,)
+            case 'GET', ['seances', seance_id, 'plan']:
+                return self.route_plan, (seance_id,)
+            case 'GET', ['tarifs']:
+                return self.route_tarifs, ()
+            case 'POST', ['reservations']:
+                return self.route_creer_reservation, ()
+            case 'POST', ['reservations', 'lot']:
+                return self.route_creer_lot, ()
+            case 'GET', ['reservations', reservation_id]:
+                return self.route_reservation, (reservation_id,)
+            case 'DELETE', ['reservations', reservation_id]:
+                return self.route_annuler_reservation, (reservation_id,)
+            case 'POST', ['blocages']:
+                return self.route_bloquer, ()
+            case 'POST', ['blocages', blocage_id, 'confirmation']:
+                return self.route_confirmer_blocage, (blocage_id,)
+            case 'DELETE', ['blocages', blocage_id]:
+                return self.route_annuler_blocage, (blocage_id,)
+            case 'GET', ['statistiques']:
+                return self.route_statistiques, ()
+            case 'GET', ['statistiques', 'revenus']:
+                return self.route_revenus, ()
+            case _, (['seances'] | ['seances', _] | ['seances', _, 'plan'] | ['tarifs']
+                     | ['reservations'] | ['reservations', _] | ['statistiques'] | ['statistiques', 'revenus']
+                     | ['blocages'] | ['blocages', _] | ['blocages', _, 'confirmation']):
+                raise ErreurHTTP(HTTPStatus.METHOD_NOT_ALLOWED, f"Méthode {methode} non autorisée.")
+        raise ErreurHTTP(HTTPStatus.NOT_FOUND, f"Ressource introuvable : {chemin}")
+
+    async def traiter(self, methode: str, cible: str, corps: bytes) -> Tuple[HTTPStatus, Optional[object]]:
+        """Exécute une requête et retourne (statut, données à sérialiser)."""
+        url = urlsplit(cible)
+        try:
+            route, args = self._router(methode, url.path)
+            parametres = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            donnees = None
+            if corps:
+                try:
+                    donnees = json.loads(corps)
+                except ValueError:
+                    raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Corps JSON invalide.")
+            boucle = asyncio.get_running_loop()
+            appel = functools.partial(route, *args, parametres=parametres, donnees=donnees)
+            return await boucle.run_in_executor(self._executeur, appel)
+        except ErreurHTTP as e:
+            return e.statut, {'erreur': e.message}
+        except SallePleineException as e:
+            return HTTPStatus.CONFLICT, {'erreur': str(e)}
+        except BlocageExpireException as e:
+            return HTTPStatus.GONE, {'erreur': str(e)}
+        except (ValueError, CinemaException) as e:
+            return HTTPStatus.BAD_REQUEST, {'erreur': str(e)}
+        except Exception:
+            # Le client reçoit toujours une réponse, la connexion reste utilisable.
+            logger.exception("Erreur inattendue sur %s %s", methode, cible)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'erreur': "Erreur interne du serveur."}
+
+    def _seance(self, seance_id: str) -> Seance:
+        seance = self.service.get_seance(seance_id)
+        if seance is None:
+            raise ErreurHTTP(HTTPStatus.NOT_FOUND, f"Séance {seance_id} introuvable.")
+        return seance
+
+    # --- Routes (exécutées dans le pool de threads) ---
+
+    def route_seances(self, parametres: Dict, donnees):
+        if 'date' in parametres:
+            try:
+                jour = date.fromisoformat(parametres['date'])
+            except ValueError:
+                raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Date invalide (format AAAA-MM-JJ).")
+            if 'film' in parametres:
+                seances = self.service.get_seances_film_jour(parametres['film'], jour)
+            else:
+                seances = self.service.get_seances_par_date(jour)
+        elif 'film' in parametres:
+            seances = self.service.get_seances_par_film(parametres['film'])
+        else:
+            seances = self.service.get_seances_chronologiques()
+        return HTTPStatus.OK, [seance_en_dict(s) for s in seances]
+
+    def route_seance(self, seance_id: str, parametres: Dict, donnees):
+        return HTTPStatus.OK, seance_en_dict(self._seance(seance_id))
+
+    def route_plan(self, seance_id: str, parametres: Dict, donnees):
+        seance = self._seance(seance_id)
+        return HTTPStatus.OK, {
+            'seance': seance.id,
+            'capacite': seance.salle.capacite,
+            'places_reservees': seance.places_reservees,
+            'places_disponibles': seance.places_disponibles,
+            'sieges_occupes': list(seance.places_occupees),
+            'sieges_bloques': list(seance.places_bloquees),
+        }
+
+    def route_tarifs(self, parametres: Dict, donnees):
+        return HTTPStatus.OK, [{'label': t.label, 'coeff': t.coeff} for t in self.service.tarifs]
+
+    def route_creer_reservation(self, parametres: Dict, donnees):
+        demande = self._demande(donnees)
+        reservation = self.service.creer_reservation_avec_seance(
+            demande.seance, demande.client_nom, demande.nb_places, demande.tarif, demande.numeros_places)
+        return HTTPStatus.CREATED, reservation_en_dict(reservation)
+
+    def route_creer_lot(self, parametres: Dict, donnees):
+        if not isinstance(donnees, dict) or not isinstance(donnees.get('reservations'), list):
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Un objet {\"reservations\": [...]} est attendu.")
+        # Chaque ligne est lue, même après une ligne invalide : le client
+        # reçoit d'un coup toutes les erreurs, avec leur numéro de ligne.
+        demandes, erreurs = [], []
+        for i, ligne in enumerate(donnees['reservations']):
+            try:
+                demandes.append(self._demande(ligne))
+            except ErreurHTTP as e:
+                erreurs.append({'ligne': i, 'erreur': e.message})
+        if erreurs:
+            # Une séance inconnue est une erreur du lot envoyé : 400, pas 404.
+            return HTTPStatus.BAD_REQUEST, {
+                'erreur': "Lot invalide : aucune réservation n'a été créée.",
+                'lignes': erreurs,
+            }
+        resultats = self.service.creer_reservations_bulk(demandes)
+        if all(r.succes for r in resultats):
+            return HTTPStatus.CREATED, [reservation_en_dict(r.reservation) for r in resultats]
+        return HTTPStatus.CONFLICT, {
+            'erreur': "Lot refusé : aucune réservation n'a été créée.",
+            'lignes': [{'ligne': i, 'erreur': r.erreur} for i, r in enumerate(resultats) if r.erreur],
+        }
+
+    def _demande(self, donnees) -> DemandeReservation:
+        """Construit une demande de réservation à partir d'un objet JSON."""
+        if not isinstance(donnees, dict):
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Un objet JSON est attendu.")
+        seance = self._seance(str(donnees.get('seance', '')))
+        client = str(donnees.get('client', '')).strip()
+        if not client:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Le nom du client est obligatoire.")
+        tarif = self._tarif(donnees)
+        nb_places, places = self._places(donnees)
+        return DemandeReservation(seance, client, tarif, nb_places, places)
+
+    def _tarif(self, donnees: Dict):
+        tarif = next((t for t in self.service.tarifs if t.label == donnees.get('tarif')), None)
+        if tarif is None:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, f"Tarif inconnu : {donnees.get('tarif')!r}")
+        return tarif
+
+    @staticmethod
+    def _places(donnees: Dict):
+        """Lit `nb_places` et `places` (optionnel) dans un objet JSON."""
+        # `type(...) is int` : true/false sont des int pour isinstance.
+        places = donnees.get('places')
+        if places is not None and not (isinstance(places, list) and all(type(p) is int for p in places)):
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "`places` doit être une liste de numéros de siège.")
+        nb_places = donnees.get('nb_places', len(places) if places is not None else None)
+        if type(nb_places) is not int or nb_places < 1:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "`nb_places` doit être un entier positif.")
+        return nb_places, places
+
+    def route_reservation(self, reservation_id: str, parametres: Dict, donnees):
+        reservation = self.service.get_reservation(reservation_id)
+        if reservation is None:
+            raise ErreurHTTP(HTTPStatus.NOT_FOUND, f"Réservation {reservation_id} introuvable.")
+        return HTTPStatus.OK, reservation_en_dict(reservation)
+
+    def route_annuler_reservation(self, reservation_id: str, parametres: Dict, donnees):
+        if not self.service.annuler_reservation(reservation_id):
+            raise ErreurHTTP(HTTPStatus.NOT_FOUND, f"Réservation {reservation_id} introuvable.")
+        return HTTPStatus.NO_CONTENT, None
+
+    def route_bloquer(self, parametres: Dict, donnees):
+        if not isinstance(donnees, dict):
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Un objet JSON est attendu.")
+        seance = self._seance(str(donnees.get('seance', '')))
+        nb_places, places = self._places(donnees)
+        duree = donnees.get('duree', DUREE_BLOCAGE)
+        if not isinstance(duree, (int, float)) or not 0 < duree <= DUREE_BLOCAGE_MAX:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, f"`duree` doit être comprise entre 0 et {DUREE_BLOCAGE_MAX} s.")
+        blocage = self.service.bloquer_places(seance, nb_places, places, duree)
+        return HTTPStatus.CREATED, blocage_en_dict(blocage)
+
+    def route_confirmer_blocage(self, blocage_id: str, parametres: Dict, donnees):
+        if not isinstance(donnees, dict):
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Un objet JSON est attendu.")
+        client = str(donnees.get('client', '')).strip()
+        if not client:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Le nom du client est obligatoire.")
+        reservation = self.service.confirmer_blocage(blocage_id, client, self._tarif(donnees))
+        return HTTPStatus.CREATED, reservation_en_dict(reservation)
+
+    def route_annuler_blocage(self, blocage_id: str, parametres: Dict, donnees):
+        if not self.service.annuler_blocage(blocage_id):
+            raise ErreurHTTP(HTTPStatus.NOT_FOUND, f"Blocage {blocage_id} introuvable.")
+        return HTTPStatus.NO_CONTENT, None
+
+    def route_statistiques(self, parametres: Dict, donnees):
+        return HTTPStatus.OK, self.service.get_statistiques()
+
+    def route_revenus(self, parametres: Dict, donnees):
+        bornes = {}
+        for cle in ('debut', 'fin'):
+            if cle in parametres:
+                try:
+                    bornes[cle] = datetime.fromisoformat(parametres[cle])
+                except ValueError:
+                    raise ErreurHTTP(HTTPStatus.BAD_REQUEST, f"`{cle}` invalide (format AAAA-MM-JJ[THH:MM]).")
+        try:
+            revenus = self.service.get_revenus(parametres.get('axe', 'film'), **bornes)
+        except ValueError as e:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, str(e))
+        # Les groupes 'jour' sont des dates : clés converties en texte pour le JSON.
+        return HTTPStatus.OK, [{'groupe': groupe.isoformat() if isinstance(groupe, date) else groupe, **valeurs}
+                               for groupe, valeurs in revenus.items()]
+
+    # --- Protocole HTTP ---
+
+    async def connexion(self, lecteur: asyncio.StreamReader, ecrivain: asyncio.StreamWriter):
+        """Sert les requêtes successives d'une connexion jusqu'à sa fermeture."""
+        try:
+            while True:
+                try:
+                    entetes_bruts = await asyncio.wait_for(
+                        lecteur.readuntil(b'\r\n\r\n'), DELAI_INACTIVITE)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._repondre(ecrivain, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                         {'erreur': "En-têtes trop longs."}, garder=False)
+                    return
+
+                try:
+                    methode, cible, version, entetes = _analyser_entetes(entetes_bruts)
+                    longueur = int(entetes.get('content-length', 0))
+                except ValueError:
+                    await self._repondre(ecrivain, HTTPStatus.BAD_REQUEST,
+                                         {'erreur': "Requête mal formée."}, garder=False)
+                    return
+                if longueur < 0:
+                    await self._repondre(ecrivain, HTTPStatus.BAD_REQUEST,
+                                         {'erreur': "Content-Length négatif."}, garder=False)
+                    return
+                if longueur > TAILLE_MAX_CORPS:
+                    await self._repondre(ecrivain, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                         {'erreur': "Corps trop volumineux."}, garder=False)
+                    return
+                try:
+                    corps = await lecteur.readexactly(longueur) if longueur else b''
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+
+                connexion = entetes.get('connection', '').lower()
+                garder = connexion == 'keep-alive' if version == 'HTTP/1.0' else connexion != 'close'
+                statut, donnees = await self.traiter(methode, cible, corps)
+                await self._repondre(ecrivain, statut, donnees, garder)
+                if not garder:
+                    return
+        finally:
+            ecrivain.close()
+
+    @staticmethod
+    async def _repondre(ecrivain: asyncio.StreamWriter, statut: HTTPStatus, donnees, garder: bool):
+        corps = b'' if donnees is None else json.dumps(donnees, ensure_ascii=False).encode('utf-8')
+        entetes = [f"HTTP/1.1 {statut.value} {statut.phrase}"]
+        if corps:
+            entetes.append("Content-Type: application/json; charset=utf-8")
+        entetes.append(f"Content-Length: {len(corps)}")
+        entetes.append("Connection: keep-alive" if garder else "Connection: close")
+        ecrivain.write(("\r\n".join(entetes) + "\r\n\r\n").encode('ascii') + corps)
+        try:
+            await ecrivain.drain()
+        except ConnectionError:
+            pass
+
+    async def servir(self, hote: str = '127.0.0.1', port: int = 8080):
+        """Démarre le serveur et le fait tourner jusqu'à son annulation."""
+        serveur = await asyncio.start_server(self.connexion, hote, port,
+                                             limit=TAILLE_MAX_ENTETES, backlog=1024)
+        async with serveur:
+            await serveur.serve_forever()
+
+    def fermer(self):
+        self._executeur.shutdown(wait=True)
+        self.service.fermer()
+
+
+def _analyser_entetes(brut: bytes):
+    """
+    Découpe la ligne de requête et les en-têtes.
+
+    Raises:
+        ValueError: Si la requête est mal formée.
+    """
+    lignes = brut.decode('latin-1').split('\r\n')
+    methode, cible, version = lignes[0].split(' ')
+    if not version.startswith('HTTP/1.'):
+        raise ValueError(version)
+    entetes = {}
+    for ligne in lignes[1:]:
+        if ligne:
+            nom, _, valeur = ligne.partition(':')
+            entetes[nom.strip().lower()] = valeur.strip()
+    return methode.upper(), cible, version, entetes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API HTTP de réservation du cinéma")
+    parser.add_argument('--hote', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    stockage = parser.add_mutually_exclusive_group()
+    stockage.add_argument('--base', help="Base SQLite où persister les données")
+    stockage.add_argument('--journal', help="Dossier du journal de persistance")
+    args = parser.parse_args()
+
+    if args.base:
+        service = CinemaService(StockageSQLite(args.base))
+    elif args.journal:
+        service = CinemaService(StockageJournal(args.journal))
+    else:
+        service = CinemaService()
+
+    api = APICinema(service)
+    print(f"🎬 API du cinéma sur http://{args.hote}:{args.port}")
+    try:
+        asyncio.run(api.servir(args.hote, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.fermer()
+        print("👋 Au revoir!")
+
+
+if __name__ == "__main__":
+    main()
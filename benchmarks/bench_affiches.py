@@ -0,0 +1,85 @@
+"""
+Mesure l'affichage des affiches avec et sans `CacheAffiches`.
+
+Compare, pour chaque affiche de `assets/posters` : le décodage et la
+réduction à chaque affichage (sans cache), la création de la vignette sur
+disque (premier démarrage), en série puis par les fils de préchauffage,
+sa relecture (démarrages suivants) et, si un affichage est disponible, un
+affichage déjà en mémoire.
+
+Usage :
+    python benchmarks/bench_affiches.py [repetitions]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache_affiches import NB_FILS_PRECHAUFFAGE, TAILLE_AFFICHE, CacheAffiches
+
+DOSSIER_AFFICHES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'posters')
+
+
+def chronometrer(fonction, affiches, repetitions: int = 1) -> float:
+    """Durée moyenne par affiche, en millisecondes."""
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        for affiche in affiches:
+            fonction(affiche)
+    return (time.perf_counter() - debut) / (repetitions * len(affiches)) * 1000
+
+
+def sans_cache(affiche):
+    from PIL import Image
+    img = Image.open(affiche)
+    img.thumbnail(TAILLE_AFFICHE)
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    affiches = sorted(os.path.join(DOSSIER_AFFICHES, nom) for nom in os.listdir(DOSSIER_AFFICHES))
+    dossier = tempfile.mkdtemp()
+    try:
+        cache = CacheAffiches(dossier=dossier)
+        print(f"{len(affiches)} affiches")
+        print(f"sans cache            : {chronometrer(sans_cache, affiches, repetitions):7.2f} ms")
+        print(f"vignette (1er accès)  : {chronometrer(cache.vignette, affiches):7.2f} ms")
+
+        parallele = CacheAffiches(dossier=os.path.join(dossier, 'parallele'))
+        debut = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=NB_FILS_PRECHAUFFAGE) as executeur:
+            list(executeur.map(parallele.vignette, affiches))
+        duree = (time.perf_counter() - debut) / len(affiches) * 1000
+        print(f"préchauffage ({NB_FILS_PRECHAUFFAGE} fils) : {duree:7.2f} ms")
+
+        def relire(affiche):
+            with open(cache.vignette(affiche), 'rb') as f:
+                f.read()
+        print(f"vignette (relecture)  : {chronometrer(relire, affiches, repetitions):7.2f} ms")
+
+        lu_sources = sum(os.path.getsize(affiche) for affiche in affiches)
+        lu_vignettes = sum(os.path.getsize(cache.vignette(affiche)) for affiche in affiches)
+        print(f"octets lus            : {lu_sources // 1024} Ko -> {lu_vignettes // 1024} Ko")
+
+        try:
+            import tkinter as tk
+            root = tk.Tk()
+        except Exception:
+            print("mémoire               : non mesurée (pas d'affichage)")
+            return
+        try:
+            print(f"PhotoImage (disque)   : {chronometrer(cache.photo, affiches):7.2f} ms")
+            print(f"PhotoImage (mémoire)  : {chronometrer(cache.photo, affiches, repetitions):7.2f} ms")
+            print(f"mémoire des images    : {cache.octets // 1024} Ko")
+        finally:
+            root.destroy()
+    finally:
+        shutil.rmtree(dossier, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
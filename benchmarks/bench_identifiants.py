@@ -0,0 +1,53 @@
+"""
+Compare l'allocateur de numéros de billet aux anciens identifiants uuid.
+
+Mesure le coût d'une attribution (compteur en base 32 avec caractère de
+contrôle contre `str(uuid.uuid4())[:8]`), compte les collisions des anciens
+identifiants sur un historique et mesure la validation d'un billet.
+
+Usage :
+    python benchmarks/bench_identifiants.py [nb_identifiants]
+"""
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.identifiants import AllocateurIdentifiants, identifiant_valide
+
+
+def chronometrer(fonction, nombre: int) -> float:
+    """Durée moyenne d'un appel, en microsecondes."""
+    debut = time.perf_counter()
+    for _ in range(nombre):
+        fonction()
+    return (time.perf_counter() - debut) / nombre * 1e6
+
+
+def main():
+    nombre = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    ancien = chronometrer(lambda: str(uuid.uuid4())[:8], nombre)
+    allocateur = AllocateurIdentifiants(persister=lambda prefixe, borne: None)
+    nouveau = chronometrer(allocateur.allouer, nombre)
+    print(f"attribution : uuid {ancien:.2f} µs, allocateur {nouveau:.2f} µs")
+
+    vus = set()
+    collisions = 0
+    for _ in range(nombre):
+        identifiant = str(uuid.uuid4())[:8]
+        if identifiant in vus:
+            collisions += 1
+        vus.add(identifiant)
+    print(f"collisions des identifiants uuid sur {nombre} billets : {collisions} "
+          f"(attendu ≈ {nombre * (nombre - 1) / 2 / 16 ** 8:.0f})")
+
+    billet = AllocateurIdentifiants(depart=123456).allouer()
+    validation = chronometrer(lambda: identifiant_valide(billet), nombre)
+    print(f"validation de {billet} : {validation:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
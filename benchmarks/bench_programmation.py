@@ -0,0 +1,70 @@
+"""
+Mesure la génération d'un programme de plusieurs mois sur des dizaines de salles.
+
+Le générateur seul, puis `CinemaService.programmer` (index, statistiques,
+stockage en mémoire), sont chronométrés ; l'absence de chevauchement est
+ensuite vérifiée salle par salle.
+
+Usage :
+    python benchmarks/bench_programmation.py [nb_salles] [nb_jours]
+"""
+import os
+import sys
+import time
+from datetime import date, timedelta, time as heure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.enums import StyleFilm, TypeSalle
+from models.film import Film
+from services.cinema_service import CinemaService
+from services.programmation import BATTEMENT, Creneau, GenerateurProgramme
+
+CRENEAUX = [Creneau(heure(h, m)) for h, m in
+            [(10, 0), (11, 0), (13, 30), (14, 30), (16, 45), (17, 30), (19, 45), (20, 30), (22, 15)]]
+
+
+def verifier(seances) -> int:
+    """Compte les chevauchements (battement compris) dans chaque salle."""
+    par_salle = {}
+    for s in seances:
+        par_salle.setdefault(s.salle.numero, []).append(s)
+    conflits = 0
+    for liste in par_salle.values():
+        liste.sort(key=lambda s: s.horaire)
+        for precedente, suivante in zip(liste, liste[1:]):
+            if precedente.fin + timedelta(minutes=BATTEMENT) > suivante.horaire:
+                conflits += 1
+    return conflits
+
+
+def main():
+    nb_salles = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    nb_jours = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+
+    service = CinemaService()
+    for i in range(len(service.salles), nb_salles):
+        service.creer_salle(f"Salle {i + 1}", 40 + (i * 7) % 120, TypeSalle.CLASSIQUE)
+    for i in range(40):
+        service.ajouter_film(Film(f"Film {i}", 85 + (i * 11) % 100, StyleFilm.DRAME, 5 + i % 5, "", ""))
+    debut = date.today() + timedelta(days=7)
+    fin = debut + timedelta(days=nb_jours - 1)
+
+    t0 = time.perf_counter()
+    programme = GenerateurProgramme(service.salles, service._index_seances).generer(
+        service.films, debut, fin, CRENEAUX)
+    t1 = time.perf_counter()
+    seances = service.programmer(service.films, debut, fin, CRENEAUX)
+    t2 = time.perf_counter()
+
+    print(f"{len(service.salles)} salles, {nb_jours} jours, {len(service.films)} films, {len(CRENEAUX)} créneaux")
+    print(f"générateur : {len(programme.projections)} séances placées, "
+          f"{len(programme.refusees)} refusées en {(t1 - t0) * 1000:.0f} ms")
+    print(f"programmer : {len(seances)} séances ajoutées en {(t2 - t1) * 1000:.0f} ms")
+    conflits = verifier(service.seances)
+    print(f"chevauchements : {conflits}")
+    assert conflits == 0 and service.verifier_statistiques() == []
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Mesure la recherche de films sur un grand catalogue synthétique.
+
+Chaque requête simule une frappe au clavier (préfixes successifs d'un
+mot), avec et sans recherche dans les synopsis.
+
+Usage :
+    python benchmarks/bench_recherche.py [nb_films]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.enums import StyleFilm
+from models.film import Film
+from services.recherche_films import IndexRechercheFilms
+
+LETTRES = "abcdefghijklmnopqrstuvwxyzéèàç"
+REPETITIONS = 5
+
+
+def catalogue(nb_films: int):
+    vocabulaire = ["".join(random.choice(LETTRES) for _ in range(random.randint(3, 9))) for _ in range(5000)]
+    films = [Film(" ".join(random.sample(vocabulaire, random.randint(1, 4))).capitalize(), 100, StyleFilm.DRAME,
+                  round(random.uniform(5, 9.5), 1), "", " ".join(random.sample(vocabulaire, 25)))
+             for _ in range(nb_films)]
+    return vocabulaire, films
+
+
+def main():
+    random.seed(42)
+    nb_films = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+    vocabulaire, films = catalogue(nb_films)
+
+    debut = time.perf_counter()
+    index = IndexRechercheFilms(films)
+    print(f"{nb_films} films indexés en {(time.perf_counter() - debut) * 1000:.0f} ms")
+    debut = time.perf_counter()
+    index.rechercher("a", avec_resume=True)
+    print(f"index des synopsis construit en {(time.perf_counter() - debut) * 1000:.0f} ms")
+
+    requetes = [mot[:n] for mot in random.sample(vocabulaire, 200) for n in range(1, len(mot) + 1)]
+    for avec_resume in (False, True):
+        # Chaque requête est mesurée REPETITIONS fois : la première mesure
+        # (première frappe) puis la meilleure, qui écarte les pauses dues à
+        # la machine plutôt qu'à la recherche.
+        durees = [[] for _ in requetes]
+        for _ in range(REPETITIONS):
+            for requete, mesures in zip(requetes, durees):
+                t = time.perf_counter()
+                index.rechercher(requete, avec_resume=avec_resume, limite=50)
+                mesures.append(time.perf_counter() - t)
+        print(f"{'titre + synopsis' if avec_resume else 'titre'} : {len(requetes)} requêtes")
+        for nom, valeurs in (("première", [m[0] for m in durees]), ("meilleure", [min(m) for m in durees])):
+            valeurs.sort()
+            print(f"  {nom:<10}: moyenne {sum(valeurs) / len(valeurs) * 1e3:.3f} ms, "
+                  f"99e centile {valeurs[len(valeurs) * 99 // 100] * 1e3:.3f} ms, pire {valeurs[-1] * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Mesure les analyses de revenus sur une année de réservations.
+
+Le registre en colonnes (`RegistreReservations`) est comparé à une boucle
+sur les objets `Reservation`, avec NumPy si il est installé puis en Python
+pur.
+
+Usage :
+    python benchmarks/bench_registre.py [nb_reservations]
+"""
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import services.registre as registre
+from models.enums import StyleFilm, TypeSalle
+from models.film import Film
+from models.reservation import Reservation, Tarif
+from models.salle import Salle
+from models.seance import Seance
+from services.registre import AXES, RegistreReservations
+
+
+def historique(nb_reservations: int):
+    """Une année de réservations sur 12 salles et 40 films."""
+    films = [Film(f"Film {i}", 90 + i, StyleFilm.DRAME, 7.0) for i in range(40)]
+    salles = [Salle(i + 1, f"Salle {i + 1}", 200, random.choice(list(TypeSalle))) for i in range(12)]
+    tarifs = [Tarif("Plein tarif", 1.0), Tarif("Etudiant", 0.8), Tarif("Senior", 0.9), Tarif("Enfant", 0.6)]
+    debut = datetime(2025, 1, 1, 10)
+    seances = [Seance(f"S{i}", random.choice(films), salles[i % len(salles)],
+                      debut + timedelta(days=i // 48, hours=(i % 4) * 3))
+               for i in range(365 * 48)]
+    origine = debut.timestamp()
+    reservations = []
+    for i in range(nb_reservations):
+        seance = seances[i * len(seances) // nb_reservations]
+        reservations.append(Reservation(seance, f"Client {i % 50000}", random.randint(1, 4), random.choice(tarifs),
+                                        horodatage=origine + i * 365 * 86400 / nb_reservations))
+    return reservations
+
+
+def boucle_objets(reservations, axe: str):
+    """Le calcul sans registre : une boucle sur les réservations."""
+    groupes = defaultdict(lambda: [0, 0, 0.0])
+    for r in reservations:
+        if axe in ('heure', 'jour'):
+            date_creation = r.date_creation
+            cle = date_creation.hour if axe == 'heure' else date_creation.date()
+        else:
+            cle = {'seance': r.seance.id, 'film': r.seance.film.titre,
+                   'salle': r.seance.salle.nom, 'tarif': r.tarif.label}[axe]
+        groupe = groupes[cle]
+        groupe[0] += 1
+        groupe[1] += r.nb_places
+        groupe[2] += r.prix_total
+    return groupes
+
+
+def chronometrer(fonction, *args) -> float:
+    debut = time.perf_counter()
+    fonction(*args)
+    return time.perf_counter() - debut
+
+
+def main():
+    random.seed(42)
+    nb_reservations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    reservations = historique(nb_reservations)
+
+    debut = time.perf_counter()
+    reg = RegistreReservations.depuis(reservations)
+    print(f"{nb_reservations} réservations, registre construit en {time.perf_counter() - debut:.2f} s")
+
+    numpy = registre.np
+    print(f"{'axe':<8}{'objets':>10}{'numpy':>10}{'python':>10}")
+    for axe in AXES:
+        objets = chronometrer(boucle_objets, reservations, axe)
+        vectorise = float('nan')
+        if numpy is not None:
+            vectorise = chronometrer(reg.revenus_par, axe)
+        registre.np = None
+        python = chronometrer(reg.revenus_par, axe)
+        registre.np = numpy
+        print(f"{axe:<8}{objets * 1000:>8.0f} ms{vectorise * 1000:>7.0f} ms{python * 1000:>7.0f} ms")
+    if numpy is None:
+        print("NumPy n'est pas installé : seul le repli en Python pur est mesuré.")
+
+
+if __name__ == "__main__":
+    main()
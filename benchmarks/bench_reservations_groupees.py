@@ -0,0 +1,71 @@
+"""
+Compare une boucle de réservations unitaires et `creer_reservations_bulk`.
+
+Le même lot (deux sièges par ligne, réparti sur toutes les séances) est
+créé des deux manières, sur le stockage en mémoire puis sur SQLite.
+
+Usage :
+    python benchmarks/bench_reservations_groupees.py [taille_du_lot]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.reservation import DemandeReservation
+from services.cinema_service import CinemaService
+from services.stockage import Stockage, StockageSQLite
+
+
+def preparer_lot(service: CinemaService, taille: int):
+    demandes = []
+    prochain_siege = {}
+    seances = service.seances
+    i = 0
+    while len(demandes) < taille:
+        if i >= len(seances) * max(s.salle.capacite for s in seances):
+            raise SystemExit(f"Pas assez de places pour un lot de {taille} lignes.")
+        seance = seances[i % len(seances)]
+        i += 1
+        n = prochain_siege.get(seance.id, 1)
+        if n + 1 > seance.salle.capacite:
+            continue
+        prochain_siege[seance.id] = n + 2
+        demandes.append(DemandeReservation(seance, f"Groupe {i}", service.tarifs[1], numeros_places=[n, n + 1]))
+    return demandes
+
+
+def mesurer(nom: str, fabrique, taille: int):
+    service = CinemaService(fabrique())
+    demandes = preparer_lot(service, taille)
+    debut = time.perf_counter()
+    for d in demandes:
+        service.creer_reservation_avec_seance(d.seance, d.client_nom, d.nb_places, d.tarif, d.numeros_places)
+    unitaire = (time.perf_counter() - debut) / taille
+    service.fermer()
+
+    service = CinemaService(fabrique())
+    demandes = preparer_lot(service, taille)
+    debut = time.perf_counter()
+    resultats = service.creer_reservations_bulk(demandes)
+    groupe = (time.perf_counter() - debut) / taille
+    assert all(r.succes for r in resultats)
+    assert service.verify_occupancy() == [] and service.verifier_statistiques() == []
+    service.fermer()
+
+    print(f"{nom:<10} unitaire : {unitaire * 1e6:7.1f} µs/résa   lot : {groupe * 1e6:7.1f} µs/résa   "
+          f"(x{unitaire / groupe:.1f})")
+
+
+def main():
+    taille = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    mesurer("mémoire", Stockage, taille)
+    with tempfile.TemporaryDirectory() as dossier:
+        compteur = iter(range(100))
+        mesurer("sqlite", lambda: StockageSQLite(os.path.join(dossier, f"cinema{next(compteur)}.db")), taille)
+
+
+if __name__ == "__main__":
+    main()
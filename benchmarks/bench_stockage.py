@@ -0,0 +1,74 @@
+"""
+Compare le débit de réservation selon le backend de stockage.
+
+Chaque backend part des mêmes données de démonstration ; on enchaîne ensuite
+des réservations de deux sièges numérotés en parcourant les séances, puis on
+annule une réservation sur quatre.
+
+Usage :
+    python benchmarks/bench_stockage.py [nombre_de_reservations]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cinema_service import CinemaService
+from services.stockage import Stockage, StockageJournal, StockageSQLite
+
+
+def mesurer(nom: str, stockage: Stockage, nombre: int):
+    random.seed(42)
+    service = CinemaService(stockage)
+    seances = [s for s in service.seances]
+    tarifs = service.tarifs
+
+    debut = time.perf_counter()
+    creees = 0
+    i = 0
+    while creees < nombre and seances:
+        seance = seances[i % len(seances)]
+        i += 1
+        libres = [n for n in range(1, seance.salle.capacite + 1) if n not in seance.places_occupees][:2]
+        if len(libres) < 2:
+            seances.remove(seance)
+            continue
+        service.creer_reservation_avec_seance(seance, f"Client {creees}", 2, random.choice(tarifs), libres)
+        creees += 1
+    duree_reservation = time.perf_counter() - debut
+
+    a_annuler = [r.id for r in service.reservations[::4]]
+    debut = time.perf_counter()
+    for reservation_id in a_annuler:
+        service.annuler_reservation(reservation_id)
+    duree_annulation = time.perf_counter() - debut
+    service.fermer()
+
+    print(f"{nom:<18} {creees:>7} résa  {creees / duree_reservation:>10.0f} résa/s   "
+          f"{len(a_annuler):>6} annul.  {len(a_annuler) / duree_annulation:>10.0f} annul./s")
+
+
+def main():
+    nombre = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    mesurer("mémoire", Stockage(), nombre)
+    mesurer("sqlite :memory:", StockageSQLite(":memory:"), nombre)
+    with tempfile.TemporaryDirectory() as dossier:
+        mesurer("sqlite fichier", StockageSQLite(os.path.join(dossier, "cinema.db")), nombre)
+        mesurer("journal", StockageJournal(os.path.join(dossier, "journal")), nombre)
+        mesurer_redemarrage(os.path.join(dossier, "journal"))
+
+
+def mesurer_redemarrage(dossier: str):
+    """Mesure le rechargement du journal : instantané puis rejeu de la fin."""
+    debut = time.perf_counter()
+    service = CinemaService(StockageJournal(dossier))
+    duree = time.perf_counter() - debut
+    service.fermer()
+    print(f"redémarrage journal : {len(service.reservations)} réservations rechargées en {duree * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Test de charge de l'API HTTP (api_cinema.py).
+
+Lance le serveur dans un processus séparé, ouvre de nombreuses connexions
+keep-alive simultanées, puis fait envoyer à chacune une série de requêtes
+(plan des sièges, réservation, annulation). Affiche le débit obtenu et
+vérifie que toutes les réponses sont correctes.
+
+Usage :
+    python benchmarks/charge_api.py [nombre_de_connexions] [requetes_par_connexion]
+"""
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def requete(lecteur, ecrivain, methode: str, chemin: str, corps=None):
+    donnees = b'' if corps is None else json.dumps(corps).encode('utf-8')
+    ecrivain.write(f"{methode} {chemin} HTTP/1.1\r\nHost: localhost\r\n"
+                   f"Content-Length: {len(donnees)}\r\n\r\n".encode('ascii') + donnees)
+    await ecrivain.drain()
+    entetes = await lecteur.readuntil(b'\r\n\r\n')
+    statut = int(entetes.split(b' ', 2)[1])
+    longueur = 0
+    for ligne in entetes.split(b'\r\n'):
+        if ligne.lower().startswith(b'content-length:'):
+            longueur = int(ligne.split(b':')[1])
+    reponse = await lecteur.readexactly(longueur)
+    return statut, json.loads(reponse) if reponse else None
+
+
+async def client(port: int, numero: int, seances, nb_requetes: int, resultats: dict):
+    lecteur, ecrivain = await asyncio.open_connection('127.0.0.1', port)
+    seance = seances[numero % len(seances)]
+    try:
+        for i in range(nb_requetes):
+            if i % 3 == 0:
+                statut, ticket = await requete(lecteur, ecrivain, 'POST', '/reservations', {
+                    'seance': seance, 'client': f"Borne {numero}", 'tarif': 'Plein tarif', 'nb_places': 1})
+                if statut == 201:
+                    statut, _ = await requete(lecteur, ecrivain, 'DELETE', f"/reservations/{ticket['id']}")
+                    resultats['ok' if statut == 204 else 'erreur'] += 1
+                    continue
+                resultats['complet' if statut == 409 else 'erreur'] += 1
+            else:
+                statut, _ = await requete(lecteur, ecrivain, 'GET', f"/seances/{seance}/plan")
+                resultats['ok' if statut == 200 else 'erreur'] += 1
+    finally:
+        ecrivain.close()
+
+
+async def charge(port: int, nb_connexions: int, nb_requetes: int):
+    lecteur, ecrivain = await asyncio.open_connection('127.0.0.1', port)
+    _, seances = await requete(lecteur, ecrivain, 'GET', '/seances')
+    ecrivain.close()
+    seances = [s['id'] for s in seances]
+
+    resultats = {'ok': 0, 'complet': 0, 'erreur': 0}
+    debut = time.perf_counter()
+    await asyncio.gather(*(client(port, i, seances, nb_requetes, resultats) for i in range(nb_connexions)))
+    duree = time.perf_counter() - debut
+    total = sum(resultats.values())
+    print(f"{nb_connexions} connexions keep-alive, {total} échanges en {duree:.2f} s "
+          f"({total / duree:.0f}/s) : {resultats}")
+    assert resultats['erreur'] == 0, "Des requêtes ont échoué"
+
+
+def port_libre() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def main():
+    nb_connexions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    nb_requetes = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    port = port_libre()
+    serveur = subprocess.Popen([sys.executable, os.path.join(RACINE, 'api_cinema.py'), '--port', str(port)],
+                               cwd=RACINE, stdout=subprocess.DEVNULL)
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        asyncio.run(charge(port, nb_connexions, nb_requetes))
+    finally:
+        serveur.terminate()
+        serveur.wait()
+
+
+if __name__ == "__main__":
+    main()
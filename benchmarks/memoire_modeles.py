@@ -0,0 +1,113 @@
+"""
+Mesure, avec tracemalloc, la mémoire occupée par réservation et par séance.
+
+Les modèles actuels (`__slots__`, noms de clients internalisés, date de
+création en horodatage) sont comparés à des copies des anciens modèles
+(dataclasses avec `__dict__`, une chaîne par nom, un `datetime` par
+réservation). L'historique simulé compte un million de réservations de
+deux sièges, réparties sur des séances de la semaine, par une clientèle de
+50 000 noms relus depuis le stockage (une nouvelle chaîne à chaque ligne).
+
+Usage :
+    python benchmarks/memoire_modeles.py [nb_reservations] [nb_seances]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.enums import StyleFilm, TypeSalle
+from models.film import Film
+from models.plan_sieges import PlanSieges
+from models.reservation import Reservation, Tarif
+from models.salle import Salle
+from models.seance import Seance
+
+NB_CLIENTS = 50000
+
+
+# Copies des modèles tels qu'ils étaient avant le passage aux __slots__.
+@dataclass
+class SeanceAvant:
+    id: str
+    film: Film
+    salle: Salle
+    horaire: datetime
+    places_reservees: int = 0
+    places_occupees: PlanSieges = field(default_factory=PlanSieges)
+    places_bloquees: PlanSieges = field(default_factory=PlanSieges)
+
+
+@dataclass
+class ReservationAvant:
+    seance: SeanceAvant
+    client_nom: str
+    nb_places: int
+    tarif: Tarif
+    numeros_places: List[int] = field(default_factory=list)
+    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    date_creation: datetime = field(default_factory=datetime.now)
+
+
+def mesurer(fabrique, nombre: int) -> float:
+    """Octets alloués par objet pour `nombre` objets créés par `fabrique(i)`."""
+    gc.collect()
+    tracemalloc.start()
+    avant = tracemalloc.get_traced_memory()[0]
+    objets = [fabrique(i) for i in range(nombre)]
+    apres = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objets
+    return (apres - avant) / nombre
+
+
+def main():
+    nb_reservations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    nb_seances = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    film = Film("Interstellar", 169, StyleFilm.SF, 8.6)
+    salle = Salle(1, "L'Odyssée", 300, TypeSalle.IMAX)
+    tarif = Tarif("Plein tarif", 1.0)
+    debut = datetime.now()
+
+    def horaire(i):
+        return debut + timedelta(minutes=15 * (i % 2000))
+
+    def seance_avant(i):
+        return SeanceAvant(f"S{i}", film, salle, horaire(i))
+
+    def seance_apres(i):
+        return Seance(f"S{i}", film, salle, horaire(i))
+
+    s_avant, s_apres = seance_avant(0), seance_apres(0)
+    maintenant = time.time()
+
+    def reservation_avant(i):
+        return ReservationAvant(s_avant, f"Client {i % NB_CLIENTS}", 2, tarif, [i % 300 + 1, (i + 1) % 300 + 1],
+                                date_creation=datetime.fromtimestamp(maintenant - i))
+
+    def reservation_apres(i):
+        return Reservation(s_apres, f"Client {i % NB_CLIENTS}", 2, tarif, [i % 300 + 1, (i + 1) % 300 + 1],
+                           horodatage=maintenant - i)
+
+    print(f"{'':<14}{'avant':>10}{'après':>10}{'gain':>8}")
+    for libelle, nombre, avant, apres in (
+            ("séance", nb_seances, seance_avant, seance_apres),
+            ("réservation", nb_reservations, reservation_avant, reservation_apres)):
+        octets_avant = mesurer(avant, nombre)
+        octets_apres = mesurer(apres, nombre)
+        print(f"{libelle:<14}{octets_avant:>8.0f} o{octets_apres:>8.0f} o"
+              f"{(1 - octets_apres / octets_avant) * 100:>7.0f}%")
+    print(f"historique de {nb_reservations} réservations : "
+          f"{octets_avant * nb_reservations / 2**20:.0f} Mo -> {octets_apres * nb_reservations / 2**20:.0f} Mo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Mesure le temps de démarrage de l'interface graphique.
+
+Chaque mesure est faite dans un processus neuf, pour compter les imports à
+froid : import de `gui_cinema`, import de PIL, création du service avec les
+données de démonstration, puis, si un affichage est disponible, le temps
+jusqu'à l'apparition de la fenêtre et jusqu'à l'onglet Séances utilisable,
+avec le chargement immédiat et avec le chargement en arrière-plan.
+
+Usage :
+    python benchmarks/mesure_demarrage.py [repetitions]
+"""
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+
+def mesurer_import(module: str) -> float:
+    """Import à froid d'un module dans un nouveau processus, en secondes."""
+    code = ("import time; t = time.perf_counter(); import " + module +
+            "; print(time.perf_counter() - t)")
+    sortie = subprocess.run([sys.executable, "-c", code], cwd=RACINE,
+                            capture_output=True, text=True)
+    if sortie.returncode != 0:
+        return float('nan')
+    return float(sortie.stdout)
+
+
+def mesurer_service() -> float:
+    """Création d'un `CinemaService` (données de démonstration), en secondes."""
+    from services.cinema_service import CinemaService
+    debut = time.perf_counter()
+    CinemaService()
+    return time.perf_counter() - debut
+
+
+def enfant(mode: str):
+    """Démarre l'interface et affiche les instants mesurés, en JSON."""
+    debut = time.perf_counter()
+    import tkinter as tk
+    from gui_cinema import CinemaGUI
+    from services.cinema_service import CinemaService
+
+    root = tk.Tk()
+    instants = {}
+
+    def fenetre_affichee(event):
+        if event.widget is root:
+            instants.setdefault('fenetre', time.perf_counter() - debut)
+
+    root.bind('<Map>', fenetre_affichee)
+    if mode == 'differe':
+        app = CinemaGUI(root, fabrique_service=CinemaService)
+    else:
+        app = CinemaGUI(root)
+
+    def surveiller():
+        if app.service is not None and hasattr(app, 'seances_display_frame'):
+            instants.setdefault('seances', time.perf_counter() - debut)
+        if 'fenetre' in instants and 'seances' in instants:
+            root.destroy()
+        else:
+            root.after(5, surveiller)
+
+    root.after_idle(surveiller)
+    root.mainloop()
+    print(json.dumps(instants))
+
+
+def mesurer_interface(mode: str):
+    sortie = subprocess.run([sys.executable, os.path.abspath(__file__), '--enfant', mode],
+                            cwd=RACINE, capture_output=True, text=True)
+    if sortie.returncode != 0:
+        raise RuntimeError(sortie.stderr.strip().splitlines()[-1])
+    return json.loads(sortie.stdout.strip().splitlines()[-1])
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    def mediane_ms(mesures):
+        return f"{statistics.median(mesures) * 1000:7.0f} ms"
+
+    print(f"import gui_cinema        : {mediane_ms([mesurer_import('gui_cinema') for _ in range(repetitions)])}")
+    pil = [mesurer_import('PIL.ImageTk') for _ in range(repetitions)]
+    print(f"import PIL (différé)     : {'     absent' if math.isnan(pil[0]) else mediane_ms(pil)}")
+    print(f"création du service      : {mediane_ms([mesurer_service() for _ in range(repetitions)])}")
+
+    for mode, libelle in (('immediat', 'chargement immédiat'), ('differe', 'chargement différé')):
+        try:
+            mesures = [mesurer_interface(mode) for _ in range(repetitions)]
+        except RuntimeError as e:
+            print(f"interface non mesurée ({e})")
+            return
+        print(f"{libelle:<25}: fenêtre {mediane_ms([m['fenetre'] for m in mesures])}, "
+              f"onglet Séances {mediane_ms([m['seances'] for m in mesures])}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == '--enfant':
+        enfant(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,127 @@
+"""
+Test de charge du moteur de réservation concurrent.
+
+1. Cohérence : de nombreux threads réservent et annulent des sièges qui se
+   chevauchent sur quelques séances. On vérifie qu'aucun siège n'est vendu
+   deux fois, que l'occupation et les statistiques concordent avec les
+   réservations, et qu'un service rechargé depuis le journal retrouve
+   exactement les mêmes réservations.
+2. Passage à l'échelle : chaque thread réserve sur sa propre séance, avec un
+   backend qui simule une latence d'écriture (comme un disque). Les séances
+   étant distinctes, le débit doit croître avec le nombre de threads.
+
+Usage :
+    python benchmarks/stress_reservations.py
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.exceptions import SallePleineException
+from services.cinema_service import CinemaService
+from services.stockage import Stockage, StockageJournal
+
+NB_THREADS = 16
+OPERATIONS_PAR_THREAD = 400
+
+
+def lancer(nb_threads: int, cible):
+    threads = [threading.Thread(target=cible, args=(i,)) for i in range(nb_threads)]
+    debut = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - debut
+
+
+def verifier_coherence(stockage: Stockage):
+    service = CinemaService(stockage)
+    seances = service.seances[:3]
+    tarif = service.tarifs[0]
+
+    def client(numero: int):
+        aleatoire = random.Random(numero)
+        mes_reservations = []
+        for _ in range(OPERATIONS_PAR_THREAD):
+            if mes_reservations and aleatoire.random() < 0.3:
+                service.annuler_reservation(mes_reservations.pop(aleatoire.randrange(len(mes_reservations))))
+                continue
+            seance = aleatoire.choice(seances)
+            sieges = aleatoire.sample(range(1, seance.salle.capacite + 1), 2)
+            try:
+                resa = service.creer_reservation_avec_seance(seance, f"Client {numero}", 2, tarif, sieges)
+                mes_reservations.append(resa.id)
+            except SallePleineException:
+                pass
+
+    duree = lancer(NB_THREADS, client)
+
+    vendus = Counter((r.seance.id, n) for r in service.reservations for n in r.numeros_places)
+    doublons = [cle for cle, nombre in vendus.items() if nombre > 1]
+    assert not doublons, f"Sièges vendus plusieurs fois : {doublons[:5]}"
+    assert service.verify_occupancy() == [], service.verify_occupancy()
+    assert service.verifier_statistiques() == [], service.verifier_statistiques()
+    print(f"  {NB_THREADS} threads, {len(service.reservations)} réservations restantes, "
+          f"{len(vendus)} sièges vendus, aucun doublon ({duree:.2f} s)")
+    return service
+
+
+class StockageLent(Stockage):
+    """Simule un backend dont chaque écriture attend le disque (sans tenir le GIL)."""
+
+    def reservation_creee(self, reservation):
+        time.sleep(0.002)
+
+
+def mesurer_debit(nb_threads: int, reservations_par_thread: int = 40) -> float:
+    service = CinemaService(StockageLent())
+    seances = [s for s in service.seances if s.salle.capacite >= reservations_par_thread][:nb_threads]
+    tarif = service.tarifs[0]
+
+    def guichet(numero: int):
+        seance = seances[numero]
+        for i in range(reservations_par_thread):
+            service.creer_reservation_avec_seance(seance, f"Guichet {numero}", 1, tarif)
+
+    duree = lancer(nb_threads, guichet)
+    return nb_threads * reservations_par_thread / duree
+
+
+def main():
+    # Des changements de thread fréquents multiplient les entrelacements.
+    sys.setswitchinterval(1e-5)
+
+    print("Cohérence, stockage en mémoire :")
+    verifier_coherence(Stockage())
+
+    print("Cohérence, journal avec instantanés fréquents :")
+    with tempfile.TemporaryDirectory() as dossier:
+        service = verifier_coherence(StockageJournal(dossier, intervalle_instantane=500))
+        attendues = sorted((r.id, tuple(r.numeros_places)) for r in service.reservations)
+        service.fermer()
+        recharge = CinemaService(StockageJournal(dossier))
+        obtenues = sorted((r.id, tuple(r.numeros_places)) for r in recharge.reservations)
+        recharge.fermer()
+        assert attendues == obtenues, "Le journal rechargé diffère de l'état en mémoire"
+        print(f"  rechargement : {len(obtenues)} réservations identiques")
+
+    sys.setswitchinterval(0.005)
+    print("Passage à l'échelle (une séance par thread, écriture simulée de 2 ms) :")
+    reference = mesurer_debit(1)
+    print(f"  1 thread  : {reference:8.0f} résa/s")
+    for nb_threads in (2, 4, 8):
+        debit = mesurer_debit(nb_threads)
+        print(f"  {nb_threads} threads : {debit:8.0f} résa/s  (x{debit / reference:.1f})")
+    assert debit >= 4 * reference, "Le débit ne progresse pas avec le nombre de threads"
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import queue
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Tuple
+
+# Dossier des vignettes pré-réduites, à côté du code (ignoré par git).
+DOSSIER_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'affiches')
+# Taille maximale d'une affiche dans la fiche d'un film, ratio conservé.
+TAILLE_AFFICHE = (200, 300)
+# Mémoire maximale des images gardées par Tk (4 octets par pixel).
+BUDGET_OCTETS = 32 * 2 ** 20
+# Préchauffage : nombre de fils de décodage, intervalle (ms) entre deux
+# réceptions par le fil de Tkinter et nombre d'images créées à chacune.
+NB_FILS_PRECHAUFFAGE = min(4, os.cpu_count() or 1)
+INTERVALLE_PRECHAUFFAGE = 15
+IMAGES_PAR_RECEPTION = 4
+
+
+def _signature(chemin: str) -> Optional[Tuple[int, int]]:
+    """Date de modification et taille d'un fichier, ou None s'il n'existe pas."""
+    try:
+        stat = os.stat(chemin)
+    except (OSError, TypeError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _lire_meta(fichier_meta: str) -> Optional[Tuple[tuple, str]]:
+    """La signature et l'empreinte enregistrées pour une vignette, ou None si absentes ou illisibles."""
+    try:
+        with open(fichier_meta, encoding='utf-8') as f:
+            meta = json.load(f)
+        return tuple(meta['signature']), str(meta['empreinte'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # Fichier tronqué ou d'un autre format : la vignette est revérifiée
+
+
+class CacheAffiches:
+    """
+    Cache à deux niveaux des affiches de films.
+
+    En mémoire, les `PhotoImage` déjà affichées sont gardées par (chemin,
+    taille) dans l'ordre de leur dernière utilisation, dans la limite de
+    `budget` octets : revoir une fiche ne décode rien. Sur disque, chaque
+    affiche est enregistrée réduite (PNG d'une centaine de Ko au plus, lu par
+    Tk sans PIL) avec la date de modification, la taille et l'empreinte
+    SHA-256 de la source. Une vignette est refaite quand la source a changé :
+    si seule sa date a changé (copie, extraction d'une archive), l'empreinte
+    identique évite de la décoder à nouveau.
+
+    Les deux niveaux sont vérifiés par un `os.stat` de la source à chaque
+    affichage ; `photo` et `remplacement` doivent être appelées par le fil
+    de l'interface, `vignette` peut l'être par n'importe quel fil.
+
+    `prechauffer` remplit le cache avant le premier affichage : un groupe de
+    fils décode et réduit les affiches, puis lit chaque vignette en mémoire ;
+    le fil de l'interface ne fait que créer les `PhotoImage`, quelques-unes
+    à chaque passage de `root.after`.
+
+    Args:
+        dossier (str): Le dossier des vignettes.
+        budget (int): La mémoire maximale des images gardées, en octets.
+    """
+
+    def __init__(self, dossier: str = DOSSIER_CACHE, budget: int = BUDGET_OCTETS):
+        self.dossier = dossier
+        self.budget = budget
+        self.octets = 0
+        # (chemin absolu, taille) -> (signature de la source, image, octets)
+        self._photos = OrderedDict()
+        self._remplacements = {}
+        self._executeur = None
+        # Vignettes lues par les fils de préchauffage, en attente d'un PhotoImage
+        self._pretes = queue.SimpleQueue()
+        self._en_attente = 0
+
+    def photo(self, chemin: str, taille: Tuple[int, int] = TAILLE_AFFICHE) -> Optional[tk.PhotoImage]:
+        """
+        L'affiche réduite à `taille`, prête à être affichée.
+
+        Returns:
+            Optional[tk.PhotoImage]: L'image, ou None si l'affiche est
+                introuvable ou illisible.
+        """
+        signature = _signature(chemin)
+        if signature is None:
+            return None
+        cle = (os.path.abspath(chemin), taille)
+        entree = self._photos.get(cle)
+        if entree is not None and entree[0] == signature:
+            self._photos.move_to_end(cle)
+            return entree[1]
+
+        fichier = self.vignette(chemin, taille)
+        if fichier is None:
+            return None
+        try:
+            image = tk.PhotoImage(file=fichier)
+        except tk.TclError:
+            # Vignette abîmée sur disque : supprimée, elle sera refaite au
+            # prochain affichage.
+            try:
+                os.remove(fichier)
+            except OSError:
+                pass
+            return None
+        self._garder(cle, signature, image)
+        return image
+
+    def prechauffer(self, chemins: Iterable[str], root: tk.Misc, taille: Tuple[int, int] = TAILLE_AFFICHE):
+        """
+        Prépare en arrière-plan les affiches qui ne sont pas déjà en mémoire.
+
+        Args:
+            chemins (Iterable[str]): Les chemins des affiches.
+            root (tk.Misc): Un widget, pour programmer la création des images
+                dans la boucle d'événements.
+            taille (Tuple[int, int]): La taille d'affichage.
+        """
+        a_preparer = []
+        for chemin in dict.fromkeys(chemins):
+            signature = _signature(chemin)
+            entree = self._photos.get((os.path.abspath(chemin), taille))
+            if signature is not None and (entree is None or entree[0] != signature):
+                a_preparer.append(chemin)
+        if not a_preparer:
+            return
+        if self._executeur is None:
+            self._executeur = ThreadPoolExecutor(max_workers=NB_FILS_PRECHAUFFAGE,
+                                                 thread_name_prefix='prechauffage-affiches')
+        if not self._en_attente:
+            root.after(INTERVALLE_PRECHAUFFAGE, self._recevoir, root)
+        self._en_attente += len(a_preparer)
+        for chemin in a_preparer:
+            self._executeur.submit(self._preparer, chemin, taille)
+
+    def arreter(self):
+        """Abandonne le préchauffage en cours (à la fermeture de l'application)."""
+        if self._executeur is not None:
+            self._executeur.shutdown(wait=False, cancel_futures=True)
+            self._executeur = None
+
+    def _preparer(self, chemin: str, taille: Tuple[int, int]):
+        # Exécuté par un fil de préchauffage : ne touche à aucun objet Tk.
+        signature = donnees = None
+        try:
+            signature = _signature(chemin)
+            fichier = self.vignette(chemin, taille)
+            if fichier is not None:
+                with open(fichier, 'rb') as f:
+                    donnees = base64.b64encode(f.read())
+        except Exception:
+            donnees = None  # L'affiche sera préparée au moment de l'afficher
+        finally:
+            self._pretes.put((chemin, taille, signature, donnees))
+
+    def _recevoir(self, root: tk.Misc):
+        for _ in range(IMAGES_PAR_RECEPTION):
+            try:
+                chemin, taille, signature, donnees = self._pretes.get_nowait()
+            except queue.Empty:
+                break
+            self._en_attente -= 1
+            cle = (os.path.abspath(chemin), taille)
+            entree = self._photos.get(cle)
+            if donnees is None or (entree is not None and entree[0] == signature):
+                continue  # Illisible, ou affichée entre-temps
+            try:
+                image = tk.PhotoImage(data=donnees)
+            except tk.TclError:
+                continue  # Vignette abîmée : `photo` la refera à l'affichage
+            self._garder(cle, signature, image)
+        if self._en_attente:
+            root.after(INTERVALLE_PRECHAUFFAGE, self._recevoir, root)
+
+    def remplacement(self, taille: Tuple[int, int], couleur: str) -> tk.PhotoImage:
+        """Une image unie affichée à la place d'une affiche introuvable."""
+        image = self._remplacements.get((taille, couleur))
+        if image is None:
+            image = tk.PhotoImage(width=taille[0], height=taille[1])
+            image.put(couleur, to=(0, 0) + taille)
+            self._remplacements[(taille, couleur)] = image
+        return image
+
+    def vignette(self, chemin: str, taille: Tuple[int, int] = TAILLE_AFFICHE) -> Optional[str]:
+        """
+        Le chemin de la vignette sur disque, créée ou refaite si besoin.
+
+        Returns:
+            Optional[str]: Le fichier PNG de la vignette, ou None si
+                l'affiche est introuvable ou illisible, ou s'il faut la
+                réduire et que PIL n'est pas installé.
+        """
+        signature = _signature(chemin)
+        if signature is None:
+            return None
+        cle = hashlib.sha1(f'{os.path.abspath(chemin)}|{taille[0]}x{taille[1]}'.encode('utf-8')).hexdigest()
+        fichier = os.path.join(self.dossier, cle + '.png')
+        fichier_meta = os.path.join(self.dossier, cle + '.json')
+
+        meta = _lire_meta(fichier_meta) if os.path.exists(fichier) else None
+        if meta is not None and meta[0] == signature:
+            return fichier
+
+        try:
+            with open(chemin, 'rb') as f:
+                donnees = f.read()
+        except OSError:
+            return None
+        empreinte = hashlib.sha256(donnees).hexdigest()
+        if meta is None or meta[1] != empreinte:
+            # PIL n'est importé que pour réduire une affiche absente du cache.
+            try:
+                from PIL import Image
+            except ImportError:
+                return None
+
+            try:
+                with Image.open(io.BytesIO(donnees)) as img:
+                    img.thumbnail(taille)  # Redimensionne en conservant le ratio
+                    if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+                        img = img.convert('RGB')
+                    self._ecrire(fichier, lambda f: img.save(f, 'PNG'))
+            except (OSError, ValueError, Image.DecompressionBombError):
+                return None
+        try:
+            self._ecrire(fichier_meta, lambda f: f.write(
+                json.dumps({'signature': signature, 'empreinte': empreinte}).encode('utf-8')))
+        except OSError:
+            pass  # La vignette sera seulement revérifiée au prochain affichage
+        return fichier
+
+    def _ecrire(self, fichier: str, ecrire):
+        # Écrit puis renomme : un autre fil ou une autre instance ne lit
+        # jamais un fichier à moitié écrit.
+        os.makedirs(self.dossier, exist_ok=True)
+        temporaire = f'{fichier}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temporaire, 'wb') as f:
+            ecrire(f)
+        os.replace(temporaire, fichier)
+
+    def _garder(self, cle, signature, image: tk.PhotoImage):
+        ancienne = self._photos.pop(cle, None)
+        if ancienne is not None:
+            self.octets -= ancienne[2]
+        octets = image.width() * image.height() * 4
+        self._photos[cle] = (signature, image, octets)
+        self.octets += octets
+        # Les images les moins récemment affichées sortent en premier ; la
+        # dernière est toujours gardée, même si elle dépasse le budget.
+        while self.octets > self.budget and len(self._photos) > 1:
+            self.octets -= self._photos.popitem(last=False)[1][2]
+
+    def __len__(self) -> int:
+        return len(self._photos)
@@ -1,13 +1,35 @@
+import bisect
+import itertools
+import threading
 import tkinter as tk
+from dataclasses import dataclass
 from tkinter import ttk, messagebox, scrolledtext
-from PIL import Image, ImageTk
-from datetime import datetime
+from datetime import datetime, timedelta
+from cache_affiches import TAILLE_AFFICHE, CacheAffiches
 from services.cinema_service import CinemaService
 from models.exceptions import CinemaException
-from models.exceptions import CinemaException, ConflitSeanceException
+from models.exceptions import CinemaException, ConflitSeanceException, BlocageExpireException
 from models.enums import StyleFilm, TypeSalle
 from models.reservation import Tarif
 
+# Intervalle, en millisecondes, entre deux vérifications de la fin du
+# chargement des données en arrière-plan.
+INTERVALLE_CHARGEMENT = 20
+
+# Au-delà de ce nombre de réservations nouvelles ou modifiées, l'historique
+# est reconstruit en une passe plutôt que ligne par ligne.
+SEUIL_RECONSTRUCTION_HISTORIQUE = 256
+
+# Nombre maximum de films proposés sous la barre de recherche : au-delà,
+# l'utilisateur précise sa saisie plutôt que de faire défiler la liste.
+NB_RESULTATS_RECHERCHE = 50
+
+# Plan de salle : sièges par rangée, pas de la grille et côté d'un siège,
+# en pixels.
+SIEGES_PAR_RANGEE = 10
+PAS_SIEGE = 56
+TAILLE_SIEGE = 50
+
 class Colors:
     """Palette de couleurs élégante et moderne"""
     DARK = "#1a1a1a"
@@ -23,6 +45,230 @@ class Colors:
     BORDER = "#e5e7eb"
 
 
+JOURS_SEMAINE = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
+
+
+@dataclass(frozen=True)
+class VueSeance:
+    """
+    Ce qu'affiche la carte d'une séance dans l'onglet Séances.
+
+    Deux vues égales donnent le même affichage : une carte dont la vue n'a
+    pas changé n'est pas reconfigurée.
+    """
+    salle: str
+    type_salle: str
+    disponibilite: str
+    couleur: str
+    largeur_barre: int
+    reservable: bool
+
+    @classmethod
+    def depuis(cls, seance) -> 'VueSeance':
+        disponibles = seance.places_disponibles
+        capacite = seance.salle.capacite
+        if disponibles == 0:
+            couleur, texte = Colors.DANGER, 'COMPLET'
+        else:
+            couleur = Colors.WARNING if disponibles < 5 else Colors.SUCCESS
+            texte = f'{disponibles}/{capacite} places'
+        return cls(seance.salle.nom, f'Type: {seance.salle.type_salle.value}', texte, couleur,
+                   int(300 * seance.places_reservees / capacite), disponibles > 0)
+
+
+class CarteSeance:
+    """Carte d'une salle pour un horaire : nom, type, disponibilité, taux d'occupation et bouton."""
+
+    def __init__(self, parent, on_reserve):
+        self.seance = None
+        self.vue = None
+        self.cadre = tk.Frame(parent, bg=Colors.LIGHT, relief='solid', bd=1)
+        self.cadre.pack(fill='x', padx=10, pady=10)
+        
+        info_frame = tk.Frame(self.cadre, bg=Colors.LIGHT)
+        info_frame.pack(fill='x', padx=15, pady=10)
+        self.salle = tk.Label(info_frame, font=('Segoe UI', 12, 'bold'), fg=Colors.DARK, bg=Colors.LIGHT)
+        self.salle.pack(side='left', padx=(0, 20))
+        self.type_salle = tk.Label(info_frame, font=('Segoe UI', 10), fg=Colors.SECONDARY, bg=Colors.LIGHT)
+        self.type_salle.pack(side='left', padx=(0, 20))
+        self.disponibilite = tk.Label(info_frame, font=('Segoe UI', 10, 'bold'), bg=Colors.LIGHT)
+        self.disponibilite.pack(side='right', padx=(20, 0))
+        
+        # Barre de progression visuelle pour le taux d'occupation
+        progress_frame = tk.Frame(self.cadre, bg=Colors.LIGHT)
+        progress_frame.pack(fill='x', padx=15, pady=(0, 10))
+        bar_bg = tk.Frame(progress_frame, bg='#e5e7eb', height=8, width=300)
+        bar_bg.pack(fill='x')
+        bar_bg.pack_propagate(False)
+        self.barre = tk.Frame(bar_bg, height=8, width=0)
+        self.barre.pack(side='left', fill='y')
+        
+        btn_frame = tk.Frame(self.cadre, bg=Colors.LIGHT)
+        btn_frame.pack(fill='x', padx=15, pady=(10, 0))
+        self.bouton = ttk.Button(btn_frame, text='RESERVER', style='Success.TButton',
+                                 command=lambda: on_reserve(self.seance))
+        self.bouton.pack(side='right')
+
+    def afficher(self, seance):
+        """Affiche une séance, en ne reconfigurant que ce qui a changé."""
+        self.seance = seance
+        vue = VueSeance.depuis(seance)
+        ancienne, self.vue = self.vue, vue
+        if ancienne is None or vue.salle != ancienne.salle:
+            self.salle.config(text=vue.salle)
+        if ancienne is None or vue.type_salle != ancienne.type_salle:
+            self.type_salle.config(text=vue.type_salle)
+        if ancienne is None or (vue.disponibilite, vue.couleur) != (ancienne.disponibilite, ancienne.couleur):
+            self.disponibilite.config(text=vue.disponibilite, fg=vue.couleur)
+        if ancienne is None or (vue.largeur_barre, vue.couleur) != (ancienne.largeur_barre, ancienne.couleur):
+            self.barre.config(width=vue.largeur_barre, bg=vue.couleur)
+        if ancienne is None or vue.reservable != ancienne.reservable:
+            self.bouton.config(state='normal' if vue.reservable else 'disabled')
+
+
+class GroupeHoraire:
+    """En-tête d'un horaire et cartes de ses séances, réutilisées d'un affichage à l'autre."""
+
+    def __init__(self, parent, on_reserve):
+        self._on_reserve = on_reserve
+        self._horaire = None
+        self.cadre = tk.Frame(parent, bg=Colors.LIGHTER)
+        self.cadre.pack(fill='x')
+        header = tk.Frame(self.cadre, bg=Colors.PRIMARY)
+        header.pack(fill='x', padx=0, pady=(15, 0))
+        self.titre = tk.Label(header, font=('Segoe UI', 14, 'bold'), fg='white', bg=Colors.PRIMARY)
+        self.titre.pack(side='left', padx=10, pady=10)
+        self.salles_frame = tk.Frame(self.cadre, bg='white', relief='solid', bd=1)
+        self.salles_frame.pack(fill='x', padx=0, pady=(0, 10))
+        self.cartes = []
+
+    def afficher(self, horaire_str, seances):
+        """Affiche les séances d'un horaire ; les cartes sont réutilisées dans l'ordre."""
+        if horaire_str != self._horaire:
+            self._horaire = horaire_str
+            self.titre.config(text=f'  {horaire_str}')
+        for i, seance in enumerate(seances):
+            if i == len(self.cartes):
+                self.cartes.append(CarteSeance(self.salles_frame, self._on_reserve))
+            self.cartes[i].afficher(seance)
+        while len(self.cartes) > len(seances):
+            self.cartes.pop().cadre.destroy()
+
+    def detruire(self):
+        self.cadre.destroy()
+
+
+class FicheFilm:
+    """Fiche détaillée du film affiché : affiche, titre, métadonnées et synopsis."""
+
+    def __init__(self, parent, cache):
+        self.film = None
+        self._contenu = None
+        self._affiche = None
+        self._cache = cache
+        self.cadre = tk.Frame(parent, bg='white', relief='solid', bd=1)
+
+        # Poster à gauche
+        self.poster = tk.Label(self.cadre, bg='white')
+        self.poster.pack(side='left', padx=20, pady=20)
+
+        # Partie droite : informations textuelles
+        details_frame = tk.Frame(self.cadre, bg='white')
+        details_frame.pack(side='left', fill='both', expand=True, padx=(0, 20), pady=20)
+        self.titre = tk.Label(details_frame, font=('Segoe UI', 18, 'bold'), fg=Colors.DARK, bg='white',
+                              wraplength=500, justify='left')
+        self.titre.pack(anchor='w')
+
+        # Métadonnées (durée, genre, note)
+        meta_frame = tk.Frame(details_frame, bg='white')
+        meta_frame.pack(fill='x', pady=(10, 15))
+        self.metas = []
+        for _ in range(3):
+            label = tk.Label(meta_frame, font=('Segoe UI', 10), fg=Colors.SECONDARY, bg='white')
+            label.pack(side='left', padx=(0, 20))
+            self.metas.append(label)
+
+        tk.Label(details_frame, text="Synopsis", font=('Segoe UI', 11, 'bold'), fg=Colors.DARK, bg='white').pack(anchor='w')
+        self.synopsis = tk.Text(details_frame, height=6, wrap=tk.WORD, relief='flat', bd=0,
+                                font=('Segoe UI', 10), fg=Colors.DARK, bg='white',
+                                highlightthickness=1, highlightbackground=Colors.BORDER,
+                                state='disabled')  # Champ de texte non éditable
+        self.synopsis.pack(fill='both', expand=True, pady=(5, 0))
+
+    def afficher(self, film):
+        """Affiche un film ; rien n'est reconfiguré si sa fiche n'a pas changé."""
+        if not self.cadre.winfo_manager():
+            self.cadre.pack(fill='x', pady=(0, 20), before=self._premier_frere())
+        contenu = (film.titre, film.duree, film.style, film.note, film.resume)
+        if film is self.film and contenu == self._contenu and film.poster_path == self._affiche:
+            return
+        if film.poster_path != self._affiche or film is not self.film:
+            self._charger_affiche(film)
+        self.film, self._contenu = film, contenu
+        self.titre.config(text=film.titre)
+        for label, texte in zip(self.metas, (f"⏱️ {film.duree} min", f"🎭 {film.style.value}", f"⭐ {film.note}/10")):
+            label.config(text=texte)
+        self.synopsis.config(state='normal')
+        self.synopsis.delete('1.0', tk.END)
+        self.synopsis.insert('1.0', film.resume)
+        self.synopsis.config(state='disabled')
+
+    def masquer(self):
+        self.cadre.pack_forget()
+
+    def _premier_frere(self):
+        # La fiche reste en tête du conteneur, avant les horaires.
+        freres = self.cadre.master.pack_slaves()
+        return freres[0] if freres else None
+
+    def _charger_affiche(self, film):
+        self._affiche = film.poster_path
+        poster_image = self._cache.photo(film.poster_path, TAILLE_AFFICHE)
+        if poster_image is not None:
+            self.poster.config(image=poster_image, text='')
+        else:
+            # Affiche une image de remplacement si le poster n'est pas trouvé
+            poster_image = self._cache.remplacement(TAILLE_AFFICHE, Colors.BORDER)
+            self.poster.config(image=poster_image, text="Image non trouvée", compound='center', fg=Colors.SECONDARY)
+        self.poster.image = poster_image  # Garde une référence pour éviter le garbage collection
+
+
+class CarteJour:
+    """Carte d'un jour dans la barre latérale : date, nombre de séances et horaires."""
+
+    def __init__(self, parent, decalage, on_click):
+        # Aujourd'hui sur fond blanc, les jours suivants sur fond gris
+        fond = 'white' if decalage == 0 else '#f3f4f6'
+        self._contenu = None
+        self.cadre = tk.Frame(parent, bg=fond, relief='solid', bd=1, cursor='hand2')
+        self.cadre.pack(fill='x', pady=(0, 10))
+        self.jour = tk.Label(self.cadre, font=('Segoe UI', 10, 'bold'), fg=Colors.PRIMARY, bg=fond, cursor='hand2')
+        self.jour.pack(fill='x', padx=8, pady=(8, 5))
+        self.nombre = tk.Label(self.cadre, font=('Segoe UI', 9), fg=Colors.SECONDARY, bg=fond, cursor='hand2')
+        self.nombre.pack(fill='x', padx=8, pady=(0, 8))
+        if decalage == 0:
+            self.horaires = tk.Label(self.cadre, font=('Segoe UI', 8), fg=Colors.SECONDARY, bg=fond, cursor='hand2')
+        else:
+            self.horaires = tk.Label(self.cadre, font=('Segoe UI', 8), fg=Colors.DARK, bg=fond,
+                                     wraplength=180, justify='left', cursor='hand2')
+        self.horaires.pack(fill='x', padx=8, pady=(0, 8))
+        self._decalage = decalage
+        for widget in (self.cadre, self.jour, self.nombre, self.horaires):
+            widget.bind('<Button-1>', lambda e: on_click(decalage))
+
+    def afficher(self, jour, seances_jour):
+        """Met à jour la carte pour un jour et ses séances."""
+        nom = 'Aujourd\'hui' if self._decalage == 0 else JOURS_SEMAINE[jour.weekday()]
+        horaires = sorted(set(s.horaire.strftime('%H:%M') for s in seances_jour))
+        contenu = (f'{nom}\n{jour.strftime("%d/%m")}', f'{len(seances_jour)} séance(s)',
+                   ', '.join(horaires) if horaires else 'Aucune')
+        if contenu == self._contenu:
+            return
+        self._contenu = contenu
+        for label, texte in zip((self.jour, self.nombre, self.horaires), contenu):
+            label.config(text=texte)
+
+
 class CinemaGUI:
     """
     Classe principale de l'interface graphique pour le système de cinéma.
@@ -30,22 +276,77 @@ class CinemaGUI:
     Gère la création de la fenêtre, des widgets, des onglets et de toute
     l'interaction utilisateur.
     """
-    def __init__(self, root):
+    def __init__(self, root, service=None, fabrique_service=None):
+        """
+        Args:
+            root (tk.Tk): La fenêtre principale.
+            service (Optional[CinemaService]): Le service à afficher ; un
+                service avec les données de démonstration par défaut.
+            fabrique_service (Optional[Callable[[], CinemaService]]): Si
+                fournie, la fenêtre s'affiche d'abord et le service est créé
+                par cette fonction dans un fil d'exécution séparé ; les onglets
+                sont construits une fois le chargement terminé.
+        """
         self.root = root
-        self.service = CinemaService()
+        self._fabrique_service = fabrique_service
+        if fabrique_service is not None:
+            self.service = None
+        else:
+            self.service = service if service is not None else CinemaService()
+        self._service_charge = None
+        self._erreur_chargement = None
         self.seance_selectionnee = None
         self.seance_index = -1
         self._reservation_en_cours = None
-        self._seat_vars = {}
+        self._places_choisies = set()
         self._seances_affichees = []  # Pour stocker les references aux seances affichees
         self._selected_seances_date = None  # Date sélectionnée pour l'affichage
         self._seances_tab_selected_film_titre = None
         self.active_canvas = None  # Référence au canvas actuellement sous le curseur pour le scroll
+        self._fiche_film = None  # Construite avec l'onglet Séances
+        self.cache_affiches = CacheAffiches()
+        self._film_affiche = None
         
         self.setup_window()
         self.setup_styles()
         self.create_interface()
-        
+        if fabrique_service is not None:
+            # Le chargement ne démarre qu'une fois la boucle d'événements
+            # lancée, pour que la fenêtre s'affiche sans l'attendre.
+            self.root.after_idle(self._demarrer_chargement)
+        else:
+            self.root.after_idle(self._prechauffer_affiches)
+
+    def _demarrer_chargement(self):
+        """Crée le service en arrière-plan et surveille la fin du chargement."""
+        fil = threading.Thread(target=self._charger_service, name='chargement-service', daemon=True)
+        fil.start()
+        self._surveiller_chargement(fil)
+
+    def _charger_service(self):
+        # Exécuté hors du fil de Tkinter : ne touche à aucun widget.
+        try:
+            self._service_charge = self._fabrique_service()
+        except Exception as e:
+            self._erreur_chargement = e
+
+    def _surveiller_chargement(self, fil):
+        """Attend la fin du chargement puis construit l'onglet affiché."""
+        if fil.is_alive():
+            self.root.after(INTERVALLE_CHARGEMENT, self._surveiller_chargement, fil)
+            return
+        if self._erreur_chargement is not None:
+            messagebox.showerror('Erreur', f"Impossible de charger les données : {self._erreur_chargement}")
+            return
+        self.service = self._service_charge
+        self._prechauffer_affiches()
+        self._construire_onglet_selectionne()
+
+    def _prechauffer_affiches(self, films=None):
+        """Prépare en arrière-plan les affiches des films (tous par défaut)."""
+        films = self.service.films if films is None else films
+        self.cache_affiches.prechauffer([f.poster_path for f in films if f.poster_path], self.root)
+
     def _on_mousewheel(self, event):
         if self.active_canvas and self.active_canvas.winfo_exists():
             self.active_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -150,10 +451,38 @@ class CinemaGUI:
         self.notebook = ttk.Notebook(parent)
         self.notebook.pack(fill='both', expand=True, padx=20, pady=20)
         
-        self.create_seances_tab(self.notebook)
-        self.create_historique_tab(self.notebook)
-        self.create_stats_tab(self.notebook)
-        self.create_manager_tab(self.notebook)
+        # Chaque onglet n'est construit qu'à sa première sélection : seul
+        # l'onglet visible est construit au démarrage.
+        self._onglets_differes = {}
+        seances = self._onglet_differe('📅 Séances', self.create_seances_tab)
+        self._onglet_differe('📋 Historique', self.create_historique_tab)
+        self._onglet_differe('📊 Statistiques', self.create_stats_tab)
+        self._onglet_differe('⚙️ Manager', self.create_manager_tab)
+        self.notebook.bind('<<NotebookTabChanged>>', self._construire_onglet_selectionne)
+
+        if self.service is None:
+            tk.Label(seances, text='⏳ Chargement des données...',
+                    font=('Segoe UI', 14), fg=Colors.SECONDARY, bg=Colors.LIGHTER).pack(expand=True)
+        self._construire_onglet_selectionne()
+
+    def _onglet_differe(self, texte, constructeur):
+        """Ajoute un onglet vide, rempli par `constructeur` à sa première sélection."""
+        frame = ttk.Frame(self.notebook, style='Content.TFrame')
+        self.notebook.add(frame, text=texte)
+        self._onglets_differes[str(frame)] = (frame, constructeur)
+        return frame
+
+    def _construire_onglet_selectionne(self, event=None):
+        """Construit l'onglet sélectionné s'il ne l'a pas encore été."""
+        if self.service is None:
+            return  # Rappelé à la fin du chargement du service
+        onglet = self._onglets_differes.pop(self.notebook.select(), None)
+        if onglet is None:
+            return
+        frame, constructeur = onglet
+        for enfant in frame.winfo_children():
+            enfant.destroy()
+        constructeur(frame)
     
     def switch_to_seances_tab(self):
         """Bascule vers l'onglet 'Séances' et actualise son contenu."""
@@ -166,10 +495,8 @@ class CinemaGUI:
         if hasattr(self, 'manager_notebook'):
             self.manager_notebook.select(2)
         
-    def create_seances_tab(self, notebook):
+    def create_seances_tab(self, frame):
         """Crée l'onglet principal de consultation des séances."""
-        frame = ttk.Frame(notebook, style='Content.TFrame')
-        notebook.add(frame, text='📅 Séances')
         
         # Header avec titre dynamique
         self.seances_title_frame = tk.Frame(frame, bg=Colors.LIGHTER)
@@ -274,23 +601,26 @@ class CinemaGUI:
         self.sidebar_days_frame = tk.Frame(sidebar, bg='white')
         self.sidebar_days_frame.pack(fill='both', expand=True, padx=10, pady=(0, 10))
         
+        # Widgets réutilisés par `load_seances_beautifully`
+        self._fiche_film = FicheFilm(self.seances_display_frame, self.cache_affiches)
+        self._message_seances = tk.Label(self.seances_display_frame, bg=Colors.LIGHTER)
+        self._groupes_horaires = []
+        self._cartes_jours = []
+        
         self._update_film_search_results()  # Peuple la liste des films au démarrage
         self.load_seances_beautifully()
         
     def load_seances_beautifully(self, event=None):
-        """Actualise l'affichage de l'onglet 'Séances'."""
-        for widget in self.seances_display_frame.winfo_children():
-            widget.destroy()
-        
-        for widget in self.sidebar_days_frame.winfo_children():
-            widget.destroy()
+        """
+        Actualise l'affichage de l'onglet 'Séances'.
+
+        Les widgets déjà affichés sont réutilisés et mis à jour sur place ;
+        seuls les horaires et séances en plus ou en moins en créent ou en
+        détruisent.
+        """
+        if self._fiche_film is None:
+            return  # Onglet pas encore construit
 
-        # Obtenir les dates
-        from datetime import datetime, timedelta
-        aujourd_hui = datetime.now().date()
-        demain = aujourd_hui + timedelta(days=1)
-        surdemain = aujourd_hui + timedelta(days=2)
-        
         # Récupère l'objet Film correspondant au titre sélectionné
         film_titre = self._seances_tab_selected_film_titre
         film_selectionnee = None
@@ -300,295 +630,84 @@ class CinemaGUI:
                     film_selectionnee = f
                     break
 
-        if not film_selectionnee:
-            # Affiche un message si aucun film n'est sélectionné
-            empty_label = tk.Label(self.seances_display_frame,
-                                  text='Sélectionnez un film pour voir les séances',
-                                  font=('Segoe UI', 14),
-                                  fg=Colors.SECONDARY,
-                                  bg=Colors.LIGHTER)
-            empty_label.pack(pady=50)
-        else:
-            # Affiche les détails et les séances pour le film et la date choisis
-            if self._selected_seances_date is not None:
-                date_affichee = self._selected_seances_date
-                date_label = date_affichee.strftime('%d/%m/%Y')
-            else:
-                date_affichee = aujourd_hui
-                date_label = "Séances d'aujourd'hui"
-            
-            self._display_seances_for_date(self.seances_display_frame, 
-                                          film_selectionnee, date_affichee, 
-                                          date_label)
+        # Affiche les détails et les séances pour le film et la date choisis
+        date_affichee = self._selected_seances_date or datetime.now().date()
+        self._display_seances_for_date(film_selectionnee, date_affichee)
         
         # La barre latérale est toujours affichée pour permettre la navigation
-        self._display_sidebar_days(film_selectionnee, demain, surdemain)
-        
-    def _display_film_details(self, parent_frame, film):
-        """Construit et affiche la fiche détaillée d'un film."""
-        details_card = tk.Frame(parent_frame, bg='white', relief='solid', bd=1)
-        details_card.pack(fill='x', pady=(0, 20))
-
-        # Poster à gauche
-        poster_label = tk.Label(details_card, bg='white')
-        poster_label.pack(side='left', padx=20, pady=20)
-        
-        try:
-            img = Image.open(film.poster_path)
-            img.thumbnail((200, 300))  # Redimensionne en conservant le ratio
-            poster_image = ImageTk.PhotoImage(img)
-            poster_label.config(image=poster_image)
-            poster_label.image = poster_image  # Garde une référence pour éviter le garbage collection
-        except (FileNotFoundError, AttributeError):
-            # Affiche une image de remplacement si le poster n'est pas trouvé
-            placeholder = Image.new('RGB', (200, 300), color=Colors.BORDER)
-            poster_image = ImageTk.PhotoImage(placeholder)
-            poster_label.config(image=poster_image, text="Image non trouvée", compound='center', fg=Colors.SECONDARY)
-            poster_label.image = poster_image
-
-        # Partie droite : informations textuelles
-        details_frame = tk.Frame(details_card, bg='white')
-        details_frame.pack(side='left', fill='both', expand=True, padx=(0, 20), pady=20)
-
-        tk.Label(details_frame, text=film.titre, font=('Segoe UI', 18, 'bold'), fg=Colors.DARK, bg='white', wraplength=500, justify='left').pack(anchor='w')
-
-        # Métadonnées (durée, genre, note)
-        meta_frame = tk.Frame(details_frame, bg='white')
-        meta_frame.pack(fill='x', pady=(10, 15))
-        
-        meta_items = [
-            f"⏱️ {film.duree} min",
-            f"🎭 {film.style.value}",
-            f"⭐ {film.note}/10"
-        ]
-        for item_text in meta_items:
-            tk.Label(meta_frame, text=item_text, font=('Segoe UI', 10), fg=Colors.SECONDARY, bg='white').pack(side='left', padx=(0, 20))
-
-        tk.Label(details_frame, text="Synopsis", font=('Segoe UI', 11, 'bold'), fg=Colors.DARK, bg='white').pack(anchor='w')
-        synopsis_text = tk.Text(details_frame, height=6, wrap=tk.WORD, relief='flat', bd=0,
-                                font=('Segoe UI', 10), fg=Colors.DARK, bg='white',
-                                highlightthickness=1, highlightbackground=Colors.BORDER)
-        synopsis_text.pack(fill='both', expand=True, pady=(5, 0))
-        synopsis_text.insert('1.0', film.resume)
-        synopsis_text.config(state='disabled')  # Rend le champ de texte non éditable
-
-    def _display_seances_for_date(self, parent_frame, film, date, title):
-        """Affiche les séances d'un film pour une date donnée."""
-        
-        self._display_film_details(parent_frame, film)
-
-        # Filtre les séances pour le film et la date spécifiés
-        seances_du_jour = [s for s in self.service.get_toutes_seances()
-                          if s.film == film and s.horaire.date() == date]
-        seances_du_jour.sort(key=lambda s: s.horaire.time())
-        
-        if not seances_du_jour:
-            no_seance = tk.Label(parent_frame,
-                                text=f'Aucune séance pour ce film ce jour',
-                                font=('Segoe UI', 13),
-                                fg=Colors.WARNING,
-                                bg=Colors.LIGHTER)
-            no_seance.pack(pady=50)
-            return
+        self._display_sidebar_days(film_selectionnee)
+        
+    def _afficher_message_seances(self, texte, taille, couleur):
+        """Affiche le message de l'onglet Séances à la place des horaires."""
+        self._message_seances.config(text=texte, font=('Segoe UI', taille), fg=couleur)
+        if not self._message_seances.winfo_manager():
+            self._message_seances.pack(pady=50)
+
+    def _display_seances_for_date(self, film, date):
+        """Affiche la fiche d'un film et ses séances pour une date donnée."""
+        self._film_affiche = film
+        if film is None:
+            self._fiche_film.masquer()
+            seances_du_jour = []
+            self._afficher_message_seances('Sélectionnez un film pour voir les séances', 14, Colors.SECONDARY)
+        else:
+            self._fiche_film.afficher(film)
+            # Séances du film pour la date spécifiée, déjà triées par horaire
+            seances_du_jour = self.service.get_seances_film_jour(film.titre, date)
+            if seances_du_jour:
+                self._message_seances.pack_forget()
+            else:
+                self._afficher_message_seances('Aucune séance pour ce film ce jour', 13, Colors.WARNING)
         
         # Regroupe les séances par heure pour un affichage clair
         seances_par_horaire = {}
         for seance in seances_du_jour:
-            horaire_str = seance.horaire.strftime('%H:%M')
-            if horaire_str not in seances_par_horaire:
-                seances_par_horaire[horaire_str] = []
-            seances_par_horaire[horaire_str].append(seance)
-        
-        # Affiche une section pour chaque groupe d'horaires
-        for horaire_str in sorted(seances_par_horaire.keys()):
-            seances = seances_par_horaire[horaire_str]
-            
-            # Header de l'horaire
-            horaire_header = tk.Frame(parent_frame, bg=Colors.PRIMARY)
-            horaire_header.pack(fill='x', padx=0, pady=(15, 0))
-            
-            tk.Label(horaire_header, text=f'  {horaire_str}',
-                    font=('Segoe UI', 14, 'bold'),
-                    fg='white', bg=Colors.PRIMARY).pack(side='left', padx=10, pady=10)
-            
-            # Affiche les différentes salles pour cet horaire
-            salles_frame = tk.Frame(parent_frame, bg='white', relief='solid', bd=1)
-            salles_frame.pack(fill='x', padx=0, pady=(0, 10))
-            
-            for seance in seances:
-                salle_card = tk.Frame(salles_frame, bg=Colors.LIGHT, relief='solid', bd=1)
-                salle_card.pack(fill='x', padx=10, pady=10)
-                
-                info_frame = tk.Frame(salle_card, bg=Colors.LIGHT)
-                info_frame.pack(fill='x', padx=15, pady=10)
-                
-                salle_name = tk.Label(info_frame, text=f'{seance.salle.nom}',
-                                     font=('Segoe UI', 12, 'bold'),
-                                     fg=Colors.DARK, bg=Colors.LIGHT)
-                salle_name.pack(side='left', padx=(0, 20))
-                
-                type_label = tk.Label(info_frame, text=f'Type: {seance.salle.type_salle.value}',
-                                     font=('Segoe UI', 10),
-                                     fg=Colors.SECONDARY, bg=Colors.LIGHT)
-                type_label.pack(side='left', padx=(0, 20))
-                
-                # Affiche la disponibilité avec un code couleur
-                dispo_text = f'{seance.places_disponibles}/{seance.salle.capacite} places'
-                if seance.places_disponibles == 0:
-                    dispo_color = Colors.DANGER
-                    dispo_text = 'COMPLET'
-                elif seance.places_disponibles < 5:
-                    dispo_color = Colors.WARNING
-                else:
-                    dispo_color = Colors.SUCCESS
-                
-                dispo_label = tk.Label(info_frame, text=dispo_text,
-                                      font=('Segoe UI', 10, 'bold'),
-                                      fg=dispo_color, bg=Colors.LIGHT)
-                dispo_label.pack(side='right', padx=(20, 0))
-                
-                # Barre de progression visuelle pour le taux d'occupation
-                progress_frame = tk.Frame(salle_card, bg=Colors.LIGHT)
-                progress_frame.pack(fill='x', padx=15, pady=(0, 10))
-                
-                occupied_ratio = seance.places_reservees / seance.salle.capacite
-                progress_width = int(300 * occupied_ratio)
-                
-                bar_bg = tk.Frame(progress_frame, bg='#e5e7eb', height=8, width=300)
-                bar_bg.pack(fill='x')
-                bar_bg.pack_propagate(False)
-                
-                bar_fill = tk.Frame(bar_bg, bg=dispo_color, height=8, width=progress_width)
-                bar_fill.pack(side='left', fill='y')
-                
-                # Bouton de réservation
-                btn_frame = tk.Frame(salle_card, bg=Colors.LIGHT)
-                btn_frame.pack(fill='x', padx=15, pady=(10, 0))
-                    
-                def make_reserve_handler(s):
-                    def on_reserve():
-                        self.seance_selectionnee = s
-                        self.open_quick_reservation(s)
-                    return on_reserve
-                    
-                ttk.Button(btn_frame, text='RESERVER',
-                                command=make_reserve_handler(seance),
-                                style='Success.TButton',
-                                state='normal' if seance.places_disponibles > 0 else 'disabled').pack(side='right')
-    
-    def _display_sidebar_days(self, film, day1, day2):
-        """Construit la barre latérale de navigation par jour."""
-        # NOTE: Les séances sont récupérées avec l'occupation reconstruite pour
-        # garantir la cohérence des données affichées, contournant un bug potentiel
-        # de partage d'état entre objets Seance.
-        all_seances_for_film = [s for s in self._get_seances_with_rebuilt_occupancy() if s.film == film]
-
-        from datetime import datetime, timedelta
-        
+            seances_par_horaire.setdefault(seance.horaire.strftime('%H:%M'), []).append(seance)
+        
+        # Une section par horaire, réutilisée d'un affichage à l'autre
+        groupes = self._groupes_horaires
+        for i, horaire_str in enumerate(sorted(seances_par_horaire)):
+            if i == len(groupes):
+                groupes.append(GroupeHoraire(self.seances_display_frame, self._reserver_seance))
+            groupes[i].afficher(horaire_str, seances_par_horaire[horaire_str])
+        while len(groupes) > len(seances_par_horaire):
+            groupes.pop().detruire()
+
+    def _reserver_seance(self, seance):
+        """Ouvre la réservation rapide depuis la carte d'une séance."""
+        self.seance_selectionnee = seance
+        self.open_quick_reservation(seance)
+
+    def _titre_jour(self, jour):
+        """Le titre de l'onglet Séances pour un jour donné."""
         aujourd_hui = datetime.now().date()
-        
-        # Carte pour le jour actuel
-        day_card = tk.Frame(self.sidebar_days_frame, bg='white', relief='solid', bd=1, cursor='hand2')
-        day_card.pack(fill='x', pady=(0, 10))
-        
-        def make_click_handler(selected_day, film_obj):
-            def on_click(event):
-                if film_obj is None:
-                    messagebox.showinfo("Action requise", "Veuillez d'abord sélectionner un film dans la liste de recherche.")
-                    return
-
-                for widget in self.seances_display_frame.winfo_children():
-                    widget.destroy()
-
-                self._selected_seances_date = selected_day
-                if selected_day == aujourd_hui:
-                    titre = "Séances d'Aujourd'hui"
-                elif selected_day == aujourd_hui + timedelta(days=1):
-                    titre = "Séances de Demain"
-                else:
-                    jour_name = selected_day.strftime('%A')
-                    jour_name_fr = {'Monday': 'Lundi', 'Tuesday': 'Mardi', 'Wednesday': 'Mercredi',
-                                   'Thursday': 'Jeudi', 'Friday': 'Vendredi', 'Saturday': 'Samedi',
-                                   'Sunday': 'Dimanche'}.get(jour_name, jour_name)
-                    titre = f"Séances du {jour_name_fr} {selected_day.strftime('%d/%m/%Y')}"
-                
-                self.seances_title_label.config(text=titre)
-                self._display_seances_for_date(self.seances_display_frame, 
-                                              film_obj, selected_day, titre)
-            return on_click
-        
-        day_card.bind('<Button-1>', make_click_handler(aujourd_hui, film))
-        
-        date_str = aujourd_hui.strftime('%d/%m')
-        day_label_text = f'Aujourd\'hui\n{date_str}'
-        day_label = tk.Label(day_card, text=day_label_text,
-                            font=('Segoe UI', 10, 'bold'),
-                            fg=Colors.PRIMARY, bg='white', cursor='hand2')
-        day_label.pack(fill='x', padx=8, pady=(8, 5))
-        day_label.bind('<Button-1>', make_click_handler(aujourd_hui, film))
-        
-        if film:
-            seances_jour = [s for s in all_seances_for_film if s.horaire.date() == aujourd_hui]
-        else:
-            seances_jour = []
+        if jour == aujourd_hui:
+            return "Séances d'Aujourd'hui"
+        if jour == aujourd_hui + timedelta(days=1):
+            return "Séances de Demain"
+        return f"Séances du {JOURS_SEMAINE[jour.weekday()]} {jour.strftime('%d/%m/%Y')}"
+
+    def _on_jour_clique(self, decalage):
+        """Affiche les séances du film sélectionné `decalage` jours après aujourd'hui."""
+        film = self._film_affiche
+        if film is None:
+            messagebox.showinfo("Action requise", "Veuillez d'abord sélectionner un film dans la liste de recherche.")
+            return
+        jour = datetime.now().date() + timedelta(days=decalage)
+        self._selected_seances_date = jour
+        self.seances_title_label.config(text=self._titre_jour(jour))
+        self._display_seances_for_date(film, jour)
 
-        nb_seances = len(seances_jour)
-        count_label = tk.Label(day_card, text=f'{nb_seances} séance(s)',
-                              font=('Segoe UI', 9),
-                              fg=Colors.SECONDARY, bg='white', cursor='hand2')
-        count_label.pack(fill='x', padx=8, pady=(0, 8))
-        count_label.bind('<Button-1>', make_click_handler(aujourd_hui, film))
-        
-        horaires = sorted(set(s.horaire.strftime('%H:%M') for s in seances_jour))
-        horaires_str = ', '.join(horaires) if horaires else 'Aucune'
-        
-        horaires_label = tk.Label(day_card, text=horaires_str,
-                                 font=('Segoe UI', 8),
-                                 fg=Colors.SECONDARY, bg='white', cursor='hand2')
-        horaires_label.pack(fill='x', padx=8, pady=(0, 8))
-        horaires_label.bind('<Button-1>', make_click_handler(aujourd_hui, film))
-        
-        # Cartes pour les 6 jours suivants
-        day_names = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
-        
-        for i in range(1, 7):
-            day = aujourd_hui + timedelta(days=i)
-            jour_num = day.weekday()
-            jour_name = day_names[jour_num]
-            
-            day_card = tk.Frame(self.sidebar_days_frame, bg='#f3f4f6', relief='solid', bd=1, cursor='hand2')
-            day_card.pack(fill='x', pady=(0, 10))
-            
-            day_card.bind('<Button-1>', make_click_handler(day, film))
-            
-            date_str = day.strftime('%d/%m')
-            day_label = tk.Label(day_card, text=f'{jour_name}\n{date_str}',
-                                font=('Segoe UI', 10, 'bold'),
-                                fg=Colors.PRIMARY, bg='#f3f4f6', cursor='hand2')
-            day_label.pack(fill='x', padx=8, pady=(8, 5))
-            day_label.bind('<Button-1>', make_click_handler(day, film))
-            
-            if film:
-                seances_jour = [s for s in all_seances_for_film if s.horaire.date() == day]
-            else:
-                seances_jour = []
-
-            nb_seances = len(seances_jour)
-            count_label = tk.Label(day_card, text=f'{nb_seances} séance(s)',
-                                  font=('Segoe UI', 9),
-                                  fg=Colors.SECONDARY, bg='#f3f4f6', cursor='hand2')
-            count_label.pack(fill='x', padx=8, pady=(0, 8))
-            count_label.bind('<Button-1>', make_click_handler(day, film))
-            
-            horaires = sorted(set(s.horaire.strftime('%H:%M') for s in seances_jour))
-            horaires_str = ', '.join(horaires) if horaires else 'Aucune'
-            
-            horaires_label = tk.Label(day_card, text=horaires_str,
-                                     font=('Segoe UI', 8),
-                                     fg=Colors.DARK, bg='#f3f4f6',
-                                     wraplength=180, justify='left', cursor='hand2')
-            horaires_label.pack(fill='x', padx=8, pady=(0, 8))
-            horaires_label.bind('<Button-1>', make_click_handler(day, film))
+    def _display_sidebar_days(self, film):
+        """Met à jour la barre latérale de navigation sur 7 jours."""
+        aujourd_hui = datetime.now().date()
+        if not self._cartes_jours:
+            for decalage in range(7):
+                self._cartes_jours.append(CarteJour(self.sidebar_days_frame, decalage, self._on_jour_clique))
+        for decalage, carte in enumerate(self._cartes_jours):
+            jour = aujourd_hui + timedelta(days=decalage)
+            seances_jour = self.service.get_seances_film_jour(film.titre, jour) if film else []
+            carte.afficher(jour, seances_jour)
         
     def _update_film_search_results(self, event=None):
         """Met à jour la liste des films en fonction de la recherche."""
@@ -597,7 +716,7 @@ class CinemaGUI:
         for widget in self.film_search_results_frame.winfo_children():
             widget.destroy()
         
-        films_trouves = self.service.rechercher_films(search_term)
+        films_trouves = self.service.rechercher_films(search_term, limite=NB_RESULTATS_RECHERCHE)
         
         if not films_trouves:
             no_result_label = tk.Label(self.film_search_results_frame, text="Aucun film trouvé",
@@ -629,10 +748,8 @@ class CinemaGUI:
         self.film_search_entry.delete(0, tk.END)
         self._update_film_search_results()
         
-    def create_historique_tab(self, notebook):
+    def create_historique_tab(self, frame):
         """Crée l'onglet d'historique des réservations."""
-        frame = ttk.Frame(notebook, style='Content.TFrame')
-        notebook.add(frame, text='📋 Historique')
         
         # Header
         header = tk.Frame(frame, bg=Colors.LIGHTER)
@@ -676,7 +793,8 @@ class CinemaGUI:
         self.reservations_treeview.column('Sièges', width=150)
         self.reservations_treeview.column('Prix', width=80, anchor='e')
 
-        # Configure les tags pour un affichage en "zèbre" (lignes alternées)
+        # Fond alterné d'un jour de séance à l'autre : la couleur d'une ligne
+        # ne dépend pas de sa position, une insertion ne recolore rien.
         self.reservations_treeview.tag_configure('oddrow', background='white')
         self.reservations_treeview.tag_configure('evenrow', background=Colors.LIGHT)
 
@@ -685,12 +803,17 @@ class CinemaGUI:
         self.reservations_treeview.pack(side='left', fill='both', expand=True)
         scrollbar_reservations.pack(side='right', fill='y')
         
+        # Lignes affichées : iid -> (signature, clé de tri, valeurs formatées),
+        # et clés de tri croissantes (horaire, -rang, iid) ; l'affichage est
+        # dans l'ordre inverse.
+        self._lignes_reservations = {}
+        self._ordre_reservations = []
+        self._rangs_reservations = itertools.count()
+        self._horaires_formates = {}
         self.load_reservations()
         
-    def create_stats_tab(self, notebook):
+    def create_stats_tab(self, frame):
         """Crée l'onglet des statistiques générales."""
-        frame = ttk.Frame(notebook, style='Content.TFrame')
-        notebook.add(frame, text='📊 Statistiques')
         
         # Header
         header = tk.Frame(frame, bg=Colors.LIGHTER)
@@ -728,10 +851,8 @@ class CinemaGUI:
         self.load_stats()
 
 
-    def create_manager_tab(self, notebook):
+    def create_manager_tab(self, frame):
         """Crée l'onglet principal du panneau de gestion (Manager)."""
-        frame = ttk.Frame(notebook, style='Content.TFrame')
-        notebook.add(frame, text='⚙️ Manager')
         
         self.manager_notebook = ttk.Notebook(frame)
         self.manager_notebook.pack(fill='both', expand=True, padx=20, pady=20)
@@ -1285,29 +1406,6 @@ class CinemaGUI:
                                 fg=Colors.PRIMARY, bg=Colors.LIGHT)
         version_label.pack(side='right')
         
-    def _get_seances_with_rebuilt_occupancy(self):
-        """
-        Reconstruit l'état d'occupation des places pour chaque séance.
-
-        NOTE: Cette méthode est un contournement critique. Elle corrige un bug où
-        les objets Seance pourraient partager incorrectement leur état d'occupation.
-        En réinitialisant et en reconstruisant l'occupation à partir de la liste
-        globale des réservations (la source de vérité), on garantit la
-        cohérence des données à chaque affichage.
-        """
-        all_seances = self.service.get_toutes_seances()
-        
-        for seance in all_seances:
-            seance.places_occupees = set()
-            seance.places_reservees = 0
-            
-        for reservation in self.service.reservations:
-            if reservation.numeros_places and hasattr(reservation, 'seance'):
-                reservation.seance.places_occupees.update(reservation.numeros_places)
-                reservation.seance.places_reservees = len(reservation.seance.places_occupees)
-                
-        return all_seances
-        
     def open_quick_reservation(self, seance):
         """Fenêtre rapide de réservation directement depuis l'onglet Séances"""
         window = tk.Toplevel(self.root)
@@ -1437,6 +1535,7 @@ class CinemaGUI:
         legend_items = [
             (Colors.SUCCESS, 'Libre'),
             (Colors.DANGER, 'Occupée'),
+            (Colors.WARNING, 'En cours à un autre guichet'),
             (Colors.PRIMARY, 'Sélectionnée')
         ]
         
@@ -1447,21 +1546,18 @@ class CinemaGUI:
             tk.Label(item, text='■', font=('Arial', 14), fg=color, bg=Colors.LIGHT).pack(side='left', padx=(0, 8))
             tk.Label(item, text=label, font=('Segoe UI', 10), fg=Colors.DARK, bg=Colors.LIGHT).pack(side='left')
         
-        # Grille des sièges dans un conteneur scrollable
+        # Plan de salle dessiné sur un seul canvas : un siège est un rectangle
+        # et un texte, un clic est résolu par le calcul de sa rangée et de sa
+        # colonne, et seules les rangées visibles sont dessinées.
         grid_scroll_frame = tk.Frame(window, bg=Colors.LIGHT)
         grid_scroll_frame.pack(fill='both', expand=True, padx=20, pady=15)
         
-        canvas = tk.Canvas(grid_scroll_frame, bg=Colors.LIGHT, relief='solid', bd=0, highlightthickness=0)
+        capacite = seance.salle.capacite
+        nb_rangees = (capacite + SIEGES_PAR_RANGEE - 1) // SIEGES_PAR_RANGEE
+        canvas = tk.Canvas(grid_scroll_frame, bg=Colors.LIGHT, relief='solid', bd=0, highlightthickness=0,
+                           cursor='hand2', yscrollincrement=PAS_SIEGE,
+                           scrollregion=(0, 0, SIEGES_PAR_RANGEE * PAS_SIEGE, nb_rangees * PAS_SIEGE))
         scrollbar = ttk.Scrollbar(grid_scroll_frame, orient='vertical', command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=Colors.LIGHT)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
@@ -1469,81 +1565,133 @@ class CinemaGUI:
         canvas.bind('<Enter>', lambda e, c=canvas: setattr(self, 'active_canvas', c))
         canvas.bind('<Leave>', lambda e: setattr(self, 'active_canvas', None))
         
-        grid_frame = scrollable_frame
-        
-        self._seat_vars = {}
-        self._seat_buttons = {}
-        self._selected_count = [0]  # Utilise une liste pour que la variable soit mutable dans les closures
+        self._places_choisies = set()
+        # Les sièges sélectionnés sont bloqués au fil des clics, pour qu'un
+        # autre guichet ne puisse pas les prendre avant la validation.
+        self._blocage = None
+        fonds = {}  # numéro -> rectangle des sièges dessinés
+        rangees_dessinees = set()
+        
+        def couleur(num):
+            if num in self._places_choisies:
+                return Colors.PRIMARY
+            if num in seance.places_occupees:
+                return Colors.DANGER
+            if num in seance.places_bloquees:
+                return Colors.WARNING
+            return Colors.SUCCESS
+        
+        def dessiner_rangees_visibles():
+            premiere = max(0, int(canvas.canvasy(0) // PAS_SIEGE))
+            derniere = min(nb_rangees, int(canvas.canvasy(canvas.winfo_height()) // PAS_SIEGE) + 1)
+            for rangee in [r for r in rangees_dessinees if not premiere <= r < derniere]:
+                canvas.delete(f'rangee{rangee}')
+                rangees_dessinees.discard(rangee)
+                for num in range(rangee * SIEGES_PAR_RANGEE + 1, (rangee + 1) * SIEGES_PAR_RANGEE + 1):
+                    fonds.pop(num, None)
+            for rangee in range(premiere, derniere):
+                if rangee in rangees_dessinees:
+                    continue
+                rangees_dessinees.add(rangee)
+                tag = f'rangee{rangee}'
+                y = rangee * PAS_SIEGE
+                for num in range(rangee * SIEGES_PAR_RANGEE + 1, min(capacite, (rangee + 1) * SIEGES_PAR_RANGEE) + 1):
+                    x = (num - 1) % SIEGES_PAR_RANGEE * PAS_SIEGE
+                    fonds[num] = canvas.create_rectangle(x + 3, y + 3, x + 3 + TAILLE_SIEGE, y + 3 + TAILLE_SIEGE,
+                                                         fill=couleur(num), outline=Colors.DARK, tags=(tag,))
+                    canvas.create_text(x + 3 + TAILLE_SIEGE / 2, y + 3 + TAILLE_SIEGE / 2, text=str(num),
+                                       fill='white', font=('Segoe UI', 10, 'bold'), tags=(tag,))
+        
+        def recolorer(num):
+            fond = fonds.get(num)
+            if fond is not None:
+                canvas.itemconfigure(fond, fill=couleur(num))
         
         def update_counter():
-            count = sum(1 for v in self._seat_vars.values() if v.get() == 1)
-            self._selected_count[0] = count
+            count = len(self._places_choisies)
             if count == nb:
                 counter_label.config(fg=Colors.SUCCESS, text=f'✅ Places sélectionnées: {count}/{nb}')
             else:
                 counter_label.config(fg=Colors.PRIMARY, text=f'Places sélectionnées: {count}/{nb}')
         
-        for num in range(1, seance.salle.capacite + 1):
-            var = tk.IntVar()
-            self._seat_vars[num] = var
-            
-            is_occupied = num in seance.places_occupees
-            
-            if is_occupied:
-                btn = tk.Label(grid_frame, text=str(num), width=5, height=3,
-                              bg=Colors.DANGER, fg='white',
-                              font=('Segoe UI', 10, 'bold'),
-                              relief='solid', bd=1)
-                self._seat_buttons[num] = btn
+        def on_seat_click(event):
+            colonne = int(canvas.canvasx(event.x) // PAS_SIEGE)
+            rangee = int(canvas.canvasy(event.y) // PAS_SIEGE)
+            num = rangee * SIEGES_PAR_RANGEE + colonne + 1
+            if not 0 <= colonne < SIEGES_PAR_RANGEE or not 1 <= num <= capacite:
+                return
+            if num in self._places_choisies:
+                self._places_choisies.discard(num)
             else:
-                def make_click_handler(n, v):
-                    def handler():
-                        current = v.get()
-                        if current == 0 and self._selected_count[0] >= nb:
-                            messagebox.showwarning('Limite atteinte', 
-                                f'Vous pouvez sélectionner maximum {nb} place(s)')
-                            return
-                        
-                        v.set(1 - current)
-                        btn = self._seat_buttons[n]
-                        if v.get() == 1:
-                            btn.config(bg=Colors.PRIMARY, fg='white')
-                        else:
-                            btn.config(bg=Colors.SUCCESS, fg='white')
-                        update_counter()
-                    return handler
-                
-                btn = tk.Button(grid_frame, text=str(num), width=5, height=3,
-                               bg=Colors.SUCCESS, fg='white',
-                               font=('Segoe UI', 10, 'bold'),
-                               relief='solid', bd=1, activebackground='#047857',
-                               activeforeground='white',
-                               command=make_click_handler(num, var))
-                self._seat_buttons[num] = btn
-                
-            row = (num - 1) // 10
-            col = (num - 1) % 10
-            btn.grid(row=row, column=col, padx=3, pady=3, sticky='nsew')
+                if num in seance.places_occupees or num in seance.places_bloquees:
+                    return
+                if len(self._places_choisies) >= nb:
+                    messagebox.showwarning('Limite atteinte', 
+                        f'Vous pouvez sélectionner maximum {nb} place(s)')
+                    return
+                self._places_choisies.add(num)
+            if not self._maj_blocage(seance, sorted(self._places_choisies)):
+                self._places_choisies ^= {num}
+            recolorer(num)
+            update_counter()
+        
+        def on_scroll(premier, dernier):
+            scrollbar.set(premier, dernier)
+            dessiner_rangees_visibles()
+        
+        canvas.configure(yscrollcommand=on_scroll)
+        canvas.bind('<Configure>', lambda e: dessiner_rangees_visibles())
+        canvas.bind('<Button-1>', on_seat_click)
         
         btn_frame = tk.Frame(window, bg=Colors.LIGHT)
         btn_frame.pack(fill='x', padx=20, pady=20)
         
+        def on_cancel():
+            self._maj_blocage(seance, [])
+            window.destroy()
+        
+        window.protocol('WM_DELETE_WINDOW', on_cancel)
         ttk.Button(btn_frame, text='❌ Annuler',
-                  command=window.destroy).pack(side='right', padx=(10, 0))
+                  command=on_cancel).pack(side='right', padx=(10, 0))
         
         validate_btn = ttk.Button(btn_frame, text='✅ Valider la Réservation',
                   command=lambda: self.validate_seats(window, nb),
                   style='Success.TButton')
         validate_btn.pack(side='right')
                   
+    def _maj_blocage(self, seance, places):
+        """
+        Aligne le blocage de la sélection en cours sur les sièges cochés.
+
+        Returns:
+            bool: False si un siège n'a pas pu être bloqué (pris entre-temps
+                à un autre guichet) ; la sélection doit alors être annulée.
+        """
+        try:
+            if not places:
+                if self._blocage is not None:
+                    self.service.annuler_blocage(self._blocage.id)
+                self._blocage = None
+            elif self._blocage is not None:
+                try:
+                    self.service.modifier_blocage(self._blocage.id, places)
+                except BlocageExpireException:
+                    self._blocage = self.service.bloquer_places(seance, len(places), places)
+            else:
+                self._blocage = self.service.bloquer_places(seance, len(places), places)
+        except CinemaException as e:
+            messagebox.showwarning('Place indisponible', str(e))
+            return False
+        return True
+
     def validate_seats(self, window, nb):
         """Valide la sélection des sièges et finalise la réservation."""
         seance = self.seance_selectionnee
         nom = self._reservation_en_cours["nom"]
         tarif = self._reservation_en_cours["tarif"]
         
-        places = [n for n, v in self._seat_vars.items()
-                 if v.get() == 1 and n not in seance.places_occupees]
+        places = [n for n in sorted(self._places_choisies)
+                 if n not in seance.places_occupees]
         
         if len(places) < nb:
             messagebox.showerror('Erreur', 
@@ -1558,8 +1706,14 @@ class CinemaGUI:
             return
             
         try:
-            reservation = self.service.creer_reservation_avec_seance(
-                self.seance_selectionnee, nom, nb, tarif, numeros_places=places)
+            try:
+                reservation = self.service.confirmer_blocage(self._blocage.id, nom, tarif)
+            except BlocageExpireException:
+                # Sélection restée trop longtemps sans activité : on tente
+                # de réserver directement les sièges s'ils sont encore libres.
+                reservation = self.service.creer_reservation_avec_seance(
+                    self.seance_selectionnee, nom, nb, tarif, numeros_places=places)
+            self._blocage = None
                 
             window.destroy()
             
@@ -1578,7 +1732,7 @@ class CinemaGUI:
             self._reservation_en_cours = None
             
             self.load_seances_beautifully()
-            self.load_reservations()
+            self.load_reservations(ajoutees=[reservation])
             self.load_stats()
             
         except CinemaException as e:
@@ -1586,27 +1740,101 @@ class CinemaGUI:
         except Exception as e:
             messagebox.showerror('Erreur', f'Erreur: {e}')
             
-    def load_reservations(self):
-        """Actualise l'affichage de l'historique des réservations."""
-        for i in self.reservations_treeview.get_children():
-            self.reservations_treeview.delete(i)
-        
-        if not self.service.reservations:
-            pass
+    def load_reservations(self, ajoutees=None, retirees=None):
+        """
+        Actualise l'affichage de l'historique des réservations.
+
+        Seules les différences avec l'affichage précédent sont appliquées :
+        une réservation nouvelle est insérée à sa place (trouvée par
+        dichotomie), une réservation annulée est retirée par son iid, et une
+        réservation dont la séance a changé (film, horaire ou salle) est
+        replacée. Les autres lignes ne sont pas touchées.
+
+        Args:
+            ajoutees (Optional[Iterable[Reservation]]): Les réservations
+                créées ou modifiées.
+            retirees (Optional[Iterable[str]]): Les identifiants des
+                réservations annulées.
+
+        Sans argument (construction de l'onglet, bouton Actualiser,
+        historique vidé), tout l'historique du service est comparé à
+        l'affichage ; sinon, seules les réservations indiquées sont
+        traitées, sans parcourir l'historique.
+        """
+        if not hasattr(self, 'reservations_treeview'):
+            return  # Onglet pas encore construit
+
+        lignes = self._lignes_reservations
+        if ajoutees is None and retirees is None:
+            a_retirer = set(lignes)
+            ajoutees = self.service.reservations
         else:
-            for i, res in enumerate(sorted(self.service.reservations, key=lambda r: r.seance.horaire, reverse=True)):
-                tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-                sieges_str = ', '.join(map(str, sorted(res.numeros_places))) if res.numeros_places else f"{res.nb_places} place(s)"
-                values = (
-                    res.id,
-                    res.seance.film.titre,
-                    res.seance.horaire.strftime('%d/%m/%Y'),
-                    res.seance.horaire.strftime('%H:%M'),
-                    res.seance.salle.nom,
-                    sieges_str,
-                    f"{res.prix_total:.2f} €"
-                )
-                self.reservations_treeview.insert('', 'end', iid=res.id, values=values, tags=(tag,))
+            a_retirer = {iid for iid in retirees or () if iid in lignes}
+            ajoutees = ajoutees or ()
+        a_inserer = []
+        for res in ajoutees:
+            seance = res.seance
+            signature = (seance.film.titre, seance.horaire, seance.salle.nom)
+            ligne = lignes.get(res.id)
+            if ligne is not None:
+                a_retirer.discard(res.id)
+                if ligne[0] == signature:
+                    continue
+                a_retirer.add(res.id)  # Séance modifiée : la ligne est replacée
+            a_inserer.append((res, signature, ligne[1][1] if ligne is not None else -next(self._rangs_reservations)))
+
+        if len(a_inserer) > SEUIL_RECONSTRUCTION_HISTORIQUE:
+            self._reconstruire_reservations(a_inserer, a_retirer)
+            return
+        if a_retirer:
+            self.reservations_treeview.delete(*a_retirer)
+            for iid in a_retirer:
+                cle = lignes.pop(iid)[1]
+                del self._ordre_reservations[bisect.bisect_left(self._ordre_reservations, cle)]
+        for res, signature, rang in a_inserer:
+            cle = (signature[1], rang, res.id)
+            position = bisect.bisect(self._ordre_reservations, cle)
+            index = len(self._ordre_reservations) - position
+            self._ordre_reservations.insert(position, cle)
+            lignes[res.id] = (signature, cle, self._valeurs_reservation(res))
+            self._inserer_ligne(lignes[res.id], index)
+
+    def _reconstruire_reservations(self, a_inserer, a_retirer):
+        """Réaffiche tout l'historique, pour un grand nombre de changements."""
+        lignes = self._lignes_reservations
+        for iid in a_retirer:
+            del lignes[iid]
+        for res, signature, rang in a_inserer:
+            lignes[res.id] = (signature, (signature[1], rang, res.id), self._valeurs_reservation(res))
+        self._ordre_reservations = sorted(ligne[1] for ligne in lignes.values())
+
+        tree = self.reservations_treeview
+        tree.delete(*tree.get_children())
+        for cle in reversed(self._ordre_reservations):
+            self._inserer_ligne(lignes[cle[2]], 'end')
+
+    def _inserer_ligne(self, ligne, index):
+        signature, cle, values = ligne
+        tag = 'evenrow' if signature[1].toordinal() % 2 == 0 else 'oddrow'
+        self.reservations_treeview.insert('', index, iid=cle[2], values=values, tags=(tag,))
+
+    def _valeurs_reservation(self, res):
+        """Les valeurs affichées dans l'historique pour une réservation."""
+        horaire = res.seance.horaire
+        # Les dates et heures sont formatées une fois par horaire de séance.
+        formats = self._horaires_formates.get(horaire)
+        if formats is None:
+            formats = self._horaires_formates[horaire] = (horaire.strftime('%d/%m/%Y'), horaire.strftime('%H:%M'))
+        sieges_str = ', '.join(map(str, sorted(res.numeros_places))) if res.numeros_places else f"{res.nb_places} place(s)"
+        return (
+            res.id,
+            res.seance.film.titre,
+            formats[0],
+            formats[1],
+            res.seance.salle.nom,
+            sieges_str,
+            f"{res.prix_total:.2f} €"
+        )
 
     def annuler_reservation_selectionnee(self):
         """Gère l'annulation d'une réservation sélectionnée dans l'historique."""
@@ -1624,7 +1852,7 @@ class CinemaGUI:
             
             if success:
                 messagebox.showinfo('✅ Succès', 'La réservation a été annulée avec succès.')
-                self.load_reservations()
+                self.load_reservations(retirees=[reservation_id])
                 self.load_stats()
                 self.load_rapports()
                 self.load_seances_beautifully()
@@ -1639,10 +1867,7 @@ class CinemaGUI:
             
         if messagebox.askyesno('⚠️ Confirmation',
                               'Êtes-vous sûr de vouloir effacer TOUTES les réservations ?\nCette action est irréversible.'):
-            for reservation in self.service.reservations:
-                reservation.seance.liberer_places(reservation.nb_places, reservation.numeros_places)
-
-            self.service.reservations.clear()
+            self.service.vider_reservations()
             messagebox.showinfo('✅ Succès', 'Toutes les réservations ont été effacées.')
             
             self.load_reservations()
@@ -1711,12 +1936,13 @@ class CinemaGUI:
                 poster_path = f"assets/posters/{poster_filename}"
 
             film = Film(titre=nom, duree=duree, style=genre_enum, note=note, poster_path=poster_path, resume=resume or "Pas de synopsis")
-            self.service.films.append(film)
+            self.service.ajouter_film(film)
             
-            self.service.creer_seances_pour_film(film)
+            seances = self.service.creer_seances_pour_film(film)
+            self._prechauffer_affiches([film])
             
             messagebox.showinfo('Succes', 
-                f'Film: {nom}\nDuree: {duree}min\nGenre: {genre_str}\nNote: {note}/10\n\nSeances creees automatiquement!\nMaintenant, creez une salle!')
+                f'Film: {nom}\nDuree: {duree}min\nGenre: {genre_str}\nNote: {note}/10\n\n{len(seances)} seances creees automatiquement!\nMaintenant, creez une salle!')
             
             # Reinitialiser le formulaire
             self.mgr_film_nom.delete(0, tk.END)
@@ -1767,7 +1993,7 @@ class CinemaGUI:
         for i in self.mgr_seances_treeview.get_children():
             self.mgr_seances_treeview.delete(i)
 
-        all_seances = sorted(self._get_seances_with_rebuilt_occupancy(), key=lambda s: s.horaire)
+        all_seances = self.service.get_seances_chronologiques()
         
         seances_par_jour = {}
         for seance in all_seances:
@@ -1878,15 +2104,14 @@ class CinemaGUI:
         
         def save_changes():
             try:
-                film.titre = titre_entry.get().strip()
-                film.duree = int(duree_spinbox.get())
-                film.note = float(note_spinbox.get())
-                film.resume = synopsis_text.get("1.0", tk.END).strip()
-                
-                for g in StyleFilm:
-                    if g.value == genre_combo.get():
-                        film.style = g
-                        break
+                style = next((g for g in StyleFilm if g.value == genre_combo.get()), None)
+                self.service.modifier_film(film,
+                                           titre=titre_entry.get().strip(),
+                                           duree=int(duree_spinbox.get()),
+                                           note=float(note_spinbox.get()),
+                                           resume=synopsis_text.get("1.0", tk.END).strip(),
+                                           style=style)
+                self._prechauffer_affiches([film])
                 
                 messagebox.showinfo('✅ Succès', 'Film modifié avec succès!')
                 self.load_manager_films_list()
@@ -1914,10 +2139,8 @@ class CinemaGUI:
         
         if messagebox.askyesno('Confirmation', 
                               f'Êtes-vous sûr de vouloir supprimer "{film.titre}"?\n\nCette action supprimera aussi toutes ses séances.'):
-            # Supprimer les séances du film
-            self.service.seances = [s for s in self.service.seances if s.film.titre != film.titre]
-            # Supprimer le film
-            del self.service.films[film_index]
+            # Supprimer le film et ses séances
+            self.service.supprimer_film(film)
             
             # Si le film supprimé était celui sélectionné, on réinitialise la vue
             if self._seances_tab_selected_film_titre == film.titre:
@@ -1984,24 +2207,17 @@ class CinemaGUI:
                     f'La salle "{salle_nom}" n\'existe pas.\nCréez-la d\'abord dans l\'onglet Salles.')
                 return
                 
-            # Créer la séance avec un ID unique
-            from models.seance import Seance
-            seance_id = f"S{len(self.service.seances)+1:02d}"
-            # seance = Seance(id=seance_id, film=film, salle=salle, horaire=horaire) <-- Bug: doublon
-            nouvelle_seance = Seance(id=seance_id, film=film, salle=salle, horaire=horaire)
-
             # --- VÉRIFICATION ANTI-CONFLIT ---
-            seance_en_conflit = self.service.verifier_conflit_seance(nouvelle_seance)
-            if seance_en_conflit:
+            conflits = self.service.lister_conflits(salle, horaire, film.duree)
+            if conflits:
                 messagebox.showerror('❌ Conflit de programmation',
                     f"Impossible de créer cette séance.\n\n"
-                    f"La salle '{salle.nom}' est déjà occupée à ce créneau par le film "
-                    f"'{seance_en_conflit.film.titre}' à "
-                    f"{seance_en_conflit.horaire.strftime('%H:%M')}.")
+                    f"La salle '{salle.nom}' est déjà occupée à ce créneau par :\n"
+                    f"{self._format_conflits(conflits)}")
                 return
             # --- FIN DE LA VÉRIFICATION ---
 
-            self.service.seances.append(nouvelle_seance)
+            self.service.creer_seance(film, salle, horaire)
             
             messagebox.showinfo('Succes',
                 f'Film: {film_titre}\nSalle: {salle_nom}\nDate: {date_str}\nHeure: {heure_str}\n\nSeance creee! Allez a Seances.')
@@ -2019,6 +2235,11 @@ class CinemaGUI:
         except Exception as e:
             messagebox.showerror('❌ Erreur système', f'Impossible de créer la séance:\n{str(e)}')
     
+    def _format_conflits(self, conflits):
+        """Formate la liste des séances en conflit pour un message d'erreur."""
+        return '\n'.join(f"• '{c.film.titre}' de {c.horaire.strftime('%H:%M')} à {c.fin.strftime('%H:%M')}"
+                         for c in conflits)
+
     def mgr_modifier_seance(self):
         """Modifie une séance sélectionnée"""
         selection = self.mgr_seances_treeview.selection()
@@ -2027,7 +2248,7 @@ class CinemaGUI:
             return
         
         seance_id = selection[0]
-        seance = next((s for s in self.service.seances if s.id == seance_id), None)
+        seance = self.service.get_seance(seance_id)
         
         if not seance:
             messagebox.showwarning('⚠️ Sélection invalide', 'Veuillez sélectionner une séance spécifique (une ligne avec une heure), et non un jour ou un titre de film.')
@@ -2094,9 +2315,15 @@ class CinemaGUI:
                 
                 horaire = datetime.strptime(f"{date_entry.get()} {heure_entry.get()}", "%Y-%m-%d %H:%M")
                 
-                seance.film = film
-                seance.salle = salle
-                seance.horaire = horaire
+                conflits = self.service.lister_conflits(salle, horaire, film.duree, exclure=seance)
+                if conflits:
+                    messagebox.showerror('❌ Conflit de programmation',
+                        f"Impossible de modifier cette séance.\n\n"
+                        f"La salle '{salle.nom}' est déjà occupée à ce créneau par :\n"
+                        f"{self._format_conflits(conflits)}")
+                    return
+                
+                self.service.modifier_seance(seance, film=film, salle=salle, horaire=horaire)
                 
                 messagebox.showinfo('✅ Succès', 'Séance modifiée avec succès!')
                 self.load_manager_seances_list()
@@ -2119,7 +2346,7 @@ class CinemaGUI:
             return
         
         seance_id = selection[0]
-        seance = next((s for s in self.service.seances if s.id == seance_id), None)
+        seance = self.service.get_seance(seance_id)
         
         if not seance:
             messagebox.showwarning('⚠️ Sélection invalide', 'Veuillez sélectionner une séance spécifique (une ligne avec une heure), et non un jour ou un titre de film.')
@@ -2127,14 +2354,7 @@ class CinemaGUI:
         
         if messagebox.askyesno('Confirmation',
                               f'Êtes-vous sûr de vouloir supprimer cette séance?\n\n{seance.film.titre} - {seance.horaire.strftime("%d/%m/%Y à %H:%M")}'):
-            seance_index_to_delete = -1
-            for i, s_item in enumerate(self.service.seances):
-                if s_item.id == seance_id:
-                    seance_index_to_delete = i
-                    break
-            
-            if seance_index_to_delete != -1:
-                del self.service.seances[seance_index_to_delete]
+            if self.service.supprimer_seance(seance):
                 messagebox.showinfo('✅ Succès', 'Séance supprimée!')
                 self.load_manager_seances_list()
                 self.load_seances_beautifully()
@@ -2178,11 +2398,8 @@ class CinemaGUI:
                 messagebox.showerror('❌ Erreur', f'Type "{type_str}" non trouvé')
                 return
             
-            from models.salle import Salle
-            # Générer un numéro unique (basé sur le nombre de salles existantes)
-            numero = len(self.service.salles) + 1
-            salle = Salle(numero=numero, nom=nom, capacite=capacite, type_salle=type_enum)
-            self.service.salles.append(salle)
+            # Le service attribue un numéro de salle unique
+            self.service.creer_salle(nom, capacite, type_enum)
             
             messagebox.showinfo('Succes', 
                 f'Nom: {nom}\nCapacite: {capacite} places\nType: {type_str}\n\nMaintenant, creez une seance!')
@@ -2256,13 +2473,11 @@ class CinemaGUI:
         
         def save_changes():
             try:
-                salle.nom = nom_entry.get().strip()
-                salle.capacite = int(capacite_spinbox.get())
-                
-                for t in TypeSalle:
-                    if t.value == type_combo.get():
-                        salle.type_salle = t
-                        break
+                type_salle = next((t for t in TypeSalle if t.value == type_combo.get()), None)
+                self.service.modifier_salle(salle,
+                                            nom=nom_entry.get().strip(),
+                                            capacite=int(capacite_spinbox.get()),
+                                            type_salle=type_salle)
                 
                 messagebox.showinfo('✅ Succès', 'Salle modifiée avec succès!')
                 self.load_manager_salles_list()
@@ -2290,10 +2505,8 @@ class CinemaGUI:
         
         if messagebox.askyesno('Confirmation',
                               f'Êtes-vous sûr de vouloir supprimer la salle "{salle.nom}"?\n\nCette action supprimera aussi toutes ses séances.'):
-            # Supprimer les séances de la salle
-            self.service.seances = [s for s in self.service.seances if s.salle != salle]
-            # Supprimer la salle
-            del self.service.salles[salle_index]
+            # Supprimer la salle et ses séances
+            self.service.supprimer_salle(salle)
             
             messagebox.showinfo('✅ Succès', f'Salle "{salle.nom}" supprimée!')
             self.load_manager_salles_list()
@@ -2309,9 +2522,8 @@ class CinemaGUI:
         for i in self.mgr_tarifs_treeview.get_children():
             self.mgr_tarifs_treeview.delete(i)
         
-        PRIX_BASE = 10.00
         for i, tarif in enumerate(self.service.tarifs):
-            exemple_prix = PRIX_BASE * tarif.coeff
+            exemple_prix = self.service.prix_place(TypeSalle.CLASSIQUE, tarif)
             values = (
                 tarif.label,
                 f"{tarif.coeff:.2f} (soit {tarif.coeff:.0%})",
@@ -2336,7 +2548,7 @@ class CinemaGUI:
             return
 
         new_tarif = Tarif(label=label, coeff=coeff)
-        self.service.tarifs.append(new_tarif)
+        self.service.ajouter_tarif(new_tarif)
         
         messagebox.showinfo('✅ Succès', f'Le tarif "{label}" a été créé avec succès.')
         
@@ -2377,8 +2589,9 @@ class CinemaGUI:
         coeff_spinbox.pack(anchor='w', pady=(0, 20))
 
         def save_changes():
-            tarif.label = label_entry.get().strip()
-            tarif.coeff = float(coeff_spinbox.get())
+            self.service.modifier_tarif(tarif,
+                                        label=label_entry.get().strip(),
+                                        coeff=float(coeff_spinbox.get()))
             messagebox.showinfo('✅ Succès', 'Tarif modifié.')
             self.load_manager_tarifs_list()
             self.tarif_combo['values'] = [str(t) for t in self.service.tarifs]
@@ -2398,7 +2611,7 @@ class CinemaGUI:
         tarif = self.service.tarifs[tarif_index]
 
         if messagebox.askyesno('Confirmation', f'Êtes-vous sûr de vouloir supprimer le tarif "{tarif.label}"?'):
-            del self.service.tarifs[tarif_index]
+            self.service.supprimer_tarif(tarif)
             messagebox.showinfo('✅ Succès', 'Tarif supprimé.')
             self.load_manager_tarifs_list()
             self.tarif_combo['values'] = [str(t) for t in self.service.tarifs]
@@ -2448,6 +2661,20 @@ class CinemaGUI:
                 for tarif, places in sorted(stats['repartition_tarifs'].items()):
                     pourcentage = (places / total_places) * 100 if total_places > 0 else 0
                     self.rapports_treeview.insert(tarifs_id, 'end', text=f"  {tarif}", values=(f"{places} places", f"{pourcentage:.1f}%"))
+
+                # --- Sections calculées sur le registre des réservations ---
+                salles_id = self.rapports_treeview.insert('', 'end', text='🏛️ Revenus par Salle', open=True)
+                for salle, data in sorted(self.service.get_revenus('salle').items(), key=lambda item: item[1]['revenus'], reverse=True):
+                    self.rapports_treeview.insert(salles_id, 'end', text=f"  {salle}", values=(f"{data['places']} places", f"{data['revenus']:.2f} €"))
+
+                heures_id = self.rapports_treeview.insert('', 'end', text='🕒 Ventes par Heure', open=False)
+                for heure, data in sorted(self.service.get_revenus('heure').items()):
+                    self.rapports_treeview.insert(heures_id, 'end', text=f"  {heure:02d}h - {heure + 1:02d}h", values=(f"{data['places']} places", f"{data['revenus']:.2f} €"))
+
+                debut_semaine = datetime.combine(datetime.now().date() - timedelta(days=6), datetime.min.time())
+                jours_id = self.rapports_treeview.insert('', 'end', text='📅 Revenus des 7 Derniers Jours', open=True)
+                for jour, data in sorted(self.service.get_revenus('jour', debut=debut_semaine).items()):
+                    self.rapports_treeview.insert(jours_id, 'end', text=f"  {jour.strftime('%d/%m/%Y')}", values=(f"{data['places']} places", f"{data['revenus']:.2f} €"))
             else:
                 self.rapports_treeview.insert('', 'end', text='📭 Aucune réservation pour le moment.', values=('', 'Les rapports s\'afficheront ici.', ''))
             
@@ -2493,8 +2720,9 @@ class CinemaGUI:
 
 def main():
     root = tk.Tk()
-    app = CinemaGUI(root)
+    app = CinemaGUI(root, fabrique_service=CinemaService)
     root.mainloop()
+    app.cache_affiches.arreter()
 
 
 if __name__ == '__main__':
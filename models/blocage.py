@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+import time
+import uuid
+from typing import List
+
+from .seance import Seance
+
+# Durée de vie d'un blocage sans activité, en secondes.
+DUREE_BLOCAGE = 300.0
+
+
+@dataclass
+class Blocage:
+    """
+    Représente des sièges mis de côté, pour une durée limitée, le temps
+    qu'un client finalise sa réservation.
+
+    Tant que le blocage est actif, ses sièges ne peuvent être ni réservés ni
+    bloqués par un autre guichet. À son expiration, ils redeviennent libres.
+
+    Attributes:
+        seance (Seance): La séance concernée.
+        numeros_places (List[int]): Les numéros des sièges bloqués.
+        expiration (float): L'instant d'expiration, sur l'horloge
+            `time.monotonic()`.
+        id (str): Un identifiant unique généré pour le blocage.
+    """
+    seance: Seance
+    numeros_places: List[int]
+    expiration: float
+    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+
+    @property
+    def secondes_restantes(self) -> float:
+        """Le temps restant avant l'expiration du blocage (0 s'il a expiré)."""
+        return max(0.0, self.expiration - time.monotonic())
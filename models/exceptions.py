@@ -21,4 +21,11 @@ class FilmIntrouvableException(CinemaException):
     Levée lorsqu'une opération tente d'accéder à un film qui n'existe pas
     dans le catalogue.
     """
+    pass
+
+class BlocageExpireException(CinemaException):
+    """
+    Levée lorsqu'une opération vise un blocage de places qui a expiré,
+    qui a déjà été confirmé ou qui n'existe pas.
+    """
     pass
\ No newline at end of file
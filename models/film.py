@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from .enums import StyleFilm
 
-@dataclass
+@dataclass(slots=True)
 class Film:
     """
     Représente un film dans le catalogue du cinéma.
@@ -0,0 +1,180 @@
+from collections.abc import MutableSet
+from typing import Iterable, Iterator, List, Tuple
+
+# Disposition des salles : le plan de sélection des sièges affiche 10 sièges
+# par rangée, la rangée 0 (sièges 1 à 10) étant la plus proche de l'écran.
+SIEGES_PAR_RANGEE = 10
+MASQUE_RANGEE = (1 << SIEGES_PAR_RANGEE) - 1
+# Position de la rangée idéale, en fraction de la profondeur de la salle.
+RANGEE_IDEALE = 0.6
+
+
+def _plages_libres(motif: int) -> Tuple[Tuple[int, int], ...]:
+    """Plages de bits à 1 d'un motif de rangée : couples (premier bit, longueur)."""
+    plages = []
+    i = 0
+    while i < SIEGES_PAR_RANGEE:
+        if (motif >> i) & 1:
+            j = i
+            while j < SIEGES_PAR_RANGEE and (motif >> j) & 1:
+                j += 1
+            plages.append((i, j - i))
+            i = j
+        else:
+            i += 1
+    return tuple(plages)
+
+
+# Plages de sièges libres pré-calculées pour chacun des 1024 motifs de rangée.
+_PLAGES = tuple(_plages_libres(m) for m in range(1 << SIEGES_PAR_RANGEE))
+
+
+class PlanSieges(MutableSet):
+    """
+    Ensemble des sièges occupés d'une séance, stocké sous forme de bitmap.
+
+    Le siège numéro `n` (à partir de 1) correspond au bit `n - 1` d'un entier
+    Python. Une salle de 600 places tient ainsi dans une centaine d'octets,
+    contre plusieurs kilo-octets pour un `set[int]`. La classe se comporte
+    comme un ensemble (`in`, itération, `len`, `update`, ...) pour rester
+    compatible avec le code existant, et expose en plus des opérations par
+    masque pour réserver ou libérer un lot de sièges en une seule opération
+    bit à bit.
+
+    Attributes:
+        bits (int): Le bitmap des sièges occupés.
+    """
+    __slots__ = ('bits',)
+
+    def __init__(self, numeros: Iterable[int] = ()):
+        self.bits = self.masque(numeros)
+
+    @staticmethod
+    def masque(numeros: Iterable[int]) -> int:
+        """Construit le masque de bits correspondant à une liste de numéros."""
+        masque = 0
+        for n in numeros:
+            masque |= 1 << (n - 1)
+        return masque
+
+    @staticmethod
+    def numeros(masque: int) -> Iterator[int]:
+        """Énumère, dans l'ordre croissant, les numéros de siège d'un masque."""
+        while masque:
+            bas = masque & -masque
+            yield bas.bit_length()
+            masque ^= bas
+
+    def ajouter_masque(self, masque: int):
+        """Marque comme occupés tous les sièges du masque."""
+        self.bits |= masque
+
+    def retirer_masque(self, masque: int) -> int:
+        """
+        Libère tous les sièges du masque.
+
+        Returns:
+            int: Le nombre de sièges qui étaient effectivement occupés.
+        """
+        liberes = self.bits & masque
+        self.bits ^= liberes
+        return liberes.bit_count()
+
+    def conflits(self, masque: int) -> int:
+        """Retourne le masque des sièges demandés qui sont déjà occupés."""
+        return self.bits & masque
+
+    def libres(self, capacite: int) -> int:
+        """Nombre de sièges libres dans une salle de `capacite` places."""
+        return capacite - self.bits.bit_count()
+
+    def meilleur_bloc(self, nombre: int, capacite: int) -> List[int]:
+        """
+        Choisit les meilleurs sièges libres pour un groupe de `nombre` personnes.
+
+        Les sièges sont cherchés d'un seul tenant dans une même rangée. Un bloc
+        est d'autant meilleur que sa rangée est proche de la rangée idéale
+        (aux 3/5 de la salle en partant de l'écran) et qu'il est centré dans
+        sa rangée. Chaque rangée est lue comme un motif de 10 bits dont les
+        plages libres sont pré-calculées : la recherche coûte une consultation
+        de table par rangée, soit O(capacite / 10).
+
+        Si aucune rangée n'offre assez de sièges contigus, les meilleurs
+        sièges libres sont attribués individuellement.
+
+        Args:
+            nombre (int): Le nombre de sièges voulus.
+            capacite (int): La capacité de la salle.
+
+        Returns:
+            List[int]: Les numéros attribués, triés ; vide s'il n'y a pas
+                assez de sièges libres.
+        """
+        libres = ~self.bits & ((1 << capacite) - 1)
+        if nombre <= 0 or libres.bit_count() < nombre:
+            return []
+
+        rangees = -(-capacite // SIEGES_PAR_RANGEE)
+        rangee_ideale = (rangees - 1) * RANGEE_IDEALE
+        meilleur_score, meilleur_debut = None, 0
+        if nombre <= SIEGES_PAR_RANGEE:
+            for rangee in range(rangees):
+                motif = (libres >> (rangee * SIEGES_PAR_RANGEE)) & MASQUE_RANGEE
+                largeur = min(SIEGES_PAR_RANGEE, capacite - rangee * SIEGES_PAR_RANGEE)
+                # Premier siège d'un bloc parfaitement centré dans la rangée
+                centre = (largeur - nombre) / 2
+                for debut, longueur in _PLAGES[motif]:
+                    if longueur < nombre:
+                        continue
+                    # Position, dans la plage, la plus proche du centre
+                    position = min(max(round(centre), debut), debut + longueur - nombre)
+                    score = abs(rangee - rangee_ideale) + 2 * abs(position - centre) / SIEGES_PAR_RANGEE
+                    if meilleur_score is None or score < meilleur_score:
+                        meilleur_score = score
+                        meilleur_debut = rangee * SIEGES_PAR_RANGEE + position
+            if meilleur_score is not None:
+                return list(range(meilleur_debut + 1, meilleur_debut + nombre + 1))
+
+        def score_siege(numero: int) -> float:
+            rangee, colonne = divmod(numero - 1, SIEGES_PAR_RANGEE)
+            largeur = min(SIEGES_PAR_RANGEE, capacite - rangee * SIEGES_PAR_RANGEE)
+            return abs(rangee - rangee_ideale) + 2 * abs(colonne - (largeur - 1) / 2) / SIEGES_PAR_RANGEE
+
+        return sorted(sorted(self.numeros(libres), key=score_siege)[:nombre])
+
+    # --- Interface d'ensemble (collections.abc.MutableSet) ---
+
+    def __contains__(self, numero) -> bool:
+        return isinstance(numero, int) and numero >= 1 and (self.bits >> (numero - 1)) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        return self.numeros(self.bits)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def add(self, numero: int):
+        self.bits |= 1 << (numero - 1)
+
+    def discard(self, numero: int):
+        if numero >= 1:
+            self.bits &= ~(1 << (numero - 1))
+
+    def update(self, numeros: Iterable[int]):
+        """Équivalent de `set.update`."""
+        self.bits |= self.masque(numeros)
+
+    def difference_update(self, numeros: Iterable[int]):
+        """Équivalent de `set.difference_update`."""
+        self.bits &= ~self.masque(n for n in numeros if n >= 1)
+
+    def clear(self):
+        self.bits = 0
+
+    def copy(self) -> 'PlanSieges':
+        plan = PlanSieges()
+        plan.bits = self.bits
+        return plan
+
+    def __repr__(self):
+        return f"PlanSieges({sorted(self)})"
@@ -1,11 +1,17 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+import sys
+import time
 import uuid
-from typing import List
+from typing import List, Optional
 
+from .enums import TypeSalle
+from .salle import supplement_type
 from .seance import Seance
 
-@dataclass
+PRIX_BASE = 10.00
+
+@dataclass(slots=True)
 class Tarif:
     """
     Représente un type de tarif avec un coefficient de réduction.
@@ -22,19 +28,40 @@ class Tarif:
         """Retourne une représentation textuelle du tarif."""
         return f"{self.label} ({self.coeff*100:.0f}%)"
 
-@dataclass
+
+def calculer_prix_unitaire(type_salle: TypeSalle, tarif: Tarif) -> float:
+    """
+    Calcule le prix d'une place : prix de base, plus le supplément du type
+    de salle, multiplié par le coefficient du tarif.
+    """
+    return (PRIX_BASE + supplement_type(type_salle)) * tarif.coeff
+
+@dataclass(slots=True)
 class Reservation:
     """
     Représente une réservation effectuée par un client pour une séance.
 
+    L'historique peut compter des millions de réservations : la classe n'a
+    pas de `__dict__`, le nom du client est internalisé (un même client ne
+    coûte qu'une chaîne pour toutes ses réservations) et la date de création
+    est stockée en horodatage POSIX plutôt qu'en `datetime`.
+
+    Le prix d'une place est figé à la création : modifier ensuite le tarif
+    ou le type de la salle ne change pas le prix des réservations passées.
+
     Attributes:
         seance (Seance): La séance concernée par la réservation.
         client_nom (str): Le nom du client ayant effectué la réservation.
         nb_places (int): Le nombre de places réservées.
         tarif (Tarif): Le tarif appliqué.
         numeros_places (List[int]): Liste des numéros de sièges spécifiques.
-        id (str): Un identifiant unique généré pour la réservation.
-        date_creation (datetime): La date et l'heure de la création de la réservation.
+        id (str): Un identifiant unique pour la réservation ; le service
+            attribue un numéro de billet (voir `services.identifiants`).
+        horodatage (float): L'instant de la création de la réservation, en
+            secondes depuis l'epoch (voir `date_creation`).
+        prix_unitaire (float): Le prix d'une place au moment de la
+            réservation ; calculé à partir de la salle et du tarif s'il
+            n'est pas fourni.
     """
     seance: Seance
     client_nom: str
@@ -42,19 +69,23 @@ class Reservation:
     tarif: Tarif
     numeros_places: List[int] = field(default_factory=list)
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    date_creation: datetime = field(default_factory=datetime.now)
+    horodatage: float = field(default_factory=time.time)
+    prix_unitaire: Optional[float] = None
+
+    def __post_init__(self):
+        self.client_nom = sys.intern(self.client_nom)
+        if self.prix_unitaire is None:
+            self.prix_unitaire = calculer_prix_unitaire(self.seance.salle.type_salle, self.tarif)
 
     @property
-    def prix_total(self) -> float:
-        """
-        Calcule le prix total de la réservation.
+    def date_creation(self) -> datetime:
+        """La date et l'heure (locales) de la création de la réservation."""
+        return datetime.fromtimestamp(self.horodatage)
 
-        Le calcul se base sur un prix de base, un éventuel supplément de salle,
-        le coefficient du tarif et le nombre de places.
-        """
-        PRIX_BASE = 10.00
-        prix_unitaire = (PRIX_BASE + self.seance.salle.supplement_prix) * self.tarif.coeff
-        return round(prix_unitaire * self.nb_places, 2)
+    @property
+    def prix_total(self) -> float:
+        """Le prix total de la réservation : prix unitaire figé × nombre de places."""
+        return round(self.prix_unitaire * self.nb_places, 2)
 
     def __str__(self):
         """Retourne une représentation textuelle formatée du ticket de réservation."""
@@ -66,4 +97,49 @@ class Reservation:
             f"Horaire : {self.seance.horaire.strftime('%d/%m à %H:%M')}\n"
             f"Places : {self.nb_places} x {self.tarif.label}{sieges_str}\n"
             f"TOTAL : {self.prix_total} €"
-        )
\ No newline at end of file
+        )
+
+@dataclass
+class DemandeReservation:
+    """
+    Une ligne d'une réservation groupée (voir `CinemaService.creer_reservations_bulk`).
+
+    Attributes:
+        seance (Seance): La séance à réserver.
+        client_nom (str): Le nom du client.
+        tarif (Tarif): Le tarif appliqué.
+        nb_places (int): Le nombre de places ; par défaut, le nombre de sièges
+            de `numeros_places`.
+        numeros_places (Optional[List[int]]): Les sièges choisis, ou None pour
+            une réservation sans placement.
+    """
+    seance: Seance
+    client_nom: str
+    tarif: Tarif
+    nb_places: int = 0
+    numeros_places: Optional[List[int]] = None
+
+    def __post_init__(self):
+        if not self.nb_places and self.numeros_places is not None:
+            self.nb_places = len(self.numeros_places)
+
+@dataclass
+class ResultatReservation:
+    """
+    Le résultat d'une ligne de réservation groupée.
+
+    Attributes:
+        demande (DemandeReservation): La ligne concernée.
+        reservation (Optional[Reservation]): La réservation créée, ou None si
+            le lot a été refusé.
+        erreur (Optional[str]): La raison du refus de cette ligne, ou None si
+            elle était valide.
+    """
+    demande: DemandeReservation
+    reservation: Optional[Reservation] = None
+    erreur: Optional[str] = None
+
+    @property
+    def succes(self) -> bool:
+        """Vrai si la réservation a été créée."""
+        return self.reservation is not None
\ No newline at end of file
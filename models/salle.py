@@ -1,7 +1,16 @@
 from dataclasses import dataclass
 from .enums import TypeSalle
 
-@dataclass
+# Les salles spéciales entraînent une majoration du prix de la place.
+TYPES_PREMIUM = frozenset({TypeSalle.IMAX, TypeSalle.DOLBY, TypeSalle.TROIS_D})
+SUPPLEMENT_PREMIUM = 2.50
+
+
+def supplement_type(type_salle: TypeSalle) -> float:
+    """Le supplément de prix, en euros, d'un type de salle."""
+    return SUPPLEMENT_PREMIUM if type_salle in TYPES_PREMIUM else 0.0
+
+@dataclass(slots=True)
 class Salle:
     """
     Représente une salle de cinéma.
@@ -25,9 +34,7 @@ class Salle:
 
         Les salles spéciales (IMAX, Dolby, 3D) entraînent une majoration.
         """
-        if self.type_salle in [TypeSalle.IMAX, TypeSalle.DOLBY, TypeSalle.TROIS_D]:
-            return 2.50
-        return 0.0
+        return supplement_type(self.type_salle)
 
     def __str__(self):
         """Retourne une représentation textuelle de la salle."""
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from .film import Film
 from .salle import Salle
 from .exceptions import SallePleineException
+from .plan_sieges import PlanSieges
 from dataclasses import dataclass, field
-from typing import Set, List, Optional
+from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Seance:
     """
     Représente une projection unique d'un film dans une salle à un horaire donné.
@@ -17,33 +18,48 @@ class Seance:
         salle (Salle): L'objet Salle où a lieu la projection.
         horaire (datetime): La date et l'heure exactes du début de la séance.
         places_reservees (int): Le nombre total de places actuellement réservées.
-        places_occupees (Set[int]): L'ensemble des numéros de sièges spécifiques
-            qui sont occupés.
+        places_occupees (PlanSieges): L'ensemble des numéros de sièges spécifiques
+            qui sont occupés, stocké sous forme de bitmap.
+        places_bloquees (PlanSieges): Les sièges momentanément mis de côté par
+            un blocage (voir `Blocage`) : ni réservés, ni disponibles.
     """
     id: str
     film: Film
     salle: Salle
     horaire: datetime
     places_reservees: int = 0
-    places_occupees: Set[int] = field(default_factory=set)
+    places_occupees: PlanSieges = field(default_factory=PlanSieges)
+    places_bloquees: PlanSieges = field(default_factory=PlanSieges)
 
     @property
     def places_disponibles(self) -> int:
         """Calcule le nombre de places restantes pour la séance."""
-        return self.salle.capacite - self.places_reservees
+        return self.salle.capacite - self.places_reservees - len(self.places_bloquees)
+
+    @property
+    def fin(self) -> datetime:
+        """Calcule l'heure de fin de la séance à partir de la durée du film."""
+        return self.horaire + timedelta(minutes=self.film.duree)
 
     @property
     def est_complete(self) -> bool:
         """Vérifie si la séance est complète."""
         return self.places_disponibles <= 0
 
-    def reserver_places(self, nombre: int):
+    def reserver_places(self, nombre: int) -> List[int]:
         """
-        Réserve un certain nombre de places sans spécifier les numéros de siège.
+        Réserve un certain nombre de places sans que le client choisisse ses sièges.
+
+        Les sièges sont attribués automatiquement (voir
+        `PlanSieges.meilleur_bloc`) et marqués occupés : ils ne peuvent plus
+        être proposés à la sélection.
 
         Args:
             nombre (int): Le nombre de places à réserver.
 
+        Returns:
+            List[int]: Les numéros des sièges attribués.
+
         Raises:
             SallePleineException: Si le nombre de places demandées est supérieur
                 au nombre de places disponibles.
@@ -52,7 +68,21 @@ class Seance:
             raise SallePleineException(
                 f"Impossible : {nombre} places demandées, {self.places_disponibles} restantes."
             )
+        numeros = self._choisir_sieges(nombre)
+        self.places_occupees.ajouter_masque(PlanSieges.masque(numeros))
         self.places_reservees += nombre
+        return numeros
+
+    def _choisir_sieges(self, nombre: int) -> List[int]:
+        """Attribue les meilleurs sièges ni occupés ni bloqués."""
+        pris = self.places_occupees.copy()
+        pris.ajouter_masque(self.places_bloquees.bits)
+        numeros = pris.meilleur_bloc(nombre, self.salle.capacite)
+        if len(numeros) < nombre:
+            # Ne peut arriver que si des sièges sont occupés au-delà de la
+            # capacité (salle réduite après coup).
+            raise SallePleineException(f"Impossible : moins de {nombre} sièges libres.")
+        return numeros
     
     def reserver_places_numeros(self, numeros: List[int]):
         """
@@ -62,24 +92,98 @@ class Seance:
             numeros (List[int]): La liste des numéros de siège à réserver.
 
         Raises:
-            ValueError: Si un numéro de siège est invalide (hors capacité).
-            SallePleineException: Si un siège est déjà occupé ou si le nombre
-                de places demandées est supérieur au nombre de places disponibles.
+            ValueError: Si un numéro de siège est invalide (hors capacité) ou
+                demandé plusieurs fois.
+            SallePleineException: Si un siège est déjà occupé ou bloqué, ou si
+                le nombre de places demandées est supérieur au nombre de places
+                disponibles.
+        """
+        masque = self._verifier_sieges(numeros)
+        nombre = masque.bit_count()
+
+        # Le compteur global inclut aussi les places réservées sans numéro :
+        # on l'incrémente au lieu de le recalculer depuis places_occupees.
+        self.places_occupees.ajouter_masque(masque)
+        self.places_reservees += nombre
+
+    def _verifier_sieges(self, numeros: List[int]) -> int:
+        """
+        Vérifie que des sièges peuvent être pris, sans rien modifier.
+
+        Toute la demande est vérifiée d'un coup, avant d'être appliquée en une
+        opération sur le bitmap.
+
+        Returns:
+            int: Le masque des sièges demandés.
+
+        Raises:
+            ValueError: Si un numéro de siège est invalide (hors capacité) ou
+                demandé plusieurs fois.
+            SallePleineException: Si un siège est occupé ou bloqué, ou s'il ne
+                reste pas assez de places.
         """
         for p in numeros:
             if p < 1 or p > self.salle.capacite:
                 raise ValueError(f"Numéro de place invalide: {p}")
-            if p in self.places_occupees:
-                raise SallePleineException(f"La place {p} est déjà réservée.")
 
-        if len(numeros) > self.places_disponibles:
+        masque = PlanSieges.masque(numeros)
+        # Le bitmap fusionne les doublons : ils fausseraient le compte des places.
+        if masque.bit_count() != len(numeros):
+            raise ValueError("Un même siège est demandé plusieurs fois.")
+        deja_pris = self.places_occupees.conflits(masque)
+        if deja_pris:
+            p = next(PlanSieges.numeros(deja_pris))
+            raise SallePleineException(f"La place {p} est déjà réservée.")
+        bloques = self.places_bloquees.conflits(masque)
+        if bloques:
+            p = next(PlanSieges.numeros(bloques))
+            raise SallePleineException(f"La place {p} est en cours de réservation à un autre guichet.")
+
+        nombre = masque.bit_count()
+        if nombre > self.places_disponibles:
+            raise SallePleineException(
+                f"Impossible : {nombre} places demandées, {self.places_disponibles} restantes."
+            )
+        return masque
+
+    def bloquer_places_numeros(self, numeros: List[int]):
+        """
+        Met de côté des sièges précis, sans les réserver.
+
+        Args:
+            numeros (List[int]): Les numéros des sièges à bloquer.
+
+        Raises:
+            ValueError: Si un numéro de siège est invalide (hors capacité) ou
+                demandé plusieurs fois.
+            SallePleineException: Si un siège est déjà occupé ou bloqué.
+        """
+        self.places_bloquees.ajouter_masque(self._verifier_sieges(numeros))
+
+    def bloquer_places(self, nombre: int) -> List[int]:
+        """
+        Met de côté les meilleurs sièges libres, sans les réserver.
+
+        Args:
+            nombre (int): Le nombre de sièges à bloquer.
+
+        Returns:
+            List[int]: Les numéros des sièges bloqués.
+
+        Raises:
+            SallePleineException: S'il ne reste pas assez de places.
+        """
+        if nombre > self.places_disponibles:
             raise SallePleineException(
-                f"Impossible : {len(numeros)} places demandées, {self.places_disponibles} restantes."
+                f"Impossible : {nombre} places demandées, {self.places_disponibles} restantes."
             )
+        numeros = self._choisir_sieges(nombre)
+        self.places_bloquees.ajouter_masque(PlanSieges.masque(numeros))
+        return numeros
 
-        self.places_occupees.update(numeros)
-        # Maintient la cohérence du compteur global de places réservées.
-        self.places_reservees = len(self.places_occupees)
+    def debloquer_places(self, numeros: List[int]):
+        """Rend libres des sièges bloqués."""
+        self.places_bloquees.retirer_masque(PlanSieges.masque(numeros))
 
     def liberer_places(self, nombre: int, numeros: Optional[List[int]] = None):
         """
@@ -93,8 +197,8 @@ class Seance:
             numeros (Optional[List[int]]): La liste des numéros de siège à libérer.
         """
         if numeros:
-            self.places_occupees.difference_update(numeros)
-            self.places_reservees = len(self.places_occupees)
+            masque = PlanSieges.masque(n for n in numeros if n >= 1)
+            self.places_reservees -= self.places_occupees.retirer_masque(masque)
         else:
             self.places_reservees -= nombre
         
@@ -4,22 +4,42 @@ Interface Graphique Tkinter
 
 Ce fichier est le point d'entrée pour lancer l'application avec l'interface graphique moderne.
 Il initialise et exécute la classe CinemaGUI.
+
+Usage :
+    python run_gui.py                  # données de démonstration en mémoire
+    python run_gui.py --base cinema.db # données persistées dans une base SQLite
+    python run_gui.py --journal donnees/ # journal + instantanés dans un dossier
 """
 
 try:
+    import sys
     import tkinter as tk
     from gui_cinema import CinemaGUI
+    from services.cinema_service import CinemaService
+    from services.stockage import StockageJournal, StockageSQLite
     
     def main():
         print("🎬 Démarrage de l'interface graphique du cinéma...")
+
+        # Le service est créé en arrière-plan, une fois la fenêtre affichée
+        fabrique = CinemaService
+        if len(sys.argv) == 3 and sys.argv[1] == "--base":
+            fabrique = lambda: CinemaService(StockageSQLite(sys.argv[2]))
+            print(f"💾 Base de données : {sys.argv[2]}")
+        elif len(sys.argv) == 3 and sys.argv[1] == "--journal":
+            fabrique = lambda: CinemaService(StockageJournal(sys.argv[2]))
+            print(f"💾 Journal : {sys.argv[2]}")
         
         root = tk.Tk()
-        app = CinemaGUI(root)
+        app = CinemaGUI(root, fabrique_service=fabrique)
         
         print("✅ Interface chargée avec succès!")
         print("📱 Utilisez la fenêtre graphique pour interagir avec le système.")
         
         root.mainloop()
+        app.cache_affiches.arreter()
+        if app.service is not None:
+            app.service.fermer()
         
         print("👋 Au revoir!")
 
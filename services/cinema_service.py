@@ -1,28 +1,231 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta, date as date_type
+from typing import List, Dict, Optional, Tuple, Union
+import functools
+import heapq
 import json
+import time
 
 from models.film import Film
 from models.salle import Salle
 from models.seance import Seance
-from models.reservation import Reservation, Tarif
+from models.plan_sieges import PlanSieges
+from models.reservation import Reservation, Tarif, DemandeReservation, ResultatReservation
+from models.blocage import Blocage, DUREE_BLOCAGE
+from models.exceptions import BlocageExpireException
 from models.enums import StyleFilm, TypeSalle
+from services.identifiants import PREFIXE_SITE, AllocateurIdentifiants, position
+from services.index_seances import IndexSeances
+from services.recherche_films import IndexRechercheFilms
+from services.registre import RegistreReservations
+from services.tarification import GrillePrix
+from services.programmation import CRENEAUX_PAR_DEFAUT, Creneau, GenerateurProgramme
+from services.statistiques import AgregateurStatistiques, calculer_statistiques, comparer_statistiques
+from services.stockage import Stockage
+from services.verrous import VerrousSeances
+
+
+def _exclusif(methode):
+    """Exécute une méthode du service avec un accès exclusif (voir `VerrousSeances.tous`)."""
+    @functools.wraps(methode)
+    def enveloppe(self, *args, **kwargs):
+        with self._verrous.tous():
+            return methode(self, *args, **kwargs)
+    return enveloppe
+
 
 class CinemaService:
-    def __init__(self):
+    def __init__(self, stockage: Optional[Stockage] = None, prefixe_site: str = PREFIXE_SITE):
         """
         Initialise le service du cinéma.
 
-        Ce service agit comme une couche de logique métier (business logic) et
-        simule une base de données en mémoire pour gérer les films, salles,
-        séances et réservations.
+        Ce service agit comme une couche de logique métier (business logic)
+        pour gérer les films, salles, séances et réservations. L'état vit en
+        mémoire ; un backend de stockage optionnel le charge au démarrage et
+        reçoit chaque mutation pour la persister.
+
+        Args:
+            stockage (Optional[Stockage]): Le backend de persistance (ex:
+                `StockageSQLite`). Par défaut, rien n'est persisté et les
+                données de démonstration sont régénérées à chaque lancement.
+            prefixe_site (str): La lettre qui commence les numéros de billet
+                émis par ce service (voir `AllocateurIdentifiants`) ; deux
+                sites qui partagent des données doivent en avoir une différente.
         """
         self.films: List[Film] = []
         self.salles: List[Salle] = []
         self.tarifs: List[Tarif] = []
         self.seances: List[Seance] = []
         self.reservations: List[Reservation] = []
-        self._init_demo_data()
+        # Index des réservations : id du ticket -> position dans self.reservations
+        self._index_reservations: Dict[str, int] = {}
+        # Blocages de sièges actifs, et leurs échéances dans un tas-min
+        # (expiration, id) : les entrées périmées (blocage confirmé, annulé
+        # ou prolongé) y restent et sont ignorées quand elles remontent.
+        self._blocages: Dict[str, Blocage] = {}
+        self._echeances: List[Tuple[float, str]] = []
+        self._index_seances = IndexSeances()
+        self._recherche = IndexRechercheFilms()
+        self._compteur_seances = 0
+        self._statistiques = AgregateurStatistiques()
+        self._registre = RegistreReservations()
+        self._grille = GrillePrix()
+        self._verrous = VerrousSeances()
+        self._stockage = stockage if stockage is not None else Stockage()
+        if not self._stockage.charger(self):
+            self._init_demo_data()
+            self._stockage.initialiser(self)
+        self._reconstruire_index()
+        self._reconstruire_occupation()
+        self._reconstruire_statistiques()
+        self._grille.reconstruire(self.tarifs)
+        # Reprend après la borne persistée et après tout billet déjà émis.
+        depart = max([self._stockage.borne_identifiants(prefixe_site),
+                      *(p + 1 for p in (position(r.id, prefixe_site) for r in self.reservations) if p is not None)])
+        self._identifiants = AllocateurIdentifiants(prefixe_site, depart, self._stockage.identifiants_reserves)
+
+    def _reconstruire_index(self):
+        """Reconstruit les index des séances, des réservations et de recherche à partir des listes."""
+        self._index_seances = IndexSeances()
+        for seance in self.seances:
+            self._index_seances.ajouter(seance)
+        self._recherche = IndexRechercheFilms(self.films)
+        # Les séances retirées du programme comptent aussi : leur identifiant
+        # ne doit pas être réattribué.
+        identifiants = [*(s.id for s in self.seances), *(r.seance.id for r in self.reservations),
+                        *self._stockage.identifiants_seances()]
+        for seance_id in identifiants:
+            if seance_id[1:].isdigit():
+                self._compteur_seances = max(self._compteur_seances, int(seance_id[1:]))
+        self._index_reservations = {r.id: i for i, r in enumerate(self.reservations)}
+
+    def fermer(self):
+        """Ferme le backend de stockage."""
+        self._stockage.fermer()
+
+    @property
+    def verrou_listes(self):
+        """
+        Verrou protégeant les listes du service.
+
+        À prendre pour parcourir `reservations` (ou les autres listes) depuis
+        un thread alors que des réservations peuvent être créées ou annulées
+        en parallèle.
+        """
+        return self._verrous.liste
+
+    def _reconstruire_occupation(self):
+        """
+        Dérive l'occupation de chaque séance à partir des réservations.
+
+        Appelée une seule fois, lorsque les données sont chargées. Ensuite,
+        l'occupation est tenue à jour par `creer_reservation_avec_seance` et
+        `annuler_reservation` : aucune reconstruction n'est nécessaire à
+        l'affichage.
+        """
+        seances = {id(s): s for s in self.seances}
+        seances.update((id(r.seance), r.seance) for r in self.reservations)
+        for seance in seances.values():
+            seance.places_occupees.clear()
+            seance.places_reservees = 0
+        for reservation in self.reservations:
+            seance = reservation.seance
+            if reservation.numeros_places:
+                seance.places_occupees.update(reservation.numeros_places)
+            seance.places_reservees += reservation.nb_places
+
+    @_exclusif
+    def verify_occupancy(self) -> List[str]:
+        """
+        Audite l'occupation des séances par rapport aux réservations.
+
+        Pour chaque séance, le nombre de places réservées doit être égal à la
+        somme des places de ses réservations, et le plan des sièges doit
+        contenir exactement les sièges numérotés de ces réservations. De même,
+        les sièges bloqués doivent être ceux des blocages actifs. L'audit ne
+        modifie rien : il se contente de signaler les écarts.
+
+        Returns:
+            List[str]: La description de chaque écart ; une liste vide
+                signifie que l'occupation est cohérente.
+        """
+        attendu: Dict[int, list] = {id(s): [s, 0, 0] for s in self.seances}
+        for reservation in self.reservations:
+            entree = attendu.setdefault(id(reservation.seance), [reservation.seance, 0, 0])
+            entree[1] += reservation.nb_places
+            entree[2] |= PlanSieges.masque(reservation.numeros_places)
+
+        ecarts = []
+        for seance, places, masque in attendu.values():
+            if seance.places_reservees != places:
+                ecarts.append(f"{seance.id}: {seance.places_reservees} places réservées, {places} attendues")
+            if seance.places_occupees.bits != masque:
+                ecarts.append(f"{seance.id}: sièges {sorted(seance.places_occupees)}, "
+                              f"attendus {list(PlanSieges.numeros(masque))}")
+
+        bloques: Dict[int, list] = {id(s): [s, 0] for s in self.seances}
+        for blocage in self._blocages.values():
+            bloques.setdefault(id(blocage.seance), [blocage.seance, 0])[1] |= PlanSieges.masque(blocage.numeros_places)
+        for seance, masque in bloques.values():
+            if seance.places_bloquees.bits != masque:
+                ecarts.append(f"{seance.id}: sièges bloqués {sorted(seance.places_bloquees)}, "
+                              f"attendus {list(PlanSieges.numeros(masque))}")
+        return ecarts
+
+    def _reconstruire_statistiques(self):
+        """
+        Reconstruit l'agrégat de statistiques et le registre des réservations
+        à partir des séances et des réservations.
+
+        Réservé aux opérations rares qui changent rétroactivement les
+        agrégats (capacité d'une salle, film ou salle d'une séance déjà
+        réservée).
+        """
+        self._statistiques = AgregateurStatistiques.depuis(self.seances, self.reservations)
+        self._registre = RegistreReservations.depuis(self.reservations)
+
+    def _nouvel_id_seance(self) -> str:
+        """
+        Génère un identifiant de séance jamais attribué.
+
+        Contrairement à `len(self.seances) + 1`, le compteur ne revient pas en
+        arrière après une suppression, ce qui évite les doublons d'identifiants.
+        """
+        self._compteur_seances += 1
+        return f"S{self._compteur_seances:02d}"
+
+    def lister_conflits(self, salle: Salle, horaire: datetime, duree: int,
+                        exclure: Optional[Seance] = None) -> List[Seance]:
+        """
+        Liste les séances qui chevauchent un créneau dans une salle.
+
+        La recherche s'appuie sur la structure d'intervalles de la salle et
+        ne parcourt que les séances proches du créneau demandé.
+
+        Args:
+            salle (Salle): La salle concernée.
+            horaire (datetime): Le début du créneau.
+            duree (int): La durée du créneau en minutes.
+            exclure (Optional[Seance]): Une séance à ignorer, typiquement celle
+                en cours de modification.
+
+        Returns:
+            List[Seance]: Les séances en conflit, triées par horaire.
+        """
+        fin = horaire + timedelta(minutes=duree)
+        return self._index_seances.chevauchements(salle.numero, horaire, fin, exclure)
+
+    def lister_conflits_seance(self, seance: Seance) -> List[Seance]:
+        """
+        Liste toutes les séances qui entrent en conflit avec une séance.
+
+        Args:
+            seance (Seance): La séance à vérifier (programmée ou non).
+
+        Returns:
+            List[Seance]: Les séances de la même salle dont la plage horaire
+                chevauche celle de la séance.
+        """
+        return self.lister_conflits(seance.salle, seance.horaire, seance.film.duree, exclure=seance)
 
     def verifier_conflit_seance(self, nouvelle_seance: Seance) -> Optional[Seance]:
         """
@@ -36,25 +239,11 @@ class CinemaService:
             nouvelle_seance (Seance): La nouvelle séance à vérifier.
 
         Returns:
-            Optional[Seance]: La séance en conflit si elle existe, sinon None.
+            Optional[Seance]: La première séance en conflit si elle existe,
+                sinon None. Voir `lister_conflits_seance` pour les obtenir toutes.
         """
-        from datetime import timedelta
-
-        # Heure de début et de fin de la nouvelle séance
-        debut_nouvelle = nouvelle_seance.horaire
-        fin_nouvelle = debut_nouvelle + timedelta(minutes=nouvelle_seance.film.duree)
-
-        # On ne vérifie que les séances dans la même salle
-        for seance_existante in self.seances:
-            if seance_existante.salle.numero == nouvelle_seance.salle.numero:
-                # Heure de début et de fin de la séance existante
-                debut_existante = seance_existante.horaire
-                fin_existante = debut_existante + timedelta(minutes=seance_existante.film.duree)
-
-                # Condition de chevauchement d'intervalles: (StartA < EndB) and (StartB < EndA)
-                if (debut_nouvelle < fin_existante) and (debut_existante < fin_nouvelle):
-                    return seance_existante
-        return None
+        conflits = self.lister_conflits_seance(nouvelle_seance)
+        return conflits[0] if conflits else None
 
     def _init_demo_data(self):
         """
@@ -109,31 +298,33 @@ class CinemaService:
             Tarif("Enfant (-14 ans)", 0.6)
         ])
 
-        # Génération de séances de démonstration
-        import random
-        
-        now = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
-        horaires_possibles = [10, 14, 17, 20]
-        
-        seance_id = 1
-        for jour in range(3):
-            date = now + timedelta(days=jour)
-            for film in self.films:
-                # Assigner des horaires aléatoires pour varier la programmation
-                horaires_film = random.sample(horaires_possibles, k=random.randint(2, 4))
-                horaires_film.sort()
-                
-                for heure in horaires_film:
-                    # Randomiser la salle
-                    salle = random.choice(self.salles)
-                    horaire = date.replace(hour=heure)
-                    self.seances.append(Seance(f"S{seance_id:02d}", film, salle, horaire))
-                    seance_id += 1
+        # Génération de séances de démonstration, sans chevauchement dans une salle
+        aujourdhui = date_type.today()
+        programme = GenerateurProgramme(self.salles).generer(
+            self.films, aujourdhui, aujourdhui + timedelta(days=2))
+        for p in programme.projections:
+            self.seances.append(Seance(self._nouvel_id_seance(), p.film, p.salle, p.horaire))
 
     def get_toutes_seances(self) -> List[Seance]:
         """Retourne la liste de toutes les séances programmées."""
         return self.seances
     
+    def get_seances_chronologiques(self) -> List[Seance]:
+        """Retourne toutes les séances programmées, triées par horaire."""
+        return list(self._index_seances.chronologique())
+
+    def get_seance(self, seance_id: str) -> Optional[Seance]:
+        """
+        Retourne la séance correspondant à un identifiant.
+
+        Args:
+            seance_id (str): L'identifiant de la séance (ex: "S01").
+
+        Returns:
+            Optional[Seance]: La séance trouvée, sinon None.
+        """
+        return self._index_seances.get(seance_id)
+
     def get_seances_par_film(self, film_titre: str) -> List[Seance]:
         """
         Filtre les séances pour un film spécifique.
@@ -142,30 +333,347 @@ class CinemaService:
             film_titre (str): Le titre du film à rechercher.
 
         Returns:
-            List[Seance]: Une liste des séances correspondant au film.
+            List[Seance]: Une liste des séances correspondant au film, triée
+                par horaire.
         """
-        return [s for s in self.seances if s.film.titre == film_titre]
+        return self._index_seances.par_film(film_titre)
     
     def get_seances_disponibles(self) -> List[Seance]:
         """
         Retourne la liste des séances qui ne sont pas complètes.
 
         Returns:
-            List[Seance]: Une liste des séances avec au moins une place disponible.
+            List[Seance]: Une liste des séances avec au moins une place
+                disponible, dans l'ordre chronologique.
         """
-        return [s for s in self.seances if not s.est_complete]
+        return [s for s in self._index_seances.chronologique() if not s.est_complete]
     
-    def get_seances_par_date(self, date: datetime) -> List[Seance]:
+    def get_seances_par_date(self, date: Union[datetime, date_type]) -> List[Seance]:
         """
         Filtre les séances pour une date spécifique.
 
         Args:
-            date (datetime): La date pour laquelle filtrer les séances.
+            date (datetime | date): La date pour laquelle filtrer les séances.
+
+        Returns:
+            List[Seance]: Une liste des séances pour la date donnée, triée
+                par horaire.
+        """
+        jour = date.date() if isinstance(date, datetime) else date
+        return self._index_seances.par_jour(jour)
+
+    def get_seances_film_jour(self, film_titre: str, jour: date_type) -> List[Seance]:
+        """
+        Retourne les séances d'un film pour un jour donné.
+
+        Args:
+            film_titre (str): Le titre du film.
+            jour (date): Le jour recherché.
+
+        Returns:
+            List[Seance]: Les séances correspondantes, triées par horaire.
+        """
+        return self._index_seances.par_film_et_jour(film_titre, jour)
+
+    def get_seances_par_salle(self, numero_salle: int) -> List[Seance]:
+        """
+        Retourne les séances programmées dans une salle.
+
+        Args:
+            numero_salle (int): Le numéro de la salle.
+
+        Returns:
+            List[Seance]: Les séances de la salle, triées par horaire.
+        """
+        return self._index_seances.par_salle(numero_salle)
+
+    @_exclusif
+    def ajouter_film(self, film: Film):
+        """
+        Ajoute un film au catalogue.
+
+        Args:
+            film (Film): Le film à ajouter.
+        """
+        self.films.append(film)
+        self._recherche.ajouter(film)
+        self._stockage.film_ajoute(film)
+
+    @_exclusif
+    def modifier_film(self, film: Film, titre: Optional[str] = None, duree: Optional[int] = None,
+                      style: Optional[StyleFilm] = None, note: Optional[float] = None,
+                      resume: Optional[str] = None, poster_path: Optional[str] = None):
+        """
+        Modifie un film du catalogue et met à jour les index qui en dépendent.
+
+        Seuls les champs renseignés (différents de None) sont modifiés.
+
+        Args:
+            film (Film): Le film à modifier.
+            titre (Optional[str]): Le nouveau titre.
+            duree (Optional[int]): La nouvelle durée en minutes.
+            style (Optional[StyleFilm]): Le nouveau genre.
+            note (Optional[float]): La nouvelle note.
+            resume (Optional[str]): Le nouveau synopsis.
+            poster_path (Optional[str]): Le nouveau chemin de l'affiche.
+        """
+        ancien_titre = film.titre
+        if titre is not None:
+            film.titre = titre
+        if duree is not None:
+            film.duree = duree
+        if style is not None:
+            film.style = style
+        if note is not None:
+            film.note = note
+        if resume is not None:
+            film.resume = resume
+        if poster_path is not None:
+            film.poster_path = poster_path
+
+        if titre is not None or resume is not None or note is not None:
+            # La note départage les résultats de même pertinence.
+            self._recherche.ajouter(film)
+        if film.titre != ancien_titre:
+            self._index_seances.renommer_film(ancien_titre)
+        elif duree is not None:
+            # La durée borne la recherche de conflits de chaque salle.
+            for seance in self._index_seances.par_film(film.titre):
+                self._index_seances.reindexer(seance)
+        self._stockage.film_modifie(film)
+
+    @_exclusif
+    def supprimer_film(self, film: Film):
+        """
+        Supprime un film du catalogue ainsi que toutes ses séances.
+
+        Args:
+            film (Film): Le film à supprimer.
+        """
+        retirees = self._index_seances.par_film(film.titre)
+        for seance in retirees:
+            self._retirer_du_programme(seance)
+        self.seances = [s for s in self.seances if s.film.titre != film.titre]
+        self.films = [f for f in self.films if f is not film]
+        self._recherche.retirer(film)
+        # Le stockage n'est notifié qu'une fois les listes à jour : il peut
+        # en prendre un instantané à tout moment.
+        for seance in retirees:
+            self._stockage.seance_supprimee(seance)
+        self._stockage.film_supprime(film)
+
+    @_exclusif
+    def creer_salle(self, nom: str, capacite: int, type_salle: TypeSalle = TypeSalle.CLASSIQUE) -> Salle:
+        """
+        Crée une salle avec un numéro unique et l'ajoute au cinéma.
+
+        Le numéro suit le plus grand numéro existant, de sorte qu'une
+        suppression ne provoque jamais de doublon.
+
+        Args:
+            nom (str): Le nom de la salle.
+            capacite (int): Le nombre de sièges.
+            type_salle (TypeSalle): La technologie de la salle.
+
+        Returns:
+            Salle: La salle nouvellement créée.
+        """
+        numero = max((s.numero for s in self.salles), default=0) + 1
+        salle = Salle(numero, nom, capacite, type_salle)
+        self.salles.append(salle)
+        self._stockage.salle_ajoutee(salle)
+        return salle
+
+    @_exclusif
+    def modifier_salle(self, salle: Salle, nom: Optional[str] = None, capacite: Optional[int] = None,
+                       type_salle: Optional[TypeSalle] = None):
+        """
+        Modifie une salle existante.
+
+        Seuls les champs renseignés (différents de None) sont modifiés.
+
+        Args:
+            salle (Salle): La salle à modifier.
+            nom (Optional[str]): Le nouveau nom.
+            capacite (Optional[int]): Le nouveau nombre de sièges.
+            type_salle (Optional[TypeSalle]): La nouvelle technologie.
+        """
+        if nom is not None:
+            salle.nom = nom
+        agregats_modifies = False
+        if capacite is not None and capacite != salle.capacite:
+            salle.capacite = capacite
+            agregats_modifies = True
+        if type_salle is not None:
+            # Les réservations passées gardent leur prix : pas d'agrégat à refaire
+            salle.type_salle = type_salle
+        if agregats_modifies:
+            self._reconstruire_statistiques()
+        self._stockage.salle_modifiee(salle)
+
+    @_exclusif
+    def supprimer_salle(self, salle: Salle):
+        """
+        Supprime une salle ainsi que toutes les séances qui y sont programmées.
+
+        Args:
+            salle (Salle): La salle à supprimer.
+        """
+        retirees = self._index_seances.par_salle(salle.numero)
+        for seance in retirees:
+            self._retirer_du_programme(seance)
+        self.seances = [s for s in self.seances if s.salle.numero != salle.numero]
+        self.salles = [s for s in self.salles if s is not salle]
+        for seance in retirees:
+            self._stockage.seance_supprimee(seance)
+        self._stockage.salle_supprimee(salle)
+
+    @_exclusif
+    def creer_seance(self, film: Film, salle: Salle, horaire: datetime) -> Seance:
+        """
+        Crée une séance avec un identifiant unique et l'ajoute au programme.
+
+        Args:
+            film (Film): Le film projeté.
+            salle (Salle): La salle de projection.
+            horaire (datetime): La date et l'heure de début.
+
+        Returns:
+            Seance: La séance nouvellement créée.
+        """
+        seance = Seance(self._nouvel_id_seance(), film, salle, horaire)
+        self.ajouter_seance(seance)
+        return seance
+
+    @_exclusif
+    def ajouter_seance(self, seance: Seance):
+        """
+        Ajoute une séance au programme et l'indexe.
+
+        Args:
+            seance (Seance): La séance à ajouter.
+
+        Raises:
+            ValueError: Si une séance avec le même identifiant existe déjà.
+        """
+        self._index_seances.ajouter(seance)
+        self._statistiques.ajouter_seance(seance)
+        self.seances.append(seance)
+        self._stockage.seance_ajoutee(seance)
+
+    @_exclusif
+    def modifier_seance(self, seance: Seance, film: Optional[Film] = None,
+                        salle: Optional[Salle] = None, horaire: Optional[datetime] = None):
+        """
+        Modifie le film, la salle ou l'horaire d'une séance existante.
+
+        Args:
+            seance (Seance): La séance à modifier.
+            film (Optional[Film]): Le nouveau film.
+            salle (Optional[Salle]): La nouvelle salle.
+            horaire (Optional[datetime]): Le nouvel horaire.
+        """
+        self._retirer_du_programme(seance)
+        # Le film et la salle déterminent l'attribution des réservations déjà
+        # faites sur la séance (leur prix, lui, est figé).
+        reattribution = (film is not None and film is not seance.film) or \
+                        (salle is not None and salle is not seance.salle)
+        if film is not None:
+            seance.film = film
+        if salle is not None:
+            seance.salle = salle
+        if horaire is not None:
+            seance.horaire = horaire
+        self._index_seances.ajouter(seance)
+        if reattribution:
+            self._reconstruire_statistiques()
+        else:
+            self._statistiques.ajouter_seance(seance)
+        self._stockage.seance_modifiee(seance)
+
+    @_exclusif
+    def supprimer_seance(self, seance: Seance) -> bool:
+        """
+        Supprime une séance du programme.
+
+        Args:
+            seance (Seance): La séance à supprimer.
+
+        Returns:
+            bool: True si la séance a été supprimée, False si elle n'était
+                  pas programmée.
+        """
+        if not self._retirer_du_programme(seance):
+            return False
+        self.seances.remove(seance)
+        self._stockage.seance_supprimee(seance)
+        return True
+
+    def _retirer_du_programme(self, seance: Seance) -> bool:
+        """Retire une séance de l'index et des statistiques (pas de la liste)."""
+        if not self._index_seances.retirer(seance):
+            return False
+        self._statistiques.retirer_seance(seance)
+        return True
+
+    @_exclusif
+    def ajouter_tarif(self, tarif: Tarif):
+        """
+        Ajoute un tarif à la grille.
+
+        Args:
+            tarif (Tarif): Le tarif à ajouter.
+        """
+        self.tarifs.append(tarif)
+        self._grille.reconstruire(self.tarifs)
+        self._stockage.tarif_ajoute(tarif)
+
+    @_exclusif
+    def modifier_tarif(self, tarif: Tarif, label: Optional[str] = None, coeff: Optional[float] = None):
+        """
+        Modifie le libellé ou le coefficient d'un tarif.
+
+        Le nouveau coefficient ne s'applique qu'aux réservations à venir :
+        les réservations passées gardent le prix payé.
+
+        Args:
+            tarif (Tarif): Le tarif à modifier.
+            label (Optional[str]): Le nouveau libellé.
+            coeff (Optional[float]): Le nouveau coefficient.
+        """
+        if label is not None:
+            tarif.label = label
+        if coeff is not None and coeff != tarif.coeff:
+            tarif.coeff = coeff
+            self._grille.reconstruire(self.tarifs)
+        self._stockage.tarif_modifie(tarif)
+
+    @_exclusif
+    def supprimer_tarif(self, tarif: Tarif):
+        """
+        Retire un tarif de la grille.
+
+        Les réservations déjà faites avec ce tarif le conservent.
+
+        Args:
+            tarif (Tarif): Le tarif à retirer.
+        """
+        self.tarifs = [t for t in self.tarifs if t is not tarif]
+        self._grille.reconstruire(self.tarifs)
+        self._stockage.tarif_supprime(tarif)
+
+    def prix_place(self, type_salle: TypeSalle, tarif: Tarif) -> float:
+        """
+        Retourne le prix d'une place, lu dans la grille pré-calculée.
+
+        Args:
+            type_salle (TypeSalle): Le type de la salle.
+            tarif (Tarif): Le tarif appliqué.
 
         Returns:
-            List[Seance]: Une liste des séances pour la date donnée.
+            float: Le prix unitaire en euros.
         """
-        return [s for s in self.seances if s.horaire.date() == date.date()]
+        return self._grille.prix(type_salle, tarif)
 
     def creer_reservation_avec_seance(self, seance: 'Seance', nom_client: str, nb_places: int, tarif: Tarif, numeros_places: Optional[List[int]] = None) -> Reservation:
         """
@@ -174,13 +682,19 @@ class CinemaService:
         Cette méthode valide les entrées, met à jour l'état d'occupation de la
         séance, et ajoute la nouvelle réservation à la liste globale.
 
+        Elle peut être appelée depuis plusieurs threads : la vérification et
+        la prise des sièges se font sous le verrou de la séance, si bien
+        qu'un même siège n'est jamais vendu deux fois, et des réservations
+        sur des séances différentes progressent en parallèle.
+
         Args:
             seance (Seance): L'objet séance pour lequel la réservation est faite.
             nom_client (str): Le nom du client.
             nb_places (int): Le nombre de places à réserver.
             tarif (Tarif): Le tarif appliqué à la réservation.
             numeros_places (Optional[List[int]]): La liste des numéros de sièges
-                spécifiques choisis par le client.
+                spécifiques choisis par le client. Si elle est omise, les
+                meilleurs sièges libres sont attribués automatiquement.
 
         Returns:
             Reservation: L'objet réservation nouvellement créé.
@@ -192,105 +706,469 @@ class CinemaService:
         """
         if nb_places <= 0:
             raise ValueError("Il faut réserver au moins 1 place.")
+        if numeros_places is not None and len(numeros_places) != nb_places:
+            raise ValueError("Le nombre de places ne correspond pas au nombre de sièges choisis.")
+        self.liberer_blocages_expires()
 
-        if numeros_places is not None:
-            if len(numeros_places) != nb_places:
-                raise ValueError("Le nombre de places ne correspond pas au nombre de sièges choisis.")
-            seance.reserver_places_numeros(numeros_places)
-        else:
-            seance.reserver_places(nb_places)
+        # Le verrou de la séance rend atomiques la vérification et la prise
+        # des sièges ; il reste tenu jusqu'à la notification du stockage pour
+        # qu'une annulation concurrente soit toujours journalisée après.
+        with self._verrous.pour(seance):
+            if numeros_places is not None:
+                seance.reserver_places_numeros(numeros_places)
+            else:
+                numeros_places = seance.reserver_places(nb_places)
 
-        resa = Reservation(seance, nom_client, nb_places, tarif, numeros_places=numeros_places if numeros_places is not None else [])
-        self.reservations.append(resa)
+            resa = Reservation(seance, nom_client, nb_places, tarif, numeros_places=numeros_places,
+                               id=self._identifiants.allouer(), prix_unitaire=self._grille.prix(seance.salle.type_salle, tarif))
+            self._enregistrer_reservation(resa)
         return resa
+
+    def _enregistrer_reservation(self, resa: Reservation):
+        """Ajoute une réservation aux listes puis la transmet au stockage (verrou de séance tenu)."""
+        with self._verrous.liste:
+            self._index_reservations[resa.id] = len(self.reservations)
+            self.reservations.append(resa)
+            self._statistiques.ajouter_reservation(resa, resa.seance in self._index_seances)
+            self._registre.ajouter(resa)
+        self._stockage.reservation_creee(resa)
+
+    def creer_reservations_bulk(self, demandes: List[DemandeReservation]) -> List[ResultatReservation]:
+        """
+        Crée un lot de réservations en tout ou rien.
+
+        Toutes les lignes sont validées ensemble, en tenant compte des places
+        déjà prises et des autres lignes du lot (deux lignes ne peuvent pas
+        demander le même siège). Si une seule ligne est refusée, aucune
+        réservation n'est créée. Sinon, les sièges de chaque séance sont pris
+        en une opération sur le plan, les listes sont mises à jour en une
+        fois et le stockage reçoit tout le lot d'un coup.
+
+        Les verrous des séances concernées sont pris dans un ordre fixe : deux
+        lots concurrents qui partagent des séances ne peuvent pas s'interbloquer.
+
+        Args:
+            demandes (List[DemandeReservation]): Les lignes du lot.
+
+        Returns:
+            List[ResultatReservation]: Un résultat par ligne, dans l'ordre des
+                demandes. Si le lot est refusé, chaque ligne fautive porte son
+                erreur et aucune ne porte de réservation.
+        """
+        resultats = [ResultatReservation(d) for d in demandes]
+        for resultat in resultats:
+            resultat.erreur = self._verifier_demande(resultat.demande)
+        self.liberer_blocages_expires()
+
+        with self._verrous.pour_plusieurs(d.seance for d in demandes):
+            # id(seance) -> [seance, masque des sièges du lot, places du lot]
+            par_seance: Dict[int, list] = {}
+            # id(resultat) -> sièges de la ligne
+            sieges: Dict[int, List[int]] = {}
+            # Les sièges choisis d'abord, puis l'attribution automatique des
+            # lignes sans placement parmi les sièges restants.
+            valides = [r for r in resultats if not r.erreur]
+            for resultat in sorted(valides, key=lambda r: r.demande.numeros_places is None):
+                demande = resultat.demande
+                seance = demande.seance
+                entree = par_seance.setdefault(id(seance), [seance, 0, 0])
+                if demande.numeros_places is None:
+                    plan = PlanSieges()
+                    plan.bits = seance.places_occupees.bits | seance.places_bloquees.bits | entree[1]
+                    numeros = plan.meilleur_bloc(demande.nb_places, seance.salle.capacite)
+                else:
+                    numeros = list(demande.numeros_places)
+                sieges[id(resultat)] = numeros
+                masque = PlanSieges.masque(numeros)
+                if masque & entree[1]:
+                    p = next(PlanSieges.numeros(masque & entree[1]))
+                    resultat.erreur = f"La place {p} est demandée par une autre ligne du lot."
+                elif seance.places_occupees.conflits(masque):
+                    p = next(PlanSieges.numeros(seance.places_occupees.conflits(masque)))
+                    resultat.erreur = f"La place {p} est déjà réservée."
+                elif seance.places_bloquees.conflits(masque):
+                    p = next(PlanSieges.numeros(seance.places_bloquees.conflits(masque)))
+                    resultat.erreur = f"La place {p} est en cours de réservation à un autre guichet."
+                elif (entree[2] + demande.nb_places > seance.places_disponibles
+                      or len(numeros) < demande.nb_places):
+                    resultat.erreur = (f"Impossible : {entree[2] + demande.nb_places} places demandées "
+                                       f"dans le lot, {seance.places_disponibles} restantes.")
+                else:
+                    entree[1] |= masque
+                    entree[2] += demande.nb_places
+
+            if any(r.erreur for r in resultats):
+                return resultats
+
+            for seance, masque, places in par_seance.values():
+                seance.places_occupees.ajouter_masque(masque)
+                seance.places_reservees += places
+            reservations = []
+            maintenant = time.time()  # Tout le lot est daté du même instant
+            for resultat in resultats:
+                d = resultat.demande
+                resultat.reservation = Reservation(d.seance, d.client_nom, d.nb_places, d.tarif,
+                                                   numeros_places=sieges[id(resultat)],
+                                                   id=self._identifiants.allouer(), horodatage=maintenant,
+                                                   prix_unitaire=self._grille.prix(d.seance.salle.type_salle, d.tarif))
+                reservations.append(resultat.reservation)
+            with self._verrous.liste:
+                for resa in reservations:
+                    self._index_reservations[resa.id] = len(self.reservations)
+                    self.reservations.append(resa)
+                    self._statistiques.ajouter_reservation(resa, resa.seance in self._index_seances)
+                    self._registre.ajouter(resa)
+            self._stockage.reservations_creees(reservations)
+        return resultats
+
+    @staticmethod
+    def _verifier_demande(demande: DemandeReservation) -> Optional[str]:
+        """Contrôles d'une ligne de lot qui ne dépendent pas de l'occupation."""
+        if demande.nb_places <= 0:
+            return "Il faut réserver au moins 1 place."
+        numeros = demande.numeros_places
+        if numeros is None:
+            return None
+        if len(numeros) != demande.nb_places:
+            return "Le nombre de places ne correspond pas au nombre de sièges choisis."
+        for p in numeros:
+            if p < 1 or p > demande.seance.salle.capacite:
+                return f"Numéro de place invalide: {p}"
+        if len(set(numeros)) != len(numeros):
+            return "Un même siège est demandé plusieurs fois."
+        return None
+
+    def bloquer_places(self, seance: Seance, nb_places: int, numeros_places: Optional[List[int]] = None,
+                       duree: float = DUREE_BLOCAGE) -> Blocage:
+        """
+        Met des sièges de côté le temps qu'un client finalise sa réservation.
+
+        Les sièges bloqués ne peuvent être ni réservés ni bloqués ailleurs. Le
+        blocage se termine par `confirmer_blocage`, `annuler_blocage` ou, faute
+        d'activité, par son expiration au bout de `duree` secondes.
+
+        Args:
+            seance (Seance): La séance concernée.
+            nb_places (int): Le nombre de sièges à bloquer.
+            numeros_places (Optional[List[int]]): Les sièges choisis. S'ils
+                sont omis, les meilleurs sièges libres sont bloqués.
+            duree (float): La durée de vie du blocage, en secondes.
+
+        Returns:
+            Blocage: Le blocage créé.
+
+        Raises:
+            ValueError: Si le nombre de places ou un numéro de siège est invalide.
+            SallePleineException: Si un siège demandé est déjà occupé ou bloqué,
+                ou s'il ne reste pas assez de places.
+        """
+        if nb_places <= 0:
+            raise ValueError("Il faut bloquer au moins 1 place.")
+        if numeros_places is not None and len(numeros_places) != nb_places:
+            raise ValueError("Le nombre de places ne correspond pas au nombre de sièges choisis.")
+        self.liberer_blocages_expires()
+
+        with self._verrous.pour(seance):
+            if numeros_places is not None:
+                seance.bloquer_places_numeros(numeros_places)
+                numeros_places = list(numeros_places)
+            else:
+                numeros_places = seance.bloquer_places(nb_places)
+            blocage = Blocage(seance, numeros_places, time.monotonic() + duree)
+            with self._verrous.liste:
+                self._blocages[blocage.id] = blocage
+                heapq.heappush(self._echeances, (blocage.expiration, blocage.id))
+        return blocage
+
+    def modifier_blocage(self, blocage_id: str, numeros_places: List[int],
+                         duree: float = DUREE_BLOCAGE) -> Blocage:
+        """
+        Remplace les sièges d'un blocage et repousse son expiration.
+
+        Si l'un des nouveaux sièges n'est pas libre, le blocage est laissé
+        tel quel.
+
+        Args:
+            blocage_id (str): L'identifiant du blocage.
+            numeros_places (List[int]): Les nouveaux sièges (au moins un).
+            duree (float): La nouvelle durée de vie, comptée à partir de maintenant.
+
+        Returns:
+            Blocage: Le blocage modifié.
+
+        Raises:
+            ValueError: Si la liste de sièges est vide ou contient un numéro invalide.
+            SallePleineException: Si un nouveau siège est déjà occupé ou bloqué.
+            BlocageExpireException: Si le blocage a expiré ou n'existe pas.
+        """
+        if not numeros_places:
+            raise ValueError("Il faut bloquer au moins 1 place.")
+        self.liberer_blocages_expires()
+        blocage = self._blocage_actif(blocage_id)
+        seance = blocage.seance
+
+        with self._verrous.pour(seance):
+            self._blocage_actif(blocage_id)
+            seance.debloquer_places(blocage.numeros_places)
+            try:
+                seance.bloquer_places_numeros(numeros_places)
+            except Exception:
+                seance.bloquer_places_numeros(blocage.numeros_places)
+                raise
+            with self._verrous.liste:
+                blocage.numeros_places = list(numeros_places)
+                blocage.expiration = time.monotonic() + duree
+                heapq.heappush(self._echeances, (blocage.expiration, blocage.id))
+        return blocage
+
+    def confirmer_blocage(self, blocage_id: str, nom_client: str, tarif: Tarif) -> Reservation:
+        """
+        Transforme un blocage en réservation.
+
+        Les sièges étant déjà mis de côté, la confirmation ne peut pas échouer
+        faute de place : elle ne fait que les passer de l'état bloqué à
+        l'état occupé, en O(nombre de sièges).
+
+        Args:
+            blocage_id (str): L'identifiant du blocage.
+            nom_client (str): Le nom du client.
+            tarif (Tarif): Le tarif appliqué à la réservation.
+
+        Returns:
+            Reservation: La réservation créée.
+
+        Raises:
+            BlocageExpireException: Si le blocage a expiré ou n'existe pas.
+        """
+        with self._verrous.liste:
+            blocage = self._blocages.get(blocage_id)
+        if blocage is None:
+            raise BlocageExpireException(f"Le blocage {blocage_id} a expiré ou n'existe pas.")
+        seance = blocage.seance
+
+        with self._verrous.pour(seance):
+            # Un blocage expiré mais pas encore libéré est libéré ici.
+            self._retirer_blocage(blocage)
+            seance.debloquer_places(blocage.numeros_places)
+            if blocage.expiration <= time.monotonic():
+                raise BlocageExpireException(f"Le blocage {blocage_id} a expiré.")
+            seance.reserver_places_numeros(blocage.numeros_places)
+            resa = Reservation(seance, nom_client, len(blocage.numeros_places), tarif,
+                               numeros_places=list(blocage.numeros_places),
+                               id=self._identifiants.allouer(), prix_unitaire=self._grille.prix(seance.salle.type_salle, tarif))
+            self._enregistrer_reservation(resa)
+        return resa
+
+    def annuler_blocage(self, blocage_id: str) -> bool:
+        """
+        Rend libres les sièges d'un blocage.
+
+        Args:
+            blocage_id (str): L'identifiant du blocage.
+
+        Returns:
+            bool: True si le blocage a été annulé, False s'il n'existait plus.
+        """
+        with self._verrous.liste:
+            blocage = self._blocages.get(blocage_id)
+        if blocage is None:
+            return False
+        with self._verrous.pour(blocage.seance):
+            try:
+                self._retirer_blocage(blocage)
+            except BlocageExpireException:
+                return False
+            blocage.seance.debloquer_places(blocage.numeros_places)
+        return True
+
+    def get_blocage(self, blocage_id: str) -> Optional[Blocage]:
+        """Retourne un blocage encore actif, sinon None."""
+        with self._verrous.liste:
+            blocage = self._blocages.get(blocage_id)
+        if blocage is None or blocage.expiration <= time.monotonic():
+            return None
+        return blocage
+
+    def liberer_blocages_expires(self, maintenant: Optional[float] = None) -> int:
+        """
+        Libère les sièges des blocages arrivés à expiration.
+
+        Les échéances sont lues au sommet du tas : l'appel ne coûte qu'une
+        comparaison s'il n'y a rien à libérer, puis O(log n) par blocage
+        expiré, sans parcourir les séances. Il est fait au début de chaque
+        réservation ou blocage, si bien qu'un siège abandonné redevient
+        réservable dès son expiration.
+
+        Ne doit pas être appelée avec un verrou de séance tenu.
+
+        Args:
+            maintenant (Optional[float]): L'instant de référence sur l'horloge
+                `time.monotonic()` (par défaut, l'instant présent).
+
+        Returns:
+            int: Le nombre de blocages libérés.
+        """
+        if maintenant is None:
+            maintenant = time.monotonic()
+        liberes = 0
+        while True:
+            with self._verrous.liste:
+                if not self._echeances or self._echeances[0][0] > maintenant:
+                    return liberes
+                _, blocage_id = heapq.heappop(self._echeances)
+                blocage = self._blocages.get(blocage_id)
+            if blocage is None:
+                continue
+            with self._verrous.pour(blocage.seance):
+                with self._verrous.liste:
+                    # Confirmé, annulé ou prolongé entre-temps : rien à libérer.
+                    if self._blocages.get(blocage_id) is not blocage or blocage.expiration > maintenant:
+                        continue
+                    del self._blocages[blocage_id]
+                blocage.seance.debloquer_places(blocage.numeros_places)
+                liberes += 1
+
+    def _blocage_actif(self, blocage_id: str) -> Blocage:
+        """Retourne un blocage non expiré, sinon lève `BlocageExpireException`."""
+        blocage = self.get_blocage(blocage_id)
+        if blocage is None:
+            raise BlocageExpireException(f"Le blocage {blocage_id} a expiré ou n'existe pas.")
+        return blocage
+
+    def _retirer_blocage(self, blocage: Blocage):
+        """Retire un blocage des blocages actifs (verrou de sa séance tenu)."""
+        with self._verrous.liste:
+            if self._blocages.get(blocage.id) is not blocage:
+                raise BlocageExpireException(f"Le blocage {blocage.id} a expiré ou n'existe pas.")
+            del self._blocages[blocage.id]
+
+    def get_reservation(self, reservation_id: str) -> Optional[Reservation]:
+        """
+        Retourne la réservation correspondant à un numéro de ticket.
+
+        Args:
+            reservation_id (str): L'identifiant unique de la réservation.
+
+        Returns:
+            Optional[Reservation]: La réservation trouvée, sinon None.
+        """
+        with self._verrous.liste:
+            position = self._index_reservations.get(reservation_id)
+            return self.reservations[position] if position is not None else None
     
     def get_statistiques(self) -> Dict:
         """
-        Calcule et retourne des statistiques détaillées sur l'activité du cinéma.
+        Retourne des statistiques détaillées sur l'activité du cinéma.
 
         Les statistiques incluent des données sur les revenus, la popularité des
-        films, l'occupation des salles et la répartition des tarifs.
+        films, l'occupation des salles et la répartition des tarifs. Elles sont
+        lues sur un agrégat tenu à jour à chaque réservation et à chaque
+        modification du programme : l'appel ne parcourt pas les réservations.
 
         Returns:
             Dict: Un dictionnaire contenant diverses métriques de performance.
         """
-        stats = {
-            'total_films': len(self.films),
-            'total_salles': len(self.salles),
-            'total_seances': len(self.seances),
-            'total_reservations': len(self.reservations),
-            'total_places_vendues': sum(r.nb_places for r in self.reservations),
-            'total_revenus': sum(r.prix_total for r in self.reservations),
-            'films_populaires': {},
-            'occupation_salles': {},
-            'repartition_tarifs': {}
-        }
-        
-        # Agrégation des données par film
-        for reservation in self.reservations:
-            film = reservation.seance.film.titre
-            if film not in stats['films_populaires']:
-                stats['films_populaires'][film] = {'places': 0, 'revenus': 0.0}
-            stats['films_populaires'][film]['places'] += reservation.nb_places
-            stats['films_populaires'][film]['revenus'] += reservation.prix_total
-            
-        # Agrégation des données par salle
-        for seance in self.seances:
-            salle = seance.salle.nom
-            if salle not in stats['occupation_salles']:
-                stats['occupation_salles'][salle] = {
-                    'capacite_totale': 0,
-                    'places_vendues': 0
-                }
-            stats['occupation_salles'][salle]['capacite_totale'] += seance.salle.capacite
-            stats['occupation_salles'][salle]['places_vendues'] += seance.places_reservees
-            
-        # Agrégation des données par tarif
-        for reservation in self.reservations:
-            tarif = reservation.tarif.label
-            if tarif not in stats['repartition_tarifs']:
-                stats['repartition_tarifs'][tarif] = 0
-            stats['repartition_tarifs'][tarif] += reservation.nb_places
-            
-        return stats
-    
-    def creer_seances_pour_film(self, film: Film):
+        with self._verrous.liste:
+            return self._statistiques.instantane(len(self.films), len(self.salles), len(self.seances))
+
+    def get_revenus(self, axe: str, debut: Optional[datetime] = None,
+                    fin: Optional[datetime] = None) -> Dict[object, Dict]:
+        """
+        Retourne les revenus regroupés par séance, film, salle, tarif, heure ou jour.
+
+        Le calcul est fait sur le registre en colonnes des réservations (voir
+        `RegistreReservations`), vectorisé avec NumPy lorsqu'il est installé.
+
+        Args:
+            axe (str): L'axe de regroupement : 'seance', 'film', 'salle',
+                'tarif', 'heure' ou 'jour' (ces deux derniers selon l'instant
+                de la réservation).
+            debut (Optional[datetime]): Début de la période (inclus).
+            fin (Optional[datetime]): Fin de la période (exclue).
+
+        Returns:
+            Dict[object, Dict]: Pour chaque groupe, les nombres de réservations
+                et de places et les revenus.
+
+        Raises:
+            ValueError: Si l'axe est inconnu.
+        """
+        with self._verrous.liste:
+            return self._registre.revenus_par(axe, debut, fin)
+
+    @_exclusif
+    def verifier_statistiques(self) -> List[str]:
+        """
+        Contrôle l'agrégat de statistiques contre un recalcul complet.
+
+        Returns:
+            List[str]: Les écarts constatés ; une liste vide signifie que
+                l'agrégat est cohérent.
+        """
+        attendues = calculer_statistiques(self.films, self.salles, self.seances, self.reservations)
+        return comparer_statistiques(attendues, self.get_statistiques())
+
+    @_exclusif
+    def programmer(self, films: List[Film], debut: date_type, fin: date_type,
+                   creneaux: List[Creneau] = CRENEAUX_PAR_DEFAUT,
+                   max_par_jour: Optional[int] = None) -> List[Seance]:
+        """
+        Génère et ajoute au programme les séances de plusieurs films sur une période.
+
+        Les salles sont attribuées par `GenerateurProgramme` en tenant compte
+        des séances déjà programmées : aucune séance créée ne chevauche une
+        autre séance de sa salle. Les créneaux pour lesquels aucune salle
+        n'est libre sont ignorés.
+
+        Args:
+            films (List[Film]): Les films à programmer.
+            debut (date): Le premier jour de la période.
+            fin (date): Le dernier jour de la période (inclus).
+            creneaux (List[Creneau]): Les horaires proposés chaque jour.
+            max_par_jour (Optional[int]): Le nombre maximum de séances d'un
+                même film par jour.
+
+        Returns:
+            List[Seance]: Les séances créées, par horaire croissant.
+        """
+        generateur = GenerateurProgramme(self.salles, self._index_seances)
+        programme = generateur.generer(films, debut, fin, creneaux, max_par_jour)
+        seances = [Seance(self._nouvel_id_seance(), p.film, p.salle, p.horaire)
+                   for p in programme.projections]
+        for seance in seances:
+            self._index_seances.ajouter(seance)
+            self._statistiques.ajouter_seance(seance)
+        self.seances.extend(seances)
+        self._stockage.seances_ajoutees(seances)
+        return seances
+
+    def creer_seances_pour_film(self, film: Film) -> List[Seance]:
         """
         Génère automatiquement un programme de séances pour un nouveau film.
 
-        Crée des séances sur 7 jours avec des horaires et des salles
-        sélectionnés aléatoirement pour simuler une programmation rapide.
+        Propose le film sur les créneaux habituels des 7 prochains jours, dans
+        les salles encore libres (voir `programmer`).
 
         Args:
             film (Film): Le film pour lequel générer les séances.
+
+        Returns:
+            List[Seance]: Les séances créées.
         """
-        import random
-        
-        now = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
-        horaires_possibles = [10, 14, 17, 20]
-        
-        if not self.salles:
-            return
-        
-        seance_id = len(self.seances) + 1
-        for jour in range(7):  # 7 jours (1 semaine)
-            date = now + timedelta(days=jour)
-            horaires_film = random.sample(horaires_possibles, k=random.randint(2, 4))
-            horaires_film.sort()
-            
-            for heure in horaires_film:
-                horaire = date.replace(hour=heure)
-                # Randomiser la salle pour chaque séance
-                salle = random.choice(self.salles)
-                self.seances.append(Seance(f"S{seance_id:02d}", film, salle, horaire))
-                seance_id += 1
-    
+        aujourdhui = date_type.today()
+        return self.programmer([film], aujourdhui, aujourdhui + timedelta(days=6))
+
     def annuler_reservation(self, reservation_id: str) -> bool:
         """
         Annule une réservation spécifiée par son ID.
 
-        Recherche la réservation, libère les places associées dans la séance
-        correspondante, et supprime la réservation de la liste.
+        Retrouve la réservation via l'index, libère les places associées dans
+        la séance correspondante, et la retire de la liste. La dernière
+        réservation de la liste prend la place de celle qui est annulée :
+        le retrait se fait en temps constant, mais la liste ne conserve pas
+        l'ordre de création.
+
+        Sûre en cas d'appels concurrents : voir `creer_reservation_avec_seance`.
 
         Args:
             reservation_id (str): L'identifiant unique de la réservation à annuler.
@@ -299,22 +1177,56 @@ class CinemaService:
             bool: True si l'annulation a réussi, False si la réservation
                   n'a pas été trouvée.
         """
-        for i, reservation in enumerate(self.reservations):
-            if reservation.id == reservation_id:
-                reservation.seance.liberer_places(reservation.nb_places, reservation.numeros_places)
-                del self.reservations[i]
-                return True
-        return False
+        reservation = self.get_reservation(reservation_id)
+        if reservation is None:
+            return False
+
+        seance = reservation.seance
+        with self._verrous.pour(seance):
+            with self._verrous.liste:
+                # Une autre annulation a pu passer entre la recherche et le verrou.
+                position = self._index_reservations.pop(reservation_id, None)
+                if position is None:
+                    return False
+                derniere = self.reservations.pop()
+                if position < len(self.reservations):
+                    self.reservations[position] = derniere
+                    self._index_reservations[derniere.id] = position
+                self._statistiques.retirer_reservation(reservation, seance in self._index_seances)
+                self._registre.retirer(reservation)
+            seance.liberer_places(reservation.nb_places, reservation.numeros_places)
+            self._stockage.reservation_annulee(reservation)
+        return True
+
+    @_exclusif
+    def vider_reservations(self):
+        """Annule toutes les réservations et libère les places correspondantes."""
+        for reservation in self.reservations:
+            reservation.seance.liberer_places(reservation.nb_places, reservation.numeros_places)
+        self.reservations.clear()
+        self._index_reservations.clear()
+        self._reconstruire_statistiques()
+        self._stockage.reservations_videes()
     
-    def rechercher_films(self, terme: str) -> List[Film]:
+    def rechercher_films(self, terme: str, avec_resume: bool = False,
+                         limite: Optional[int] = None) -> List[Film]:
         """
-        Recherche des films par titre de manière non sensible à la casse.
+        Recherche des films par titre, sans tenir compte de la casse ni des accents.
+
+        La recherche passe par un index tenu à jour à chaque modification du
+        catalogue (voir `IndexRechercheFilms`) : « evades » trouve « Les
+        Évadés », « inter » trouve « Interstellar », et les résultats sont
+        classés par pertinence.
 
         Args:
-            terme (str): Le terme de recherche à trouver dans les titres de films.
+            terme (str): Le texte saisi. Vide, il retourne tout le catalogue.
+            avec_resume (bool): Chercher aussi dans les synopsis.
+            limite (Optional[int]): Le nombre maximum de résultats.
 
         Returns:
-            List[Film]: Une liste de films dont le titre contient le terme de recherche.
+            List[Film]: Les films trouvés, du plus pertinent au moins pertinent.
         """
-        terme_lower = terme.lower()
-        return [f for f in self.films if terme_lower in f.titre.lower()]
\ No newline at end of file
+        with self._verrous.liste:
+            if not terme.strip():
+                return self.films[:limite]
+            return self._recherche.rechercher(terme, avec_resume, limite)
\ No newline at end of file
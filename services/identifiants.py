@@ -0,0 +1,139 @@
+import itertools
+import threading
+from typing import Callable, Optional
+
+# Alphabet base 32 de Crockford : ni I, L, O ni U, pour éviter les confusions
+# à la lecture et à la saisie d'un billet.
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_VALEURS = {c: v for v, c in enumerate(ALPHABET)}
+
+NB_CHIFFRES = 6
+CAPACITE = 32 ** NB_CHIFFRES  # un peu plus d'un milliard de billets par site
+LONGUEUR = 1 + NB_CHIFFRES + 1  # site + compteur + contrôle
+
+# Nombre d'identifiants réservés d'un coup ; seule la borne de chaque bloc
+# est persistée.
+TAILLE_BLOC = 1024
+
+PREFIXE_SITE = "C"
+
+
+def _fois_x(valeur: int, exposant: int = 1) -> int:
+    """Multiplie par x**exposant dans GF(32) (polynôme x^5 + x^2 + 1)."""
+    for _ in range(exposant):
+        valeur <<= 1
+        if valeur & 32:
+            valeur ^= 0b100101
+    return valeur
+
+
+# Caractère de contrôle : algorithme de Damm sur le quasi-groupe
+# a * b = x.a + b de GF(32), totalement anti-symétrique. L'état après chaque
+# caractère est x.état + caractère ; le contrôle ramène l'état final à 0.
+_FOIS_X = tuple(_fois_x(v) for v in range(32))
+
+# L'état est linéaire : le contrôle d'un identifiant est la somme (xor) des
+# termes de chaque caractère, multipliés par x à la puissance de leur
+# distance au contrôle. Les 6 chiffres du compteur sont produits deux par
+# deux (10 bits) : une table par paire donne son texte et son terme.
+_PAIRES = tuple(
+    tuple((ALPHABET[v >> 5] + ALPHABET[v & 31], _fois_x(v >> 5, exposant + 1) ^ _fois_x(v & 31, exposant))
+          for v in range(1024))
+    for exposant in (5, 3, 1))
+
+
+def identifiant_valide(texte: str) -> bool:
+    """
+    Vérifie la forme et le caractère de contrôle d'un numéro de billet.
+
+    Le contrôle (Damm) détecte toute erreur sur un caractère et toute
+    inversion de deux caractères voisins : un billet mal saisi est refusé à
+    l'entrée sans consulter les réservations.
+    """
+    if len(texte) != LONGUEUR:
+        return False
+    etat = 0
+    for caractere in texte:
+        valeur = _VALEURS.get(caractere)
+        if valeur is None:
+            return False
+        etat = _FOIS_X[etat] ^ valeur
+    return etat == 0
+
+
+def position(texte: str, prefixe: str) -> Optional[int]:
+    """La valeur du compteur d'un identifiant valide du site `prefixe`, sinon None."""
+    if not texte.startswith(prefixe) or not identifiant_valide(texte):
+        return None
+    valeur = 0
+    for caractere in texte[1:-1]:
+        valeur = valeur * 32 + _VALEURS[caractere]
+    return valeur
+
+
+class AllocateurIdentifiants:
+    """
+    Attribue des numéros de billet uniques, courts et vérifiables.
+
+    Un numéro est formé de la lettre du site, de la valeur d'un compteur
+    croissant en base 32 (6 caractères) et d'un caractère de contrôle, soit
+    8 caractères comme les anciens identifiants tirés d'un uuid, mais sans
+    risque de collision : deux billets d'un même site ne reçoivent jamais la
+    même valeur de compteur. L'attribution ne coûte qu'un incrément et trois
+    lectures de table, contrôle compris.
+
+    Le compteur survit aux redémarrages sans écriture par billet : les
+    valeurs sont réservées par blocs de `TAILLE_BLOC`, et seule la fin du
+    bloc est transmise à `persister` avant la première utilisation du bloc.
+    Au redémarrage, l'attribution reprend à la borne persistée ; les valeurs
+    non utilisées du dernier bloc sont perdues, jamais réattribuées.
+
+    Args:
+        prefixe (str): La lettre du site (une lettre de l'alphabet de
+            Crockford, pas un chiffre).
+        depart (int): La première valeur du compteur à attribuer.
+        persister (Optional[Callable[[str, int], None]]): Appelée avec le
+            préfixe et la nouvelle borne à chaque réservation de bloc.
+
+    Raises:
+        ValueError: Si le préfixe n'est pas une lettre de l'alphabet.
+    """
+
+    def __init__(self, prefixe: str = PREFIXE_SITE, depart: int = 0,
+                 persister: Optional[Callable[[str, int], None]] = None):
+        if len(prefixe) != 1 or prefixe not in _VALEURS or prefixe.isdigit():
+            raise ValueError(f"Préfixe de site invalide : {prefixe!r} (une lettre parmi {ALPHABET[10:]}).")
+        self.prefixe = prefixe
+        self._terme_prefixe = _fois_x(_VALEURS[prefixe], 7)
+        self._compteur = itertools.count(depart)  # next() est atomique
+        self._borne = depart
+        self._persister = persister
+        self._verrou = threading.Lock()
+
+    def allouer(self) -> str:
+        """
+        Retourne un nouveau numéro de billet.
+
+        Raises:
+            OverflowError: Si le compteur du site est épuisé.
+        """
+        valeur = next(self._compteur)
+        if valeur >= self._borne:
+            self._reserver_bloc(valeur)
+        haut, terme_haut = _PAIRES[0][valeur >> 20]
+        milieu, terme_milieu = _PAIRES[1][(valeur >> 10) & 1023]
+        bas, terme_bas = _PAIRES[2][valeur & 1023]
+        controle = self._terme_prefixe ^ terme_haut ^ terme_milieu ^ terme_bas
+        return self.prefixe + haut + milieu + bas + ALPHABET[controle]
+
+    def _reserver_bloc(self, valeur: int):
+        if valeur >= CAPACITE:
+            raise OverflowError(f"Plus de numéros de billet disponibles pour le site {self.prefixe}.")
+        with self._verrou:
+            while valeur >= self._borne:
+                borne = min(self._borne + TAILLE_BLOC, CAPACITE)
+                # Persistée avant d'être utilisée : un redémarrage ne peut pas
+                # redonner une valeur déjà attribuée.
+                if self._persister is not None:
+                    self._persister(self.prefixe, borne)
+                self._borne = borne
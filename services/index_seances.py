@@ -0,0 +1,205 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models.seance import Seance
+
+
+class Compartiment:
+    """
+    Liste de séances maintenue triée par horaire.
+
+    Les clés de tri (horaire, id) sont stockées dans une liste parallèle afin
+    de pouvoir utiliser `bisect` sans recalculer la clé de chaque séance.
+    """
+    __slots__ = ('_cles', '_seances')
+
+    def __init__(self):
+        self._cles: List[Tuple[datetime, str]] = []
+        self._seances: List[Seance] = []
+
+    def ajouter(self, seance: Seance):
+        """Insère la séance à sa position chronologique."""
+        cle = (seance.horaire, seance.id)
+        i = bisect_right(self._cles, cle)
+        self._cles.insert(i, cle)
+        self._seances.insert(i, seance)
+
+    def retirer(self, seance_id: str, horaire: datetime) -> bool:
+        """
+        Retire une séance à partir de la clé sous laquelle elle a été indexée.
+
+        Returns:
+            bool: True si la séance était présente dans le compartiment.
+        """
+        cle = (horaire, seance_id)
+        i = bisect_left(self._cles, cle)
+        if i < len(self._cles) and self._cles[i] == cle:
+            del self._cles[i]
+            del self._seances[i]
+            return True
+        return False
+
+    def entre(self, debut: datetime, fin: datetime) -> List[Seance]:
+        """Retourne les séances dont l'horaire est dans l'intervalle [debut, fin[."""
+        i = bisect_left(self._cles, (debut,))
+        j = bisect_left(self._cles, (fin,))
+        return self._seances[i:j]
+
+    def __iter__(self) -> Iterator[Seance]:
+        return iter(self._seances)
+
+    def __len__(self) -> int:
+        return len(self._seances)
+
+
+class CompartimentSalle(Compartiment):
+    """
+    Compartiment des séances d'une salle, interrogeable par intervalle.
+
+    Les débuts de séance sont triés ; la plus longue durée de film jamais
+    indexée dans la salle borne la recherche : une séance qui chevauche
+    l'intervalle [debut, fin[ commence forcément après `debut - duree_max`.
+    La recherche se réduit donc à une dichotomie suivie d'un parcours des
+    seules séances de cette fenêtre.
+    """
+    __slots__ = ('_duree_max',)
+
+    def __init__(self):
+        super().__init__()
+        self._duree_max = timedelta(0)
+
+    def ajouter(self, seance: Seance):
+        super().ajouter(seance)
+        duree = timedelta(minutes=seance.film.duree)
+        if duree > self._duree_max:
+            self._duree_max = duree
+
+    def chevauchements(self, debut: datetime, fin: datetime,
+                       exclure: Optional[Seance] = None) -> List[Seance]:
+        """
+        Retourne toutes les séances dont la plage horaire chevauche [debut, fin[.
+
+        Args:
+            debut (datetime): Le début de l'intervalle.
+            fin (datetime): La fin de l'intervalle.
+            exclure (Optional[Seance]): Une séance à ignorer (ex: celle que
+                l'on est en train de modifier).
+        """
+        return [s for s in self.entre(debut - self._duree_max, fin)
+                if s is not exclure and s.fin > debut]
+
+
+class IndexSeances:
+    """
+    Index multi-clés des séances : par titre de film, par jour et par salle.
+
+    Chaque clé pointe vers un `Compartiment` trié par horaire, ce qui permet
+    de répondre aux requêtes de l'onglet Séances sans parcourir tout le
+    programme. La clé utilisée lors de l'indexation est mémorisée pour
+    chaque séance : une séance modifiée sur place (film, salle ou horaire)
+    peut ainsi toujours être retirée de ses anciens compartiments.
+    """
+
+    def __init__(self):
+        self._par_id: Dict[str, Seance] = {}
+        self._cles: Dict[str, Tuple[str, int, datetime]] = {}
+        self._par_film: Dict[str, Compartiment] = {}
+        self._par_jour: Dict[date, Compartiment] = {}
+        self._par_salle: Dict[int, CompartimentSalle] = {}
+
+    def ajouter(self, seance: Seance):
+        """
+        Indexe une nouvelle séance.
+
+        Raises:
+            ValueError: Si une séance portant le même identifiant est déjà indexée.
+        """
+        if seance.id in self._par_id:
+            raise ValueError(f"Séance {seance.id} déjà indexée.")
+        titre, numero, horaire = seance.film.titre, seance.salle.numero, seance.horaire
+        self._par_id[seance.id] = seance
+        self._cles[seance.id] = (titre, numero, horaire)
+        self._par_film.setdefault(titre, Compartiment()).ajouter(seance)
+        self._par_jour.setdefault(horaire.date(), Compartiment()).ajouter(seance)
+        self._par_salle.setdefault(numero, CompartimentSalle()).ajouter(seance)
+
+    def retirer(self, seance: Seance) -> bool:
+        """
+        Retire une séance de l'index.
+
+        Returns:
+            bool: True si la séance était indexée.
+        """
+        cle = self._cles.pop(seance.id, None)
+        if cle is None:
+            return False
+        del self._par_id[seance.id]
+        titre, numero, horaire = cle
+        self._retirer_de(self._par_film, titre, seance.id, horaire)
+        self._retirer_de(self._par_jour, horaire.date(), seance.id, horaire)
+        self._retirer_de(self._par_salle, numero, seance.id, horaire)
+        return True
+
+    def reindexer(self, seance: Seance):
+        """Met à jour l'index après une modification du film, de la salle ou de l'horaire."""
+        self.retirer(seance)
+        self.ajouter(seance)
+
+    def renommer_film(self, ancien_titre: str):
+        """Réindexe les séances qui étaient rangées sous l'ancien titre d'un film."""
+        compartiment = self._par_film.get(ancien_titre)
+        if compartiment is None:
+            return
+        for seance in list(compartiment):
+            self.reindexer(seance)
+
+    @staticmethod
+    def _retirer_de(table: Dict, cle, seance_id: str, horaire: datetime):
+        compartiment = table.get(cle)
+        if compartiment is not None and compartiment.retirer(seance_id, horaire) and not compartiment:
+            del table[cle]
+
+    def get(self, seance_id: str) -> Optional[Seance]:
+        """Retourne la séance portant cet identifiant, ou None."""
+        return self._par_id.get(seance_id)
+
+    def __contains__(self, seance: Seance) -> bool:
+        return self._par_id.get(seance.id) is seance
+
+    def __len__(self) -> int:
+        return len(self._par_id)
+
+    def par_film(self, titre: str) -> List[Seance]:
+        """Séances d'un film, triées par horaire."""
+        compartiment = self._par_film.get(titre)
+        return list(compartiment) if compartiment else []
+
+    def par_film_et_jour(self, titre: str, jour: date) -> List[Seance]:
+        """Séances d'un film pour un jour donné, triées par horaire."""
+        compartiment = self._par_film.get(titre)
+        if not compartiment:
+            return []
+        debut = datetime.combine(jour, datetime.min.time())
+        return compartiment.entre(debut, debut + timedelta(days=1))
+
+    def par_jour(self, jour: date) -> List[Seance]:
+        """Séances d'un jour donné, triées par horaire."""
+        compartiment = self._par_jour.get(jour)
+        return list(compartiment) if compartiment else []
+
+    def par_salle(self, numero: int) -> List[Seance]:
+        """Séances d'une salle, triées par horaire."""
+        compartiment = self._par_salle.get(numero)
+        return list(compartiment) if compartiment else []
+
+    def chevauchements(self, numero_salle: int, debut: datetime, fin: datetime,
+                       exclure: Optional[Seance] = None) -> List[Seance]:
+        """Séances de la salle dont la plage horaire chevauche [debut, fin[."""
+        compartiment = self._par_salle.get(numero_salle)
+        return compartiment.chevauchements(debut, fin, exclure) if compartiment else []
+
+    def chronologique(self) -> Iterator[Seance]:
+        """Parcourt toutes les séances indexées dans l'ordre chronologique."""
+        for jour in sorted(self._par_jour):
+            yield from self._par_jour[jour]
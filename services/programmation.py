@@ -0,0 +1,167 @@
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from models.film import Film
+from models.salle import Salle
+from services.index_seances import IndexSeances
+
+# Temps minimum, en minutes, entre la fin d'une séance et le début de la
+# suivante dans la même salle (sortie du public, nettoyage).
+BATTEMENT = 15
+
+
+@dataclass(frozen=True)
+class Creneau:
+    """
+    Modèle d'horaire de séance, répété chaque jour de la période programmée.
+
+    Attributes:
+        debut (time): L'heure de début des séances.
+        jours (Optional[FrozenSet[int]]): Les jours de la semaine où le
+            créneau s'applique (0 pour lundi) ; None pour tous les jours.
+    """
+    debut: time
+    jours: Optional[FrozenSet[int]] = None
+
+
+CRENEAUX_PAR_DEFAUT = (Creneau(time(10)), Creneau(time(14)), Creneau(time(17)), Creneau(time(20)))
+
+
+@dataclass
+class Projection:
+    """Une séance planifiée par le générateur, avant son ajout au programme."""
+    film: Film
+    salle: Salle
+    horaire: datetime
+
+
+@dataclass
+class Programme:
+    """
+    Résultat d'une génération de programme.
+
+    Attributes:
+        projections (List[Projection]): Les séances placées, par horaire croissant.
+        refusees (List[Tuple[Film, datetime]]): Les séances demandées pour
+            lesquelles aucune salle n'était libre.
+    """
+    projections: List[Projection] = field(default_factory=list)
+    refusees: List[Tuple[Film, datetime]] = field(default_factory=list)
+
+
+class GenerateurProgramme:
+    """
+    Répartit des séances dans les salles sans jamais créer de chevauchement.
+
+    C'est un partitionnement d'intervalles par balayage : les séances
+    demandées sont parcourues par horaire croissant ; un tas des salles
+    occupées, trié par heure de libération, rend ses salles au tas des salles
+    libres dès que le balayage les dépasse. Chaque séance prend la salle libre
+    la mieux classée (la plus grande d'abord). Une séance qui ne trouve
+    aucune salle libre est refusée, jamais placée en conflit. Le coût est en
+    O(n log n) pour n séances demandées, sans aucune comparaison entre
+    séances.
+
+    Les séances déjà programmées sont respectées grâce à l'index des séances
+    par salle : une salle dont le prochain créneau déjà occupé chevauche la
+    séance est écartée pour cette séance.
+
+    Args:
+        salles (Sequence[Salle]): Les salles disponibles.
+        index (Optional[IndexSeances]): Les séances déjà programmées.
+        battement (int): Minutes minimum entre deux séances d'une même salle.
+    """
+
+    def __init__(self, salles: Sequence[Salle], index: Optional[IndexSeances] = None,
+                 battement: int = BATTEMENT):
+        # Rang de préférence : les grandes salles d'abord.
+        self._salles = sorted(salles, key=lambda s: (-s.capacite, s.numero))
+        self._index = index
+        self._battement = timedelta(minutes=battement)
+
+    def generer(self, films: Iterable[Film], debut: date, fin: date,
+                creneaux: Sequence[Creneau] = CRENEAUX_PAR_DEFAUT,
+                max_par_jour: Optional[int] = None) -> Programme:
+        """
+        Programme des films sur chaque créneau de chaque jour d'une période.
+
+        Lorsqu'il y a plus de films que de salles libres sur un créneau, les
+        films qui ont obtenu le moins de séances jusque-là passent en premier,
+        puis les mieux notés : les films tournent d'un créneau à l'autre.
+
+        Args:
+            films (Iterable[Film]): Les films à programmer.
+            debut (date): Le premier jour de la période.
+            fin (date): Le dernier jour de la période (inclus).
+            creneaux (Sequence[Creneau]): Les horaires proposés chaque jour.
+            max_par_jour (Optional[int]): Le nombre maximum de séances d'un
+                même film par jour.
+
+        Returns:
+            Programme: Les séances placées et celles qui n'ont pas trouvé de salle.
+        """
+        films = list(films)
+        demandes: Dict[datetime, List[Film]] = {}
+        jour = debut
+        while jour <= fin:
+            for creneau in creneaux:
+                if creneau.jours is None or jour.weekday() in creneau.jours:
+                    demandes.setdefault(datetime.combine(jour, creneau.debut), []).extend(films)
+            jour += timedelta(days=1)
+        return self.placer(demandes, max_par_jour)
+
+    def placer(self, demandes: Dict[datetime, List[Film]],
+               max_par_jour: Optional[int] = None) -> Programme:
+        """
+        Attribue une salle à chaque séance demandée, par balayage chronologique.
+
+        Args:
+            demandes (Dict[datetime, List[Film]]): Les films demandés à chaque horaire.
+            max_par_jour (Optional[int]): Voir `generer`.
+
+        Returns:
+            Programme: Les séances placées et celles qui n'ont pas trouvé de salle.
+        """
+        programme = Programme()
+        libres = list(range(len(self._salles)))  # rangs des salles libres (tas)
+        occupees: List[Tuple[datetime, int]] = []  # (libération, rang) (tas)
+        nb_seances: Dict[int, int] = defaultdict(int)  # id(film) -> séances placées
+        par_jour: Dict[Tuple[int, date], int] = defaultdict(int)
+
+        for horaire in sorted(demandes):
+            while occupees and occupees[0][0] <= horaire:
+                heapq.heappush(libres, heapq.heappop(occupees)[1])
+
+            for film in sorted(demandes[horaire], key=lambda f: (nb_seances[id(f)], -f.note, f.titre)):
+                cle_jour = (id(film), horaire.date())
+                if max_par_jour is not None and par_jour[cle_jour] >= max_par_jour:
+                    continue
+                liberation = horaire + timedelta(minutes=film.duree) + self._battement
+                rang = self._salle_libre(libres, horaire, liberation)
+                if rang is None:
+                    programme.refusees.append((film, horaire))
+                    continue
+                heapq.heappush(occupees, (liberation, rang))
+                nb_seances[id(film)] += 1
+                par_jour[cle_jour] += 1
+                programme.projections.append(Projection(film, self._salles[rang], horaire))
+        return programme
+
+    def _salle_libre(self, libres: List[int], horaire: datetime, liberation: datetime) -> Optional[int]:
+        """Retire du tas et retourne la meilleure salle sans séance déjà programmée sur le créneau."""
+        ecartees = []
+        rang = None
+        while libres:
+            candidat = heapq.heappop(libres)
+            if self._index is not None and self._index.chevauchements(
+                    self._salles[candidat].numero, horaire - self._battement, liberation):
+                ecartees.append(candidat)
+                continue
+            rang = candidat
+            break
+        for candidat in ecartees:
+            heapq.heappush(libres, candidat)
+        return rang
@@ -0,0 +1,320 @@
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models.film import Film
+
+_SEPARATEURS = re.compile(r'[\W_]+')
+
+# Rangs des résultats, du plus pertinent au moins pertinent.
+RANG_TITRE_EXACT = 0
+RANG_DEBUT_TITRE = 1
+RANG_DEBUT_MOTS = 2
+RANG_DANS_TITRE = 3
+RANG_RESUME = 4
+
+# Résultats gardés par requête d'une ou deux lettres (premières frappes).
+NB_RESULTATS_COURTS = 100
+
+
+def normaliser(texte: str) -> str:
+    """
+    Met un texte sous la forme utilisée par l'index de recherche.
+
+    Les accents sont retirés (décomposition NFKD), la casse est ignorée et
+    tout ce qui n'est ni lettre ni chiffre devient un espace unique :
+    « Les Évadés » et « les evades » donnent tous deux « les evades ».
+    """
+    texte = texte.casefold()
+    if not texte.isascii():
+        decompose = unicodedata.normalize('NFKD', texte)
+        texte = ''.join(c for c in decompose if not unicodedata.combining(c))
+    return _SEPARATEURS.sub(' ', texte).strip()
+
+
+def trigrammes(texte: str) -> Set[str]:
+    """Les trigrammes (sous-chaînes de 3 caractères) d'un texte normalisé."""
+    return {texte[i:i + 3] for i in range(len(texte) - 2)}
+
+
+class _IndexPrefixes:
+    """
+    Index inversé mot -> films, interrogeable par préfixe.
+
+    Le vocabulaire est gardé trié : les mots qui commencent par un préfixe
+    forment une plage contiguë, trouvée par dichotomie. Le tri n'est refait
+    qu'à la première requête qui suit un ajout, pas à chaque ajout.
+
+    Les préfixes d'une ou deux lettres couvrent une grande partie du
+    vocabulaire : leurs films sont tenus à part, pour ne pas réunir des
+    centaines de listes à la première frappe.
+    """
+    __slots__ = ('_postings', '_courts', '_vocabulaire', '_a_trier')
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        self._courts: Dict[str, Set[int]] = {}
+        self._vocabulaire: List[str] = []
+        self._a_trier = False
+
+    def ajouter(self, cle: int, mots: Set[str]):
+        for mot in mots:
+            films = self._postings.get(mot)
+            if films is None:
+                self._postings[mot] = films = set()
+                self._a_trier = True
+            films.add(cle)
+        for court in self._prefixes_courts(mots):
+            self._courts.setdefault(court, set()).add(cle)
+
+    def retirer(self, cle: int, mots: Set[str]):
+        for mot in mots:
+            films = self._postings.get(mot)
+            if films is not None:
+                films.discard(cle)
+                if not films:
+                    del self._postings[mot]
+                    self._a_trier = True
+        for court in self._prefixes_courts(mots):
+            films = self._courts[court]
+            films.discard(cle)
+            if not films:
+                del self._courts[court]
+
+    @staticmethod
+    def _prefixes_courts(mots: Set[str]) -> Set[str]:
+        return {mot[:1] for mot in mots} | {mot[:2] for mot in mots}
+
+    def prefixe(self, prefixe: str) -> Set[int]:
+        """Les films dont un mot commence par `prefixe`."""
+        if len(prefixe) <= 2:
+            return self._courts.get(prefixe, set())
+        if self._a_trier:
+            self._vocabulaire = sorted(self._postings)
+            self._a_trier = False
+        vocabulaire = self._vocabulaire
+        i = bisect_left(vocabulaire, prefixe)
+        # Cas courant en cours de frappe : un seul mot de la plage.
+        if i + 1 >= len(vocabulaire) or not vocabulaire[i + 1].startswith(prefixe):
+            if i < len(vocabulaire) and vocabulaire[i].startswith(prefixe):
+                return self._postings[vocabulaire[i]]
+            return set()
+        resultat = set()
+        while i < len(vocabulaire) and vocabulaire[i].startswith(prefixe):
+            resultat |= self._postings[vocabulaire[i]]
+            i += 1
+        return resultat
+
+    def tous_prefixes(self, prefixes: List[str]) -> Set[int]:
+        """
+        Les films qui ont, pour chaque préfixe, un mot qui commence par lui.
+
+        Le résultat peut être un ensemble de l'index : il ne doit pas être modifié.
+        """
+        ensembles = sorted((self.prefixe(p) for p in prefixes), key=len)
+        if not ensembles or not ensembles[0]:
+            return set()
+        if len(ensembles) == 1:
+            return ensembles[0]  # Pas de copie d'une liste qui peut couvrir le catalogue
+        return ensembles[0].intersection(*ensembles[1:])
+
+
+class IndexRechercheFilms:
+    """
+    Index de recherche du catalogue, insensible à la casse et aux accents.
+
+    Trois structures sont tenues à jour à chaque ajout, modification ou
+    suppression de film, pour qu'une requête ne relise jamais les titres :
+
+    - un index des mots des titres, interrogé par préfixe (« inter » trouve
+      « Interstellar ») ;
+    - des listes de trigrammes des titres pour la recherche à l'intérieur des
+      mots (« vade » trouve « Les Évadés ») : seuls les titres qui possèdent
+      tous les trigrammes de la requête sont vérifiés ;
+    - un index des mots des synopsis, construit à la première recherche qui
+      le demande.
+
+    Les résultats sont classés : titre exact, début du titre, début de mots
+    du titre, ailleurs dans le titre, puis synopsis ; à rang égal, les films
+    les mieux notés d'abord. Avec une limite, un rang qui contient une
+    grande partie du catalogue n'est pas trié : le catalogue, tenu trié par
+    note, est parcouru jusqu'à obtenir assez de résultats.
+
+    Les requêtes d'une ou deux lettres trouvent une grande partie du
+    catalogue : leurs `NB_RESULTATS_COURTS` premiers résultats sont gardés
+    jusqu'à la prochaine modification et servent toute requête limitée.
+    """
+
+    def __init__(self, films: Iterable[Film] = ()):
+        self._films: Dict[int, Film] = {}
+        # id(film) -> (titre normalisé, mots du titre, trigrammes)
+        self._cles: Dict[int, Tuple[str, Set[str], Set[str]]] = {}
+        self._titres = _IndexPrefixes()
+        self._trigrammes: Dict[str, Set[int]] = {}
+        self._resumes: Optional[_IndexPrefixes] = None
+        self._mots_resumes: Dict[int, Set[str]] = {}
+        # Ordres de tri, recalculés à la première requête après une modification
+        self._titres_tries: Optional[List[Tuple[str, int]]] = None
+        self._ordre: Optional[List[int]] = None
+        self._positions: Dict[int, int] = {}
+        # (requête courte, avec_resume) -> premiers résultats classés
+        self._courtes: Dict[Tuple[str, bool], List[int]] = {}
+        for film in films:
+            self.ajouter(film)
+
+    def ajouter(self, film: Film):
+        """Indexe un film (ou le réindexe s'il l'est déjà)."""
+        cle = id(film)
+        if cle in self._cles:
+            self.retirer(film)
+        titre = normaliser(film.titre)
+        mots = set(titre.split())
+        tri = trigrammes(titre)
+        self._films[cle] = film
+        self._cles[cle] = (titre, mots, tri)
+        self._titres.ajouter(cle, mots)
+        for t in tri:
+            self._trigrammes.setdefault(t, set()).add(cle)
+        if self._resumes is not None:
+            self._indexer_resume(film)
+        self._titres_tries = self._ordre = None
+        self._courtes.clear()
+
+    def _indexer_resume(self, film: Film):
+        mots = set(normaliser(film.resume or '').split())
+        self._mots_resumes[id(film)] = mots
+        self._resumes.ajouter(id(film), mots)
+
+    def retirer(self, film: Film) -> bool:
+        """
+        Retire un film de l'index.
+
+        Returns:
+            bool: True si le film était indexé.
+        """
+        cle = id(film)
+        entree = self._cles.pop(cle, None)
+        if entree is None:
+            return False
+        del self._films[cle]
+        _, mots, tri = entree
+        self._titres.retirer(cle, mots)
+        for t in tri:
+            films = self._trigrammes[t]
+            films.discard(cle)
+            if not films:
+                del self._trigrammes[t]
+        if self._resumes is not None:
+            self._resumes.retirer(cle, self._mots_resumes.pop(cle))
+        self._titres_tries = self._ordre = None
+        self._courtes.clear()
+        return True
+
+    def rechercher(self, terme: str, avec_resume: bool = False,
+                   limite: Optional[int] = None) -> List[Film]:
+        """
+        Recherche des films par titre et, en option, par synopsis.
+
+        Args:
+            terme (str): Le texte saisi ; chaque mot doit commencer un mot du
+                titre, ou le texte entier doit apparaître dans le titre.
+            avec_resume (bool): Chercher aussi les mots dans les synopsis.
+            limite (Optional[int]): Le nombre maximum de résultats.
+
+        Returns:
+            List[Film]: Les films trouvés, du plus pertinent au moins pertinent.
+        """
+        requete = normaliser(terme)
+        if not requete:
+            return []
+        if len(requete) <= 2 and limite is not None and limite <= NB_RESULTATS_COURTS:
+            cles = self._courtes.get((requete, avec_resume))
+            if cles is None:
+                cles = self._courtes[(requete, avec_resume)] = self._classer(
+                    requete, avec_resume, NB_RESULTATS_COURTS)
+            return [self._films[cle] for cle in cles[:limite]]
+        return [self._films[cle] for cle in self._classer(requete, avec_resume, limite)]
+
+    def _classer(self, requete: str, avec_resume: bool, limite: Optional[int]) -> List[int]:
+        """Les clés des films trouvés pour une requête normalisée, classés."""
+        prefixes = requete.split()
+
+        # Un ensemble de films par rang ; un film n'est classé que dans le
+        # premier rang qui le contient.
+        rangs = [*self._debut_titre(requete), self._titres.tous_prefixes(prefixes)]
+        if len(requete) >= 3:
+            rangs.append(self._dans_titre(requete))
+        if avec_resume:
+            rangs.append(self._index_resumes().tous_prefixes(prefixes))
+
+        cles: List[int] = []
+        # Les rangs précédents ne sont pas réunis en un ensemble : les copier
+        # coûterait plus que de tester l'appartenance de chaque candidat.
+        classes: List[Set[int]] = []
+        for ensemble in rangs:
+            reste = None if limite is None else limite - len(cles)
+            if reste == 0:
+                break
+            if ensemble:
+                cles.extend(self._meilleurs(ensemble, reste, classes))
+                classes.append(ensemble)
+        return cles
+
+    def _debut_titre(self, requete: str) -> Tuple[Set[int], Set[int]]:
+        """Les films dont le titre est la requête, puis ceux dont il commence par elle."""
+        if self._titres_tries is None:
+            self._titres_tries = sorted((titre, cle) for cle, (titre, _, _) in self._cles.items())
+        titres = self._titres_tries
+        i = bisect_left(titres, (requete,))
+        j = bisect_left(titres, (requete + '\U0010ffff',), i)
+        exacts = set()
+        while i < j and titres[i][0] == requete:
+            exacts.add(titres[i][1])
+            i += 1
+        return exacts, {cle for _, cle in titres[i:j]}
+
+    def _meilleurs(self, ensemble: Set[int], nombre: Optional[int], exclus: List[Set[int]]) -> List[int]:
+        """Les `nombre` films les mieux notés d'un ensemble, hors des ensembles `exclus`."""
+        if self._ordre is None:
+            self._ordre = sorted(self._films, key=lambda c: (-self._films[c].note, self._films[c].titre))
+            self._positions = {cle: i for i, cle in enumerate(self._ordre)}
+        if nombre is not None and len(ensemble) ** 2 > nombre * len(self._ordre):
+            # Ensemble dense : le catalogue, parcouru dans l'ordre des notes,
+            # en fournit `nombre` en environ nombre * len(catalogue) / len(ensemble)
+            # étapes, moins que le tri de l'ensemble.
+            choisis = []
+            for cle in self._ordre:
+                if cle in ensemble and not any(cle in e for e in exclus):
+                    choisis.append(cle)
+                    if len(choisis) == nombre:
+                        break
+            return choisis
+        # Les positions dans l'ordre des notes sont triées directement, sans clé.
+        positions = self._positions
+        candidats = [positions[cle] for cle in ensemble if not any(cle in e for e in exclus)]
+        meilleures = sorted(candidats) if nombre is None else heapq.nsmallest(nombre, candidats)
+        return [self._ordre[i] for i in meilleures]
+
+    def _index_resumes(self) -> _IndexPrefixes:
+        if self._resumes is None:
+            self._resumes = _IndexPrefixes()
+            for film in self._films.values():
+                self._indexer_resume(film)
+        return self._resumes
+
+    def _dans_titre(self, requete: str) -> Set[int]:
+        """Les films dont le titre normalisé contient la requête."""
+        listes = []
+        for t in trigrammes(requete):
+            films = self._trigrammes.get(t)
+            if not films:
+                return set()
+            listes.append(films)
+        listes.sort(key=len)
+        candidats = listes[0].intersection(*listes[1:])
+        return {cle for cle in candidats if requete in self._cles[cle][0]}
+
+    def __len__(self) -> int:
+        return len(self._films)
@@ -0,0 +1,224 @@
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.reservation import Reservation
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif : les agrégations passent alors en Python pur
+    np = None
+
+# Axes de regroupement acceptés par `RegistreReservations.revenus_par`.
+AXES = ('seance', 'film', 'salle', 'tarif', 'heure', 'jour')
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _instant_local(horodatage: float) -> float:
+    """Secondes de l'heure locale (murale) depuis le 1er janvier 1970."""
+    return (datetime.fromtimestamp(horodatage) - _EPOCH).total_seconds()
+
+
+class _Dimension:
+    """Table d'objets (séances, films, ...) numérotés par ordre d'apparition."""
+    __slots__ = ('objets', '_positions')
+
+    def __init__(self):
+        self.objets: List[object] = []
+        self._positions: Dict[int, int] = {}
+
+    def indice(self, objet) -> int:
+        # Indexé par identité ; la table garde une référence à l'objet, son
+        # id() ne peut donc pas être réattribué.
+        position = self._positions.get(id(objet))
+        if position is None:
+            position = self._positions[id(objet)] = len(self.objets)
+            self.objets.append(objet)
+        return position
+
+
+class RegistreReservations:
+    """
+    Registre en colonnes des réservations, pour les analyses sur l'historique.
+
+    Chaque réservation occupe une ligne de tableaux parallèles (`array`) :
+    indices de séance, de film, de salle et de tarif, nombre de places, prix
+    unitaire et instant de création. Une ligne coûte une quarantaine
+    d'octets, sans objet Python par réservation, et les colonnes peuvent être
+    lues sans copie par NumPy : les regroupements (revenus par film, par
+    salle, par tarif, par heure ou par jour) sont alors calculés par
+    `numpy.bincount` plutôt que par une boucle sur les réservations. Sans
+    NumPy, le même calcul est fait en Python pur.
+
+    Une réservation annulée garde sa ligne, avec zéro place : elle ne compte
+    plus dans aucun regroupement. Le film et la salle sont ceux de la séance
+    au moment de la réservation ; le service reconstruit le registre quand
+    une modification les change rétroactivement.
+    """
+
+    def __init__(self):
+        self._seances = _Dimension()
+        self._films = _Dimension()
+        self._salles = _Dimension()
+        self._tarifs = _Dimension()
+        self._colonnes = {
+            'seance': array('i'),
+            'film': array('i'),
+            'salle': array('i'),
+            'tarif': array('i'),
+        }
+        self._places = array('i')
+        self._prix_unitaires = array('d')
+        self._instants = array('d')
+        # id de réservation -> numéro de ligne
+        self._lignes: Dict[str, int] = {}
+
+    @classmethod
+    def depuis(cls, reservations: Iterable[Reservation]) -> 'RegistreReservations':
+        """Construit un registre à partir de réservations existantes."""
+        registre = cls()
+        for reservation in reservations:
+            registre.ajouter(reservation)
+        return registre
+
+    def ajouter(self, reservation: Reservation):
+        """Ajoute une ligne pour une nouvelle réservation."""
+        seance = reservation.seance
+        colonnes = self._colonnes
+        self._lignes[reservation.id] = len(self._places)
+        colonnes['seance'].append(self._seances.indice(seance))
+        colonnes['film'].append(self._films.indice(seance.film))
+        colonnes['salle'].append(self._salles.indice(seance.salle))
+        colonnes['tarif'].append(self._tarifs.indice(reservation.tarif))
+        self._places.append(reservation.nb_places)
+        self._prix_unitaires.append(reservation.prix_unitaire)
+        self._instants.append(_instant_local(reservation.horodatage))
+
+    def retirer(self, reservation: Reservation) -> bool:
+        """
+        Retire une réservation annulée des regroupements.
+
+        Returns:
+            bool: True si la réservation figurait dans le registre.
+        """
+        ligne = self._lignes.pop(reservation.id, None)
+        if ligne is None:
+            return False
+        self._places[ligne] = 0
+        return True
+
+    def __len__(self) -> int:
+        return len(self._lignes)
+
+    def revenus_par(self, axe: str, debut: Optional[datetime] = None,
+                    fin: Optional[datetime] = None) -> Dict[object, Dict]:
+        """
+        Regroupe les réservations actives selon un axe.
+
+        Args:
+            axe (str): 'seance', 'film', 'salle', 'tarif' (regroupés par id,
+                titre, nom ou libellé), 'heure' (heure de la journée, 0 à 23)
+                ou 'jour' (date), ces deux derniers selon l'instant de la
+                réservation.
+            debut (Optional[datetime]): Ne compter que les réservations faites
+                à partir de cet instant.
+            fin (Optional[datetime]): Ne compter que les réservations faites
+                avant cet instant.
+
+        Returns:
+            Dict[object, Dict]: Pour chaque groupe, le nombre de réservations
+                ('reservations'), de places ('places') et les revenus
+                ('revenus').
+
+        Raises:
+            ValueError: Si l'axe n'est pas l'un de `AXES`.
+        """
+        if axe not in AXES:
+            raise ValueError(f"Axe inconnu : {axe!r} (attendu : {', '.join(AXES)}).")
+        bornes = (
+            (debut - _EPOCH).total_seconds() if debut is not None else None,
+            (fin - _EPOCH).total_seconds() if fin is not None else None,
+        )
+        if not self._places:
+            return {}
+        if np is not None:
+            groupes = self._grouper_numpy(axe, *bornes)
+        else:
+            groupes = self._grouper_python(axe, *bornes)
+
+        resultat: Dict[object, Dict] = {}
+        for code, (nombre, places, revenus) in sorted(groupes.items()):
+            entree = resultat.setdefault(self._etiquette(axe, code),
+                                         {'reservations': 0, 'places': 0, 'revenus': 0.0})
+            entree['reservations'] += nombre
+            entree['places'] += places
+            entree['revenus'] += revenus
+        for entree in resultat.values():
+            entree['revenus'] = round(entree['revenus'], 2)
+        return resultat
+
+    def _etiquette(self, axe: str, code: int):
+        if axe == 'heure':
+            return code
+        if axe == 'jour':
+            return date(1970, 1, 1) + timedelta(days=code)
+        if axe == 'seance':
+            return self._seances.objets[code].id
+        if axe == 'film':
+            return self._films.objets[code].titre
+        if axe == 'salle':
+            return self._salles.objets[code].nom
+        return self._tarifs.objets[code].label
+
+    def _grouper_numpy(self, axe: str, debut: Optional[float],
+                       fin: Optional[float]) -> Dict[int, Tuple[int, int, float]]:
+        # Vues sans copie sur les tableaux du registre.
+        places = np.frombuffer(self._places, dtype=np.intc)
+        prix = np.frombuffer(self._prix_unitaires, dtype=np.float64)
+        instants = np.frombuffer(self._instants, dtype=np.float64)
+
+        garder = places > 0
+        if debut is not None:
+            garder &= instants >= debut
+        if fin is not None:
+            garder &= instants < fin
+        if axe == 'heure':
+            codes = (instants[garder] // 3600 % 24).astype(np.intp)
+        elif axe == 'jour':
+            codes = (instants[garder] // 86400).astype(np.intp)
+        else:
+            codes = np.frombuffer(self._colonnes[axe], dtype=np.intc)[garder].astype(np.intp)
+        if codes.size == 0:
+            return {}
+
+        # bincount demande des codes positifs et compacts : les jours sont
+        # décalés sur le premier jour présent.
+        base = int(codes.min()) if axe == 'jour' else 0
+        codes -= base
+        places = places[garder]
+        nombres = np.bincount(codes)
+        sommes_places = np.bincount(codes, weights=places)
+        revenus = np.bincount(codes, weights=places * prix[garder])
+        return {int(code) + base: (int(nombres[code]), int(sommes_places[code]), float(revenus[code]))
+                for code in np.flatnonzero(nombres)}
+
+    def _grouper_python(self, axe: str, debut: Optional[float],
+                        fin: Optional[float]) -> Dict[int, Tuple[int, int, float]]:
+        if axe == 'heure':
+            codes = (int(instant // 3600) % 24 for instant in self._instants)
+        elif axe == 'jour':
+            codes = (int(instant // 86400) for instant in self._instants)
+        else:
+            codes = self._colonnes[axe]
+        groupes: Dict[int, list] = {}
+        for code, places, prix, instant in zip(codes, self._places, self._prix_unitaires, self._instants):
+            if not places or (debut is not None and instant < debut) or (fin is not None and instant >= fin):
+                continue
+            groupe = groupes.get(code)
+            if groupe is None:
+                groupe = groupes[code] = [0, 0, 0.0]
+            groupe[0] += 1
+            groupe[1] += places
+            groupe[2] += places * prix
+        return {code: tuple(groupe) for code, groupe in groupes.items()}
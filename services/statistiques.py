@@ -0,0 +1,219 @@
+from typing import Dict, List
+
+from models.film import Film
+from models.salle import Salle
+from models.seance import Seance
+from models.reservation import Reservation
+
+
+def calculer_statistiques(films: List[Film], salles: List[Salle], seances: List[Seance],
+                          reservations: List[Reservation]) -> Dict:
+    """
+    Recalcule entièrement les statistiques à partir des listes du service.
+
+    C'est le calcul de référence : il parcourt toutes les réservations et
+    toutes les séances. Il sert à contrôler la cohérence de
+    `AgregateurStatistiques` et à le reconstruire.
+
+    Returns:
+        Dict: Le même dictionnaire que `CinemaService.get_statistiques`.
+    """
+    stats = {
+        'total_films': len(films),
+        'total_salles': len(salles),
+        'total_seances': len(seances),
+        'total_reservations': len(reservations),
+        'total_places_vendues': 0,
+        'total_revenus': 0.0,
+        'films_populaires': {},
+        'occupation_salles': {},
+        'repartition_tarifs': {}
+    }
+
+    # Agrégation des données par film et par tarif
+    for reservation in reservations:
+        prix = reservation.prix_total
+        stats['total_places_vendues'] += reservation.nb_places
+        stats['total_revenus'] += prix
+
+        film = reservation.seance.film.titre
+        if film not in stats['films_populaires']:
+            stats['films_populaires'][film] = {'places': 0, 'revenus': 0.0}
+        stats['films_populaires'][film]['places'] += reservation.nb_places
+        stats['films_populaires'][film]['revenus'] += prix
+
+        tarif = reservation.tarif.label
+        stats['repartition_tarifs'][tarif] = stats['repartition_tarifs'].get(tarif, 0) + reservation.nb_places
+
+    # Agrégation des données par salle
+    for seance in seances:
+        salle = seance.salle.nom
+        if salle not in stats['occupation_salles']:
+            stats['occupation_salles'][salle] = {
+                'capacite_totale': 0,
+                'places_vendues': 0
+            }
+        stats['occupation_salles'][salle]['capacite_totale'] += seance.salle.capacite
+        stats['occupation_salles'][salle]['places_vendues'] += seance.places_reservees
+
+    return stats
+
+
+class AgregateurStatistiques:
+    """
+    Compteurs de statistiques tenus à jour à chaque événement.
+
+    Chaque réservation créée ou annulée et chaque séance ajoutée ou retirée
+    met à jour les compteurs en temps constant ; `instantane` se contente
+    ensuite de mettre en forme les compteurs. Les compteurs sont indexés par
+    identité d'objet (`id(film)`, `id(salle)`, `id(tarif)`) et non par nom :
+    renommer un film ou une salle ne désynchronise donc pas l'agrégat, les
+    noms étant lus au moment de l'instantané.
+    """
+
+    def __init__(self):
+        self.total_reservations = 0
+        self.total_places_vendues = 0
+        self.total_revenus = 0.0
+        # id(film) -> [film, nb_reservations, places, revenus]
+        self._films: Dict[int, list] = {}
+        # id(salle) -> [salle, nb_seances, capacite_totale, places_vendues]
+        self._salles: Dict[int, list] = {}
+        # id(tarif) -> [tarif, nb_reservations, places]
+        self._tarifs: Dict[int, list] = {}
+
+    @classmethod
+    def depuis(cls, seances: List[Seance], reservations: List[Reservation]) -> 'AgregateurStatistiques':
+        """
+        Construit un agrégat à partir de l'état courant du service.
+
+        L'occupation des salles est lue sur les séances elles-mêmes ; les
+        réservations ne sont donc comptées que pour les films et les tarifs.
+        """
+        agregat = cls()
+        for seance in seances:
+            agregat.ajouter_seance(seance)
+        for reservation in reservations:
+            agregat.ajouter_reservation(reservation, seance_programmee=False)
+        return agregat
+
+    def ajouter_reservation(self, reservation: Reservation, seance_programmee: bool = True):
+        """
+        Comptabilise une nouvelle réservation.
+
+        Args:
+            reservation (Reservation): La réservation créée.
+            seance_programmee (bool): False si la séance a été retirée du
+                programme ; les places ne comptent alors plus dans
+                l'occupation de la salle.
+        """
+        self._compter_reservation(reservation, 1, seance_programmee)
+
+    def retirer_reservation(self, reservation: Reservation, seance_programmee: bool = True):
+        """Décompte une réservation annulée (voir `ajouter_reservation`)."""
+        self._compter_reservation(reservation, -1, seance_programmee)
+
+    def _compter_reservation(self, reservation: Reservation, signe: int, seance_programmee: bool):
+        places = signe * reservation.nb_places
+        prix = signe * reservation.prix_total
+        self.total_reservations += signe
+        self.total_places_vendues += places
+        self.total_revenus += prix
+
+        film = reservation.seance.film
+        entree = self._films.setdefault(id(film), [film, 0, 0, 0.0])
+        entree[1] += signe
+        entree[2] += places
+        entree[3] += prix
+        if entree[1] == 0:
+            del self._films[id(film)]
+
+        tarif = reservation.tarif
+        entree = self._tarifs.setdefault(id(tarif), [tarif, 0, 0])
+        entree[1] += signe
+        entree[2] += places
+        if entree[1] == 0:
+            del self._tarifs[id(tarif)]
+
+        if seance_programmee:
+            entree = self._salles.get(id(reservation.seance.salle))
+            if entree is not None:
+                entree[3] += places
+
+    def ajouter_seance(self, seance: Seance):
+        """Comptabilise une séance ajoutée au programme."""
+        self._compter_seance(seance, 1)
+
+    def retirer_seance(self, seance: Seance):
+        """Décompte une séance retirée du programme."""
+        self._compter_seance(seance, -1)
+
+    def _compter_seance(self, seance: Seance, signe: int):
+        salle = seance.salle
+        entree = self._salles.setdefault(id(salle), [salle, 0, 0, 0])
+        entree[1] += signe
+        entree[2] += signe * salle.capacite
+        entree[3] += signe * seance.places_reservees
+        if entree[1] == 0:
+            del self._salles[id(salle)]
+
+    def instantane(self, total_films: int, total_salles: int, total_seances: int) -> Dict:
+        """
+        Met en forme les compteurs courants.
+
+        Returns:
+            Dict: Le même dictionnaire que `calculer_statistiques`.
+        """
+        films_populaires = {}
+        for film, _, places, revenus in self._films.values():
+            entree = films_populaires.setdefault(film.titre, {'places': 0, 'revenus': 0.0})
+            entree['places'] += places
+            entree['revenus'] += revenus
+
+        occupation_salles = {}
+        for salle, _, capacite, vendues in self._salles.values():
+            entree = occupation_salles.setdefault(salle.nom, {'capacite_totale': 0, 'places_vendues': 0})
+            entree['capacite_totale'] += capacite
+            entree['places_vendues'] += vendues
+
+        repartition_tarifs = {}
+        for tarif, _, places in self._tarifs.values():
+            repartition_tarifs[tarif.label] = repartition_tarifs.get(tarif.label, 0) + places
+
+        return {
+            'total_films': total_films,
+            'total_salles': total_salles,
+            'total_seances': total_seances,
+            'total_reservations': self.total_reservations,
+            'total_places_vendues': self.total_places_vendues,
+            'total_revenus': self.total_revenus,
+            'films_populaires': films_populaires,
+            'occupation_salles': occupation_salles,
+            'repartition_tarifs': repartition_tarifs
+        }
+
+
+def comparer_statistiques(attendues: Dict, obtenues: Dict, precision: int = 2) -> List[str]:
+    """
+    Compare deux dictionnaires de statistiques.
+
+    Les montants sont comparés après arrondi pour absorber les écarts
+    d'accumulation des flottants.
+
+    Returns:
+        List[str]: La description de chaque écart ; vide si les deux
+            dictionnaires concordent.
+    """
+    def normaliser(valeur):
+        if isinstance(valeur, float):
+            return round(valeur, precision)
+        if isinstance(valeur, dict):
+            return {k: normaliser(v) for k, v in valeur.items()}
+        return valeur
+
+    ecarts = []
+    for cle in attendues.keys() | obtenues.keys():
+        a, o = normaliser(attendues.get(cle)), normaliser(obtenues.get(cle))
+        if a != o:
+            ecarts.append(f"{cle}: attendu {a!r}, obtenu {o!r}")
+    return sorted(ecarts)
@@ -0,0 +1,3 @@
+from .base import Registre, Stockage
+from .journal import StockageJournal
+from .sqlite import StockageSQLite
@@ -0,0 +1,133 @@
+from typing import Dict, Generic, Iterable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class Registre(Generic[T]):
+    """
+    Associe des objets du modèle à une clé de stockage.
+
+    Les dataclasses du modèle ne sont pas hachables et certains n'ont pas
+    d'identifiant stable (un film peut être renommé) : la correspondance est
+    donc faite par identité d'objet. Le registre garde une référence vers
+    chaque objet enregistré, ce qui empêche la réutilisation de son `id()`.
+    """
+
+    def __init__(self):
+        self._cles: Dict[int, Tuple[T, object]] = {}
+
+    def enregistrer(self, objet: T, cle):
+        self._cles[id(objet)] = (objet, cle)
+
+    def cle(self, objet: T):
+        """Retourne la clé de l'objet, ou None s'il n'est pas enregistré."""
+        entree = self._cles.get(id(objet))
+        return entree[1] if entree is not None else None
+
+    def oublier(self, objet: T):
+        self._cles.pop(id(objet), None)
+
+
+class Stockage:
+    """
+    Interface des backends de persistance de `CinemaService`.
+
+    Le service appelle `charger` à sa création, puis notifie le backend après
+    chaque mutation réussie. Cette implémentation de base ne persiste rien :
+    c'est le mode en mémoire, utilisé par défaut et pour les tests.
+    """
+
+    def charger(self, service) -> bool:
+        """
+        Peuple les listes du service à partir des données persistées.
+
+        Le backend remplit `films`, `salles`, `tarifs`, `seances` et
+        `reservations` ; le service reconstruit ensuite ses index.
+
+        Returns:
+            bool: False si le stockage est vide (le service génère alors ses
+                données de démonstration puis appelle `initialiser`).
+        """
+        return False
+
+    def identifiants_seances(self) -> Iterable[str]:
+        """
+        Retourne les identifiants de toutes les séances jamais persistées.
+
+        Y compris celles qui ont été supprimées : le service ne doit pas les
+        réattribuer.
+        """
+        return ()
+
+    def borne_identifiants(self, prefixe: str) -> int:
+        """
+        Retourne la borne persistée du compteur de billets d'un site.
+
+        Toutes les valeurs inférieures ont pu être attribuées (voir
+        `AllocateurIdentifiants`) ; 0 si le site n'a jamais émis de billet.
+        """
+        return 0
+
+    def identifiants_reserves(self, prefixe: str, borne: int):
+        """Le compteur de billets du site `prefixe` peut désormais atteindre `borne` (exclue)."""
+
+    def initialiser(self, service):
+        """Persiste l'intégralité de l'état du service (premier lancement)."""
+
+    def film_ajoute(self, film):
+        pass
+
+    def film_modifie(self, film):
+        pass
+
+    def film_supprime(self, film):
+        pass
+
+    def salle_ajoutee(self, salle):
+        pass
+
+    def salle_modifiee(self, salle):
+        pass
+
+    def salle_supprimee(self, salle):
+        pass
+
+    def tarif_ajoute(self, tarif):
+        pass
+
+    def tarif_modifie(self, tarif):
+        pass
+
+    def tarif_supprime(self, tarif):
+        pass
+
+    def seance_ajoutee(self, seance):
+        pass
+
+    def seances_ajoutees(self, seances):
+        """Un lot de séances programmé en une fois (voir `CinemaService.programmer`)."""
+        for seance in seances:
+            self.seance_ajoutee(seance)
+
+    def seance_modifiee(self, seance):
+        pass
+
+    def seance_supprimee(self, seance):
+        pass
+
+    def reservation_creee(self, reservation):
+        pass
+
+    def reservations_creees(self, reservations):
+        """Un lot de réservations créé en une fois (voir `creer_reservations_bulk`)."""
+        for reservation in reservations:
+            self.reservation_creee(reservation)
+
+    def reservation_annulee(self, reservation):
+        pass
+
+    def reservations_videes(self):
+        pass
+
+    def fermer(self):
+        """Libère les ressources du backend (fichiers, connexions)."""
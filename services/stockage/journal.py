@@ -0,0 +1,490 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict
+
+from models.film import Film
+from models.salle import Salle
+from models.seance import Seance
+from models.reservation import Reservation, Tarif
+from models.enums import StyleFilm, TypeSalle
+from .base import Registre, Stockage
+
+FICHIER_JOURNAL = "journal.jsonl"
+FICHIER_INSTANTANE = "instantane.json"
+
+
+class StockageJournal(Stockage):
+    """
+    Backend de persistance léger : un journal en ajout seul et des instantanés.
+
+    Chaque mutation notifiée par le service est sérialisée en une ligne JSON
+    compacte, numérotée, et ajoutée à `journal.jsonl`. La ligne est transmise
+    au système à chaque écriture (une erreur du processus ne perd rien),
+    mais le `fsync` n'est fait que par lots : au plus `lot_fsync`
+    enregistrements, ou `delai_fsync` secondes, peuvent être perdus en cas de
+    panne de la machine.
+
+    Tous les `intervalle_instantane` enregistrements, l'état complet est
+    écrit dans `instantane.json` (fichier temporaire puis `os.replace`,
+    atomique) et le journal est vidé. Le démarrage charge l'instantané puis
+    rejoue les seuls enregistrements postérieurs : sa durée est bornée par la
+    taille de l'état et par l'intervalle, pas par la longueur de l'historique.
+
+    Args:
+        dossier (str): Le dossier contenant le journal et l'instantané.
+        lot_fsync (int): Nombre maximal d'enregistrements entre deux `fsync`.
+        delai_fsync (float): Délai maximal, en secondes, entre deux `fsync`.
+        intervalle_instantane (int): Nombre d'enregistrements entre deux
+            instantanés.
+    """
+
+    def __init__(self, dossier: str, lot_fsync: int = 32, delai_fsync: float = 0.5,
+                 intervalle_instantane: int = 5000):
+        self.dossier = dossier
+        self.lot_fsync = lot_fsync
+        self.delai_fsync = delai_fsync
+        self.intervalle_instantane = intervalle_instantane
+        os.makedirs(dossier, exist_ok=True)
+        self._chemin_journal = os.path.join(dossier, FICHIER_JOURNAL)
+        self._chemin_instantane = os.path.join(dossier, FICHIER_INSTANTANE)
+        self._verrou = threading.Lock()
+        self._service = None
+        self._journal = None
+        self._instantane_en_cours = False
+        self._sequence = 0
+        self._non_synchronises = 0
+        self._dernier_fsync = time.monotonic()
+        self._depuis_instantane = 0
+        self._prochaine_cle = 1
+        self._ids_seances = set()
+        self._bornes_identifiants: Dict[str, int] = {}
+        self._films: Registre[Film] = Registre()
+        self._salles: Registre[Salle] = Registre()
+        self._tarifs: Registre[Tarif] = Registre()
+
+    # --- Sérialisation ---
+
+    def _cle(self, registre: Registre, objet) -> int:
+        cle = registre.cle(objet)
+        if cle is None:
+            cle = self._prochaine_cle
+            self._prochaine_cle += 1
+            registre.enregistrer(objet, cle)
+        return cle
+
+    def _film(self, film: Film) -> dict:
+        return {'k': self._cle(self._films, film), 'titre': film.titre, 'duree': film.duree,
+                'style': film.style.value, 'note': film.note, 'poster': film.poster_path,
+                'resume': film.resume}
+
+    def _salle(self, salle: Salle) -> dict:
+        return {'k': self._cle(self._salles, salle), 'numero': salle.numero, 'nom': salle.nom,
+                'capacite': salle.capacite, 'type': salle.type_salle.value}
+
+    def _tarif(self, tarif: Tarif) -> dict:
+        return {'k': self._cle(self._tarifs, tarif), 'label': tarif.label, 'coeff': tarif.coeff}
+
+    def _seance(self, seance: Seance) -> dict:
+        self._ids_seances.add(seance.id)
+        return {'id': seance.id, 'film': self._cle(self._films, seance.film),
+                'salle': self._cle(self._salles, seance.salle), 'horaire': seance.horaire.isoformat()}
+
+    def _reservation(self, reservation: Reservation) -> dict:
+        return {'id': reservation.id, 'seance': reservation.seance.id,
+                'client': reservation.client_nom, 'nb': reservation.nb_places,
+                'tarif': self._cle(self._tarifs, reservation.tarif),
+                'places': list(reservation.numeros_places),
+                'date': reservation.date_creation.isoformat(),
+                'prix': reservation.prix_unitaire}
+
+    # --- Chargement ---
+
+    def charger(self, service) -> bool:
+        self._service = service
+        etat = _EtatRejoue(self)
+        existe = False
+
+        if os.path.exists(self._chemin_instantane):
+            with open(self._chemin_instantane, encoding='utf-8') as f:
+                instantane = json.load(f)
+            etat.restaurer(instantane)
+            self._sequence = instantane['sequence']
+            existe = True
+
+        if os.path.exists(self._chemin_journal):
+            with open(self._chemin_journal, encoding='utf-8') as f:
+                for ligne in f:
+                    try:
+                        enregistrement = json.loads(ligne)
+                    except ValueError:
+                        # Dernière ligne tronquée par une panne : on s'arrête là.
+                        break
+                    if enregistrement['n'] <= self._sequence:
+                        continue  # Déjà inclus dans l'instantané
+                    etat.appliquer(enregistrement)
+                    self._sequence = enregistrement['n']
+                    self._depuis_instantane += 1
+                    existe = True
+
+        self._ouvrir_journal()
+        if not existe:
+            return False
+        etat.transferer(service)
+        return True
+
+    def identifiants_seances(self):
+        return self._ids_seances
+
+    def borne_identifiants(self, prefixe):
+        return self._bornes_identifiants.get(prefixe, 0)
+
+    def identifiants_reserves(self, prefixe, borne):
+        self._bornes_identifiants[prefixe] = borne
+        self._ajouter('ids', {'p': prefixe, 'b': borne})
+        # Synchronisé tout de suite : les billets du bloc ne doivent pas
+        # pouvoir être réattribués après une panne.
+        self.synchroniser()
+
+    def initialiser(self, service):
+        self._service = service
+        self.ecrire_instantane()
+
+    def _ouvrir_journal(self):
+        # Coupe une éventuelle dernière ligne tronquée avant d'écrire à la suite.
+        if os.path.exists(self._chemin_journal):
+            with open(self._chemin_journal, 'rb') as f:
+                contenu = f.read()
+            valide = contenu.rfind(b'\n') + 1
+            if valide < len(contenu):
+                os.truncate(self._chemin_journal, valide)
+        self._journal = open(self._chemin_journal, 'a', encoding='utf-8')
+
+    # --- Écriture du journal ---
+
+    def _ajouter(self, evenement: str, donnees: dict):
+        self._ajouter_plusieurs([(evenement, donnees)])
+
+    def _ajouter_plusieurs(self, enregistrements):
+        with self._verrou:
+            lignes = []
+            for evenement, donnees in enregistrements:
+                self._sequence += 1
+                donnees['n'] = self._sequence
+                donnees['e'] = evenement
+                lignes.append(json.dumps(donnees, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self._journal.write(''.join(lignes))
+            self._journal.flush()
+            self._non_synchronises += len(lignes)
+            if (self._non_synchronises >= self.lot_fsync
+                    or time.monotonic() - self._dernier_fsync >= self.delai_fsync):
+                self._synchroniser()
+            self._depuis_instantane += len(lignes)
+            instantane_du = (self._depuis_instantane >= self.intervalle_instantane
+                             and not self._instantane_en_cours)
+            if instantane_du:
+                self._instantane_en_cours = True
+        if instantane_du:
+            self._ecrire_instantane()
+
+    def _synchroniser(self):
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._non_synchronises = 0
+        self._dernier_fsync = time.monotonic()
+
+    def synchroniser(self):
+        """Force l'écriture sur disque des enregistrements en attente."""
+        with self._verrou:
+            self._synchroniser()
+
+    def ecrire_instantane(self):
+        """Écrit un instantané de l'état courant et compacte le journal."""
+        with self._verrou:
+            if self._instantane_en_cours:
+                return
+            self._instantane_en_cours = True
+        self._ecrire_instantane()
+
+    def _ecrire_instantane(self):
+        # Appelée sans tenir self._verrou : l'état est lu sous le verrou des
+        # listes du service, que les opérations d'administration tiennent
+        # lorsqu'elles écrivent dans le journal. Les deux verrous ne sont
+        # donc jamais pris dans cet ordre-ci.
+        try:
+            with self._verrou:
+                self._journal.flush()
+                sequence = self._sequence
+                position = self._journal.tell()
+            # Les enregistrements postérieurs à `sequence` seront rejoués
+            # sur l'instantané : ils peuvent déjà y figurer, ce qui est sans
+            # effet car chacun fixe un état (création, valeurs, suppression).
+            with self._service.verrou_listes:
+                instantane = self._etat(sequence)
+
+            temporaire = self._chemin_instantane + '.tmp'
+            with open(temporaire, 'w', encoding='utf-8') as f:
+                json.dump(instantane, f, ensure_ascii=False, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporaire, self._chemin_instantane)
+            _synchroniser_dossier(self.dossier)
+
+            with self._verrou:
+                self._compacter(position)
+                self._depuis_instantane = self._sequence - sequence
+        finally:
+            self._instantane_en_cours = False
+
+    def _compacter(self, position: int):
+        """
+        Retire du journal les enregistrements couverts par l'instantané.
+
+        Seule la fin du journal, à partir de `position`, est conservée. Une
+        panne avant le remplacement est sans effet : les enregistrements déjà
+        inclus dans l'instantané sont ignorés au rechargement.
+        """
+        self._journal.flush()
+        with open(self._chemin_journal, 'rb') as f:
+            f.seek(position)
+            reste = f.read()
+        temporaire = self._chemin_journal + '.tmp'
+        with open(temporaire, 'wb') as f:
+            f.write(reste)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal.close()
+        os.replace(temporaire, self._chemin_journal)
+        _synchroniser_dossier(self.dossier)
+        self._journal = open(self._chemin_journal, 'a', encoding='utf-8')
+        self._non_synchronises = 0
+        self._dernier_fsync = time.monotonic()
+
+    def _etat(self, sequence: int) -> dict:
+        service = self._service
+        # Les objets retirés mais encore référencés par une réservation sont
+        # conservés, marqués inactifs.
+        seances = {id(s): s for s in service.seances}
+        for reservation in service.reservations:
+            seances.setdefault(id(reservation.seance), reservation.seance)
+        films = {id(f): f for f in service.films}
+        salles = {id(s): s for s in service.salles}
+        tarifs = {id(t): t for t in service.tarifs}
+        for seance in seances.values():
+            films.setdefault(id(seance.film), seance.film)
+            salles.setdefault(id(seance.salle), seance.salle)
+        for reservation in service.reservations:
+            tarifs.setdefault(id(reservation.tarif), reservation.tarif)
+
+        actifs = {id(o) for o in [*service.films, *service.salles, *service.tarifs, *service.seances]}
+
+        def avec_etat(donnees: dict, objet) -> dict:
+            donnees['actif'] = id(objet) in actifs
+            return donnees
+
+        return {
+            'sequence': sequence,
+            'films': [avec_etat(self._film(f), f) for f in films.values()],
+            'salles': [avec_etat(self._salle(s), s) for s in salles.values()],
+            'tarifs': [avec_etat(self._tarif(t), t) for t in tarifs.values()],
+            'seances': [avec_etat(self._seance(s), s) for s in seances.values()],
+            'ids_seances': sorted(self._ids_seances),
+            'bornes_identifiants': dict(self._bornes_identifiants),
+            'reservations': [self._reservation(r) for r in service.reservations],
+        }
+
+    # --- Notifications du service ---
+
+    def film_ajoute(self, film):
+        self._ajouter('film+', self._film(film))
+
+    def film_modifie(self, film):
+        self._ajouter('film~', self._film(film))
+
+    def film_supprime(self, film):
+        self._ajouter('film-', {'k': self._cle(self._films, film)})
+
+    def salle_ajoutee(self, salle):
+        self._ajouter('salle+', self._salle(salle))
+
+    def salle_modifiee(self, salle):
+        self._ajouter('salle~', self._salle(salle))
+
+    def salle_supprimee(self, salle):
+        self._ajouter('salle-', {'k': self._cle(self._salles, salle)})
+
+    def tarif_ajoute(self, tarif):
+        self._ajouter('tarif+', self._tarif(tarif))
+
+    def tarif_modifie(self, tarif):
+        self._ajouter('tarif~', self._tarif(tarif))
+
+    def tarif_supprime(self, tarif):
+        self._ajouter('tarif-', {'k': self._cle(self._tarifs, tarif)})
+
+    def seance_ajoutee(self, seance):
+        self._ajouter('seance+', self._seance(seance))
+
+    def seances_ajoutees(self, seances):
+        self._ajouter_plusieurs([('seance+', self._seance(s)) for s in seances])
+
+    def seance_modifiee(self, seance):
+        self._ajouter('seance~', self._seance(seance))
+
+    def seance_supprimee(self, seance):
+        self._ajouter('seance-', {'id': seance.id})
+
+    def reservation_creee(self, reservation):
+        self._ajouter('resa+', self._reservation(reservation))
+
+    def reservations_creees(self, reservations):
+        self._ajouter_plusieurs([('resa+', self._reservation(r)) for r in reservations])
+
+    def reservation_annulee(self, reservation):
+        self._ajouter('resa-', {'id': reservation.id})
+
+    def reservations_videes(self):
+        self._ajouter('resa0', {})
+
+    def fermer(self):
+        with self._verrou:
+            if self._journal is not None:
+                self._synchroniser()
+                self._journal.close()
+                self._journal = None
+
+
+class _EtatRejoue:
+    """
+    État reconstruit à partir d'un instantané et des enregistrements du journal.
+
+    Les objets sont indexés par clé ; les dictionnaires `actifs` conservent
+    l'ordre d'insertion, qui devient celui des listes du service.
+    """
+
+    def __init__(self, stockage: StockageJournal):
+        self._stockage = stockage
+        self.films: Dict[int, Film] = {}
+        self.salles: Dict[int, Salle] = {}
+        self.tarifs: Dict[int, Tarif] = {}
+        self.seances: Dict[str, Seance] = {}
+        self.films_actifs: Dict[int, Film] = {}
+        self.salles_actives: Dict[int, Salle] = {}
+        self.tarifs_actifs: Dict[int, Tarif] = {}
+        self.seances_actives: Dict[str, Seance] = {}
+        self.reservations: Dict[str, Reservation] = {}
+
+    def restaurer(self, instantane: dict):
+        for donnees in instantane['films']:
+            self._film(donnees, donnees['actif'])
+        for donnees in instantane['salles']:
+            self._salle(donnees, donnees['actif'])
+        for donnees in instantane['tarifs']:
+            self._tarif(donnees, donnees['actif'])
+        for donnees in instantane['seances']:
+            self._seance(donnees, donnees['actif'])
+        for donnees in instantane['reservations']:
+            self._reservation(donnees)
+        self._stockage._ids_seances.update(instantane['ids_seances'])
+        self._stockage._bornes_identifiants.update(instantane.get('bornes_identifiants', {}))
+
+    def appliquer(self, e: dict):
+        evenement = e['e']
+        if evenement in ('film+', 'film~'):
+            self._film(e, True)
+        elif evenement == 'film-':
+            self.films_actifs.pop(e['k'], None)
+        elif evenement in ('salle+', 'salle~'):
+            self._salle(e, True)
+        elif evenement == 'salle-':
+            self.salles_actives.pop(e['k'], None)
+        elif evenement in ('tarif+', 'tarif~'):
+            self._tarif(e, True)
+        elif evenement == 'tarif-':
+            self.tarifs_actifs.pop(e['k'], None)
+        elif evenement in ('seance+', 'seance~'):
+            self._seance(e, True)
+        elif evenement == 'seance-':
+            self.seances_actives.pop(e['id'], None)
+        elif evenement == 'resa+':
+            self._reservation(e)
+        elif evenement == 'resa-':
+            self.reservations.pop(e['id'], None)
+        elif evenement == 'resa0':
+            self.reservations.clear()
+        elif evenement == 'ids':
+            bornes = self._stockage._bornes_identifiants
+            bornes[e['p']] = max(bornes.get(e['p'], 0), e['b'])
+
+    def _enregistrer(self, registre: Registre, objets: dict, actifs: dict, cle: int, objet, actif: bool):
+        registre.enregistrer(objet, cle)
+        objets[cle] = objet
+        if actif:
+            actifs[cle] = objet
+        self._stockage._prochaine_cle = max(self._stockage._prochaine_cle, cle + 1)
+
+    def _film(self, d: dict, actif: bool):
+        film = self.films.get(d['k'])
+        if film is None:
+            film = Film(d['titre'], d['duree'], StyleFilm(d['style']), d['note'], d['poster'], d['resume'])
+            self._enregistrer(self._stockage._films, self.films, self.films_actifs, d['k'], film, actif)
+        else:
+            film.titre, film.duree, film.style = d['titre'], d['duree'], StyleFilm(d['style'])
+            film.note, film.poster_path, film.resume = d['note'], d['poster'], d['resume']
+
+    def _salle(self, d: dict, actif: bool):
+        salle = self.salles.get(d['k'])
+        if salle is None:
+            salle = Salle(d['numero'], d['nom'], d['capacite'], TypeSalle(d['type']))
+            self._enregistrer(self._stockage._salles, self.salles, self.salles_actives, d['k'], salle, actif)
+        else:
+            salle.numero, salle.nom = d['numero'], d['nom']
+            salle.capacite, salle.type_salle = d['capacite'], TypeSalle(d['type'])
+
+    def _tarif(self, d: dict, actif: bool):
+        tarif = self.tarifs.get(d['k'])
+        if tarif is None:
+            tarif = Tarif(d['label'], d['coeff'])
+            self._enregistrer(self._stockage._tarifs, self.tarifs, self.tarifs_actifs, d['k'], tarif, actif)
+        else:
+            tarif.label, tarif.coeff = d['label'], d['coeff']
+
+    def _seance(self, d: dict, actif: bool):
+        film, salle = self.films[d['film']], self.salles[d['salle']]
+        horaire = datetime.fromisoformat(d['horaire'])
+        seance = self.seances.get(d['id'])
+        if seance is None:
+            seance = Seance(d['id'], film, salle, horaire)
+            self.seances[seance.id] = seance
+            self._stockage._ids_seances.add(seance.id)
+        else:
+            seance.film, seance.salle, seance.horaire = film, salle, horaire
+        if actif:
+            self.seances_actives[seance.id] = seance
+
+    def _reservation(self, d: dict):
+        self.reservations[d['id']] = Reservation(
+            self.seances[d['seance']], d['client'], d['nb'], self.tarifs[d['tarif']],
+            numeros_places=d['places'], id=d['id'], horodatage=datetime.fromisoformat(d['date']).timestamp(),
+            prix_unitaire=d.get('prix'))
+
+    def transferer(self, service):
+        """Copie l'état reconstruit dans les listes du service."""
+        service.films.extend(self.films_actifs.values())
+        service.salles.extend(self.salles_actives.values())
+        service.tarifs.extend(self.tarifs_actifs.values())
+        service.seances.extend(self.seances_actives.values())
+        service.reservations.extend(self.reservations.values())
+
+
+def _synchroniser_dossier(dossier: str):
+    """Rend durable le renommage d'un fichier (sans effet sous Windows)."""
+    if os.name != 'posix':
+        return
+    descripteur = os.open(dossier, os.O_RDONLY)
+    try:
+        os.fsync(descripteur)
+    finally:
+        os.close(descripteur)
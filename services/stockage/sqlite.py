@@ -0,0 +1,330 @@
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict
+
+from models.film import Film
+from models.salle import Salle
+from models.seance import Seance
+from models.reservation import Reservation, Tarif
+from models.enums import StyleFilm, TypeSalle
+from .base import Registre, Stockage
+
+# Les lignes ne sont jamais supprimées pour les films, salles, tarifs et
+# séances : une réservation peut encore référencer une séance retirée du
+# programme (le service la conserve en mémoire), elle doit donc pouvoir être
+# rechargée. La colonne `actif` indique si l'objet fait toujours partie des
+# listes du service.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS films (
+    id INTEGER PRIMARY KEY,
+    titre TEXT NOT NULL,
+    duree INTEGER NOT NULL,
+    style TEXT NOT NULL,
+    note REAL NOT NULL,
+    poster_path TEXT NOT NULL,
+    resume TEXT NOT NULL,
+    actif INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS salles (
+    id INTEGER PRIMARY KEY,
+    numero INTEGER NOT NULL,
+    nom TEXT NOT NULL,
+    capacite INTEGER NOT NULL,
+    type_salle TEXT NOT NULL,
+    actif INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS tarifs (
+    id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL,
+    coeff REAL NOT NULL,
+    actif INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS seances (
+    id TEXT PRIMARY KEY,
+    film_id INTEGER NOT NULL REFERENCES films(id),
+    salle_id INTEGER NOT NULL REFERENCES salles(id),
+    horaire TEXT NOT NULL,
+    actif INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS reservations (
+    id TEXT PRIMARY KEY,
+    seance_id TEXT NOT NULL REFERENCES seances(id),
+    client_nom TEXT NOT NULL,
+    nb_places INTEGER NOT NULL,
+    tarif_id INTEGER NOT NULL REFERENCES tarifs(id),
+    date_creation TEXT NOT NULL,
+    prix_unitaire REAL
+);
+CREATE TABLE IF NOT EXISTS compteurs (
+    prefixe TEXT PRIMARY KEY,
+    borne INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS places (
+    reservation_id TEXT NOT NULL REFERENCES reservations(id) ON DELETE CASCADE,
+    seance_id TEXT NOT NULL,
+    numero INTEGER NOT NULL,
+    PRIMARY KEY (seance_id, numero)
+);
+CREATE INDEX IF NOT EXISTS idx_seances_film ON seances(film_id);
+CREATE INDEX IF NOT EXISTS idx_seances_salle_horaire ON seances(salle_id, horaire);
+CREATE INDEX IF NOT EXISTS idx_reservations_seance ON reservations(seance_id);
+CREATE INDEX IF NOT EXISTS idx_places_reservation ON places(reservation_id);
+"""
+
+# Requêtes du chemin de réservation. Le module sqlite3 garde les requêtes
+# compilées dans un cache par connexion (`cached_statements`) : réutiliser
+# exactement le même texte SQL évite de les recompiler à chaque appel.
+SQL_INSERER_RESERVATION = (
+    "INSERT INTO reservations (id, seance_id, client_nom, nb_places, tarif_id, date_creation, prix_unitaire) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_INSERER_PLACE = "INSERT INTO places (reservation_id, seance_id, numero) VALUES (?, ?, ?)"
+SQL_SUPPRIMER_RESERVATION = "DELETE FROM reservations WHERE id = ?"
+
+SQL_INSERER_FILM = (
+    "INSERT INTO films (titre, duree, style, note, poster_path, resume) VALUES (?, ?, ?, ?, ?, ?)"
+)
+SQL_MODIFIER_FILM = (
+    "UPDATE films SET titre = ?, duree = ?, style = ?, note = ?, poster_path = ?, resume = ? WHERE id = ?"
+)
+SQL_INSERER_SALLE = "INSERT INTO salles (numero, nom, capacite, type_salle) VALUES (?, ?, ?, ?)"
+SQL_MODIFIER_SALLE = "UPDATE salles SET numero = ?, nom = ?, capacite = ?, type_salle = ? WHERE id = ?"
+SQL_INSERER_TARIF = "INSERT INTO tarifs (label, coeff) VALUES (?, ?)"
+SQL_MODIFIER_TARIF = "UPDATE tarifs SET label = ?, coeff = ? WHERE id = ?"
+SQL_INSERER_SEANCE = "INSERT INTO seances (id, film_id, salle_id, horaire) VALUES (?, ?, ?, ?)"
+SQL_MODIFIER_SEANCE = "UPDATE seances SET film_id = ?, salle_id = ?, horaire = ?, actif = 1 WHERE id = ?"
+
+
+class StockageSQLite(Stockage):
+    """
+    Backend de persistance sur une base SQLite.
+
+    La base est ouverte en mode WAL avec `synchronous=NORMAL` : une
+    réservation ne coûte qu'une écriture séquentielle dans le journal, et les
+    lecteurs (un autre guichet, un export) ne bloquent pas l'écrivain.
+    Chaque notification du service est écrite dans sa propre transaction ;
+    les sièges d'une réservation sont insérés en un seul `executemany`.
+
+    Args:
+        chemin (str): Le fichier de la base, ou ":memory:".
+    """
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+        self._conn = sqlite3.connect(chemin, check_same_thread=False)
+        self._verrou = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._migrer()
+        self._films: Registre[Film] = Registre()
+        self._salles: Registre[Salle] = Registre()
+        self._tarifs: Registre[Tarif] = Registre()
+
+    def _migrer(self):
+        """Met à niveau une base créée par une version antérieure du schéma."""
+        colonnes = {ligne[1] for ligne in self._conn.execute("PRAGMA table_info(reservations)")}
+        if 'prix_unitaire' not in colonnes:
+            # Les anciennes réservations (NULL) sont recalculées au chargement.
+            with self._conn:
+                self._conn.execute("ALTER TABLE reservations ADD COLUMN prix_unitaire REAL")
+
+    def _ecrire(self, sql: str, parametres=()) -> sqlite3.Cursor:
+        with self._verrou, self._conn:
+            return self._conn.execute(sql, parametres)
+
+    # --- Chargement ---
+
+    def charger(self, service) -> bool:
+        conn = self._conn
+        if conn.execute("SELECT 1 FROM films LIMIT 1").fetchone() is None:
+            return False
+
+        films: Dict[int, Film] = {}
+        for cle, titre, duree, style, note, poster, resume, actif in conn.execute(
+                "SELECT id, titre, duree, style, note, poster_path, resume, actif FROM films ORDER BY id"):
+            film = Film(titre, duree, StyleFilm(style), note, poster, resume)
+            films[cle] = film
+            self._films.enregistrer(film, cle)
+            if actif:
+                service.films.append(film)
+
+        salles: Dict[int, Salle] = {}
+        for cle, numero, nom, capacite, type_salle, actif in conn.execute(
+                "SELECT id, numero, nom, capacite, type_salle, actif FROM salles ORDER BY id"):
+            salle = Salle(numero, nom, capacite, TypeSalle(type_salle))
+            salles[cle] = salle
+            self._salles.enregistrer(salle, cle)
+            if actif:
+                service.salles.append(salle)
+
+        tarifs: Dict[int, Tarif] = {}
+        for cle, label, coeff, actif in conn.execute(
+                "SELECT id, label, coeff, actif FROM tarifs ORDER BY id"):
+            tarif = Tarif(label, coeff)
+            tarifs[cle] = tarif
+            self._tarifs.enregistrer(tarif, cle)
+            if actif:
+                service.tarifs.append(tarif)
+
+        seances: Dict[str, Seance] = {}
+        for seance_id, film_id, salle_id, horaire, actif in conn.execute(
+                "SELECT id, film_id, salle_id, horaire, actif FROM seances ORDER BY rowid"):
+            seance = Seance(seance_id, films[film_id], salles[salle_id], datetime.fromisoformat(horaire))
+            seances[seance_id] = seance
+            if actif:
+                service.seances.append(seance)
+
+        sieges: Dict[str, list] = {}
+        for reservation_id, numero in conn.execute(
+                "SELECT reservation_id, numero FROM places ORDER BY reservation_id, numero"):
+            sieges.setdefault(reservation_id, []).append(numero)
+
+        for resa_id, seance_id, client, nb_places, tarif_id, date_creation, prix in conn.execute(
+                "SELECT id, seance_id, client_nom, nb_places, tarif_id, date_creation, prix_unitaire "
+                "FROM reservations ORDER BY rowid"):
+            service.reservations.append(Reservation(
+                seances[seance_id], client, nb_places, tarifs[tarif_id],
+                numeros_places=sieges.get(resa_id, []), id=resa_id,
+                horodatage=datetime.fromisoformat(date_creation).timestamp(), prix_unitaire=prix))
+        return True
+
+    def identifiants_seances(self):
+        return [ligne[0] for ligne in self._conn.execute("SELECT id FROM seances")]
+
+    def borne_identifiants(self, prefixe):
+        ligne = self._conn.execute("SELECT borne FROM compteurs WHERE prefixe = ?", (prefixe,)).fetchone()
+        return ligne[0] if ligne is not None else 0
+
+    def identifiants_reserves(self, prefixe, borne):
+        self._ecrire("INSERT INTO compteurs (prefixe, borne) VALUES (?, ?) "
+                     "ON CONFLICT(prefixe) DO UPDATE SET borne = excluded.borne", (prefixe, borne))
+
+    def initialiser(self, service):
+        with self._verrou, self._conn:
+            for film in service.films:
+                self._inserer_film(film)
+            for salle in service.salles:
+                self._inserer_salle(salle)
+            for tarif in service.tarifs:
+                self._inserer_tarif(tarif)
+            for seance in service.seances:
+                self._inserer_seance(seance)
+            for reservation in service.reservations:
+                self._inserer_reservation(reservation)
+
+    # --- Écritures (appelées sous le verrou, dans une transaction) ---
+
+    def _inserer_film(self, film: Film):
+        cur = self._conn.execute(SQL_INSERER_FILM, (
+            film.titre, film.duree, film.style.value, film.note, film.poster_path, film.resume))
+        self._films.enregistrer(film, cur.lastrowid)
+
+    def _inserer_salle(self, salle: Salle):
+        cur = self._conn.execute(SQL_INSERER_SALLE, (
+            salle.numero, salle.nom, salle.capacite, salle.type_salle.value))
+        self._salles.enregistrer(salle, cur.lastrowid)
+
+    def _inserer_tarif(self, tarif: Tarif):
+        cur = self._conn.execute(SQL_INSERER_TARIF, (tarif.label, tarif.coeff))
+        self._tarifs.enregistrer(tarif, cur.lastrowid)
+
+    def _inserer_seance(self, seance: Seance):
+        self._conn.execute(SQL_INSERER_SEANCE, (
+            seance.id, self._films.cle(seance.film), self._salles.cle(seance.salle),
+            seance.horaire.isoformat()))
+
+    def _inserer_reservation(self, reservation: Reservation):
+        seance_id = reservation.seance.id
+        self._conn.execute(SQL_INSERER_RESERVATION, (
+            reservation.id, seance_id, reservation.client_nom, reservation.nb_places,
+            self._tarifs.cle(reservation.tarif), reservation.date_creation.isoformat(),
+            reservation.prix_unitaire))
+        if reservation.numeros_places:
+            self._conn.executemany(SQL_INSERER_PLACE, [
+                (reservation.id, seance_id, numero) for numero in reservation.numeros_places])
+
+    def _desactiver(self, table: str, cle):
+        self._ecrire(f"UPDATE {table} SET actif = 0 WHERE id = ?", (cle,))
+
+    # --- Notifications du service ---
+
+    def film_ajoute(self, film):
+        with self._verrou, self._conn:
+            self._inserer_film(film)
+
+    def film_modifie(self, film):
+        self._ecrire(SQL_MODIFIER_FILM, (
+            film.titre, film.duree, film.style.value, film.note, film.poster_path, film.resume,
+            self._films.cle(film)))
+
+    def film_supprime(self, film):
+        self._desactiver("films", self._films.cle(film))
+
+    def salle_ajoutee(self, salle):
+        with self._verrou, self._conn:
+            self._inserer_salle(salle)
+
+    def salle_modifiee(self, salle):
+        self._ecrire(SQL_MODIFIER_SALLE, (
+            salle.numero, salle.nom, salle.capacite, salle.type_salle.value, self._salles.cle(salle)))
+
+    def salle_supprimee(self, salle):
+        self._desactiver("salles", self._salles.cle(salle))
+
+    def tarif_ajoute(self, tarif):
+        with self._verrou, self._conn:
+            self._inserer_tarif(tarif)
+
+    def tarif_modifie(self, tarif):
+        self._ecrire(SQL_MODIFIER_TARIF, (tarif.label, tarif.coeff, self._tarifs.cle(tarif)))
+
+    def tarif_supprime(self, tarif):
+        self._desactiver("tarifs", self._tarifs.cle(tarif))
+
+    def seance_ajoutee(self, seance):
+        with self._verrou, self._conn:
+            self._inserer_seance(seance)
+
+    def seances_ajoutees(self, seances):
+        # Une seule transaction pour tout le programme généré.
+        with self._verrou, self._conn:
+            self._conn.executemany(SQL_INSERER_SEANCE, [
+                (s.id, self._films.cle(s.film), self._salles.cle(s.salle), s.horaire.isoformat())
+                for s in seances])
+
+    def seance_modifiee(self, seance):
+        self._ecrire(SQL_MODIFIER_SEANCE, (
+            self._films.cle(seance.film), self._salles.cle(seance.salle),
+            seance.horaire.isoformat(), seance.id))
+
+    def seance_supprimee(self, seance):
+        self._desactiver("seances", seance.id)
+
+    def reservation_creee(self, reservation):
+        with self._verrou, self._conn:
+            self._inserer_reservation(reservation)
+
+    def reservations_creees(self, reservations):
+        # Une seule transaction pour tout le lot.
+        with self._verrou, self._conn:
+            self._conn.executemany(SQL_INSERER_RESERVATION, [
+                (r.id, r.seance.id, r.client_nom, r.nb_places, self._tarifs.cle(r.tarif),
+                 r.date_creation.isoformat(), r.prix_unitaire) for r in reservations])
+            self._conn.executemany(SQL_INSERER_PLACE, [
+                (r.id, r.seance.id, numero) for r in reservations for numero in r.numeros_places])
+
+    def reservation_annulee(self, reservation):
+        # Les sièges sont supprimés en cascade.
+        self._ecrire(SQL_SUPPRIMER_RESERVATION, (reservation.id,))
+
+    def reservations_videes(self):
+        with self._verrou, self._conn:
+            self._conn.execute("DELETE FROM places")
+            self._conn.execute("DELETE FROM reservations")
+
+    def fermer(self):
+        with self._verrou:
+            self._conn.close()
@@ -0,0 +1,42 @@
+from typing import Dict, Iterable, Tuple
+
+from models.enums import TypeSalle
+from models.reservation import Tarif, calculer_prix_unitaire
+
+
+class GrillePrix:
+    """
+    Prix d'une place pré-calculé pour chaque couple (type de salle, tarif).
+
+    La grille est reconstruite par le service quand la liste des tarifs ou
+    le coefficient d'un tarif change ; une réservation ne fait donc qu'une
+    recherche dans un dictionnaire pour figer son prix unitaire. Les tarifs
+    sont indexés par identité (`id(tarif)`), la grille gardant une
+    référence à chacun d'eux.
+
+    Args:
+        tarifs (Iterable[Tarif]): Les tarifs de la grille.
+    """
+
+    def __init__(self, tarifs: Iterable[Tarif] = ()):
+        self._tarifs = []
+        self._prix: Dict[Tuple[TypeSalle, int], float] = {}
+        self.reconstruire(tarifs)
+
+    def reconstruire(self, tarifs: Iterable[Tarif]):
+        """Recalcule la grille pour une nouvelle liste de tarifs."""
+        self._tarifs = list(tarifs)
+        self._prix = {(type_salle, id(tarif)): calculer_prix_unitaire(type_salle, tarif)
+                      for type_salle in TypeSalle for tarif in self._tarifs}
+
+    def prix(self, type_salle: TypeSalle, tarif: Tarif) -> float:
+        """
+        Le prix d'une place pour un type de salle et un tarif.
+
+        Un tarif absent de la grille (retiré entre-temps) est calculé
+        directement.
+        """
+        prix = self._prix.get((type_salle, id(tarif)))
+        if prix is None:
+            return calculer_prix_unitaire(type_salle, tarif)
+        return prix
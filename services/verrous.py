@@ -0,0 +1,78 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator
+
+from models.seance import Seance
+
+
+class VerrousSeances:
+    """
+    Verrous du moteur de réservation, un par séance.
+
+    Le verrou d'une séance est créé à sa première utilisation et rangé par
+    identifiant de séance : deux réservations sur des séances différentes ne
+    se bloquent jamais, et la vérification et la prise des sièges d'une
+    séance sont toujours exclusives.
+
+    Le verrou `liste` protège les structures partagées par toutes les
+    séances (liste et index des réservations, statistiques, et les verrous
+    de séance eux-mêmes) : il n'est tenu que le temps de quelques
+    affectations.
+
+    Les opérations d'administration (programme, catalogue, tarifs) sont
+    rares : elles prennent `tous`, c'est-à-dire tous les verrous de séance
+    puis le verrou de liste. Les verrous sont réentrants pour qu'une
+    opération d'administration puisse en appeler une autre.
+
+    Ordre d'acquisition, pour éviter tout interblocage : verrous de séance
+    (par identifiant croissant), puis verrou de liste.
+    """
+
+    def __init__(self):
+        self._verrous: Dict[str, threading.RLock] = {}
+        self.liste = threading.RLock()
+
+    def pour(self, seance: Seance) -> threading.RLock:
+        """Retourne le verrou qui protège l'occupation d'une séance."""
+        verrou = self._verrous.get(seance.id)
+        if verrou is None:
+            # Créé sous le verrou de liste : `tous` ne peut pas en manquer un.
+            with self.liste:
+                verrou = self._verrous.setdefault(seance.id, threading.RLock())
+        return verrou
+
+    @contextmanager
+    def pour_plusieurs(self, seances: Iterable[Seance]) -> Iterator[None]:
+        """Prend les verrous de plusieurs séances, dans l'ordre des identifiants."""
+        par_id = {s.id: s for s in seances}
+        verrous = [self.pour(par_id[i]) for i in sorted(par_id)]
+        for verrou in verrous:
+            verrou.acquire()
+        try:
+            yield
+        finally:
+            for verrou in reversed(verrous):
+                verrou.release()
+
+    @contextmanager
+    def tous(self) -> Iterator[None]:
+        """Accès exclusif au service : tous les verrous de séance puis celui de liste."""
+        while True:
+            with self.liste:
+                verrous = [self._verrous[i] for i in sorted(self._verrous)]
+            for verrou in verrous:
+                verrou.acquire()
+            self.liste.acquire()
+            if len(self._verrous) == len(verrous):
+                break  # Aucun verrou ne peut plus être créé : le verrou de liste est tenu
+            # Une séance a reçu son verrou entre-temps : on recommence, pour
+            # garder l'ordre des identifiants.
+            self.liste.release()
+            for verrou in reversed(verrous):
+                verrou.release()
+        try:
+            yield
+        finally:
+            self.liste.release()
+            for verrou in reversed(verrous):
+                verrou.release()